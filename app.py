@@ -2,12 +2,13 @@ import streamlit as st
 from pathlib import Path
 
 from state import init_state, reset_state
-from screens.home import screen_home
-from screens.consent import screen_consent
-from screens.setup import screen_setup
-from screens.questionnaire import screen_questionnaire
-from screens.results import screen_results
-from screens.learnmore import screen_learn_more
+from hotspot_rules import start_rules_watcher
+from tasks import start_catalog_watcher
+from screens import load_screen
+from utils import session_store
+from utils.dev_mode import is_dev_mode
+from utils.metrics import start_metrics_exporter, track_stage
+from utils.profiling import profile_rerun, profiling_panel
 
 # ----- PAGE CONFIG -----
 st.set_page_config(
@@ -36,22 +37,21 @@ load_css()
 
 # ----- INIT -----
 init_state()
+session_store.restore()
+start_catalog_watcher()
+start_rules_watcher()
+start_metrics_exporter()
 
 # ----- ROUTER -----
 stage = st.session_state.stage
 
-if stage == "home":
-    screen_home()
-elif stage == "consent":
-    screen_consent()
-elif stage == "setup":
-    screen_setup()
-elif stage == "questionnaire":
-    screen_questionnaire()
-elif stage in ["results", "results_main"]:
-    screen_results()
-elif stage == "learn_more":
-    screen_learn_more()
-else:
-    st.session_state.stage = "home"
-    screen_home()
+screen = load_screen(stage)
+if screen is None:
+    stage = st.session_state.stage = "home"
+    screen = load_screen(stage)
+track_stage(stage)
+profile_rerun(stage, screen, measure_state=is_dev_mode())
+session_store.checkpoint()
+
+if is_dev_mode():
+    profiling_panel()
@@ -0,0 +1,58 @@
+"""
+benchmarks/corpus.py
+
+Generate (or reuse) the synthetic household corpus and report how it came
+out: generation speed, size on disk, and the spread of profiles, scenarios and
+answer states. The corpus is cached under .cache/synthetic, keyed by its
+settings and the catalogue version, so suite.py and load_test.py pick it up.
+
+Usage:
+    python benchmarks/corpus.py [--households 1000000] [--seed 1] [--untouched 0.15] [--force]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from response_matrix import ANSWERED, NOT_APPLICABLE  # noqa: E402
+from utils import synthetic  # noqa: E402
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    ap.add_argument("--households", type=int, default=1_000_000)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--untouched", type=float, default=synthetic.UNTOUCHED)
+    ap.add_argument("--not-applicable", type=float, default=synthetic.NOT_APPLICABLE_RATE)
+    ap.add_argument("--force", action="store_true", help="regenerate even if a matching corpus exists")
+    args = ap.parse_args()
+
+    params = {"untouched": args.untouched, "not_applicable": args.not_applicable}
+    corpus = synthetic.ensure_corpus(args.households, args.seed, force=args.force, **params)
+    elapsed = corpus.meta["seconds"]
+
+    size = sum(f.stat().st_size for f in corpus.path.iterdir())
+    print(f"{corpus.path}")
+    print(f"{len(corpus):,} households x {len(corpus.task_ids)} tasks   {size / 2**20:.0f} MB   "
+          f"generated in {elapsed:.2f} s ({len(corpus) / elapsed:,.0f} households/s)")
+
+    people = corpus.households
+    profiles = np.bincount(people["profile"], minlength=16)
+    print(f"profiles: all 16 present, {profiles.min():,}..{profiles.max():,} households each")
+    scenarios = np.bincount(people["scenario"], minlength=len(synthetic.SCENARIOS)) / len(corpus)
+    print("scenarios: " + "   ".join(f"{name} {share:.1%}" for name, share in zip(synthetic.SCENARIOS, scenarios)))
+
+    sample = np.asarray(corpus.answers[: synthetic.CHUNK, :, 3])
+    shown = synthetic.shown_tasks()[people["profile"][: synthetic.CHUNK]]
+    answered = (sample & ANSWERED) > 0
+    print(f"shown tasks: {np.mean(answered[shown]):.1%} answered, {np.mean(~answered[shown]):.1%} left at the defaults, "
+          f"{np.mean((sample & NOT_APPLICABLE)[shown] > 0):.1%} N/A   (first {len(sample):,} households)")
+
+
+if __name__ == "__main__":
+    main()
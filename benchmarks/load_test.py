@@ -0,0 +1,228 @@
+"""
+benchmarks/load_test.py
+
+How many simultaneous couples can one server process carry? Drives app.py
+headlessly through the whole flow for N concurrent sessions, one thread and
+one AppTest per session:
+
+    home → consent → setup → questionnaire (slider drags) → prep →
+    results pages 1-5 (with a note) → export
+
+Each session plays one household from the shared synthetic corpus
+(utils/synthetic.py, generated on first use and reused after that): its setup
+(children, employment, pets, vehicle) and its answers, in the corpus's mix of
+balanced / imbalanced / mixed / random households. Every rerun is timed and reported per stage
+as p50 / p95 / p99, along with overall throughput and RSS growth of the
+process.
+
+AppTest installs a process-global mock Runtime for the duration of each run,
+so two runs cannot overlap in one process. Runs are therefore serialised
+through a lock, and a rerun's latency is measured from the moment the session
+asks for it: queueing behind other sessions is included, as it would be on a
+saturated single-core server. The pure script time is reported as "service".
+
+Usage:
+    python benchmarks/load_test.py [--sessions 8] [--tasks 6] [--json load.json]
+"""
+
+import argparse
+import json
+import random
+import resource
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from response_matrix import ANSWERED  # noqa: E402
+from screens import results  # noqa: E402
+from utils.synthetic import SCENARIOS, Corpus, ensure_corpus  # noqa: E402
+
+# See the module docstring: AppTest runs can't overlap within a process
+_RUN_LOCK = threading.Lock()
+
+CORPUS_HOUSEHOLDS = 4096
+SETUP_CHECKBOXES = (
+    ("Partner A employed?", "is_employed_me"),
+    ("Partner B employed?", "is_employed_partner"),
+    ("Do you have pets?", "has_pets"),
+    ("Do you have a car/vehicle?", "has_vehicle"),
+)
+
+STAGES = ("home", "consent", "setup", "questionnaire", "prep", "results", "export", "export_csv")
+
+
+def rss_mb() -> float:
+    """Current resident set size, from /proc where available, else the peak."""
+    try:
+        with open("/proc/self/statm") as fh:
+            pages = int(fh.read().split()[1])
+        return pages * resource.getpagesize() / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Session:
+    """One simulated couple. Records (stage, ms) for every rerun it triggers."""
+
+    def __init__(self, app: Path, corpus: Corpus, household: int, tasks: int, seed: int):
+        self.at = AppTest.from_file(str(app), default_timeout=120)
+        self.setup = corpus.setup(household)
+        self.answers = {tid: corpus.answers[household, i] for i, tid in enumerate(corpus.task_ids)}
+        self.tasks = max(tasks, 5)  # "See results" needs five answered tasks
+        self.rng = random.Random(seed)
+        self.timings: List[tuple] = []
+        self.service: List[float] = []
+        self.error = None
+
+    def _run(self, stage: str) -> None:
+        t0 = time.perf_counter()
+        with _RUN_LOCK:
+            t1 = time.perf_counter()
+            self.at.run()
+        t2 = time.perf_counter()
+        self.timings.append((stage, (t2 - t0) * 1000))
+        self.service.append((t2 - t1) * 1000)
+        if self.at.exception:
+            raise RuntimeError(f"{stage}: {self.at.exception[0].value}")
+
+    def _click(self, label: str, stage: str) -> None:
+        button = next(b for b in self.at.button if label in b.label and not b.disabled)
+        button.click()
+        self._run(stage)
+
+    def flow(self) -> None:
+        at = self.at
+        self._run("home")
+        self._click("Begin Study", "consent")
+        for cb in at.checkbox:
+            cb.check()
+        self._run("consent")
+        self._click("I agree", "setup")
+        for _ in range(self.setup["children"]):
+            self._click("➕", "setup")
+        for label, key in SETUP_CHECKBOXES:
+            next(cb for cb in at.checkbox if cb.label == label).set_value(self.setup[key])
+        self._click("Start questionnaire", "questionnaire")
+
+        # Drag the sliders of tasks the household answered; tasks it left untouched only if that's too few
+        task_ids = [s.key[: -len("_resp")] for s in at.slider if s.key and s.key.endswith("_resp")]
+        self.rng.shuffle(task_ids)
+        task_ids.sort(key=lambda tid: not self.answers[tid][3] & ANSWERED)
+        for task_id in task_ids[: self.tasks]:
+            resp, burden, fair = (int(v) for v in self.answers[task_id][:3])
+            if not self.answers[task_id][3] & ANSWERED:     # at the defaults, so move the slider somewhere
+                resp = self.rng.randint(0, 100)
+            for suffix, value in (("_resp", resp), ("_burden", burden), ("_fair", fair)):
+                at.slider(key=task_id + suffix).set_value(value)
+                self._run("questionnaire")
+
+        self._click("See results", "prep")
+        self._click("Show results", "results")
+        for page in range(2, 6):
+            if page == 3:
+                at.text_area[0].input("we talked about this")
+                self._run("results")
+            self._click("Next →", "results")
+
+        # The download click reruns the page; the CSV itself is built by the
+        # server on the download request, outside any script run.
+        at.download_button(key="top_export").click()
+        self._run("export")
+        t0 = time.perf_counter()
+        results._export_csv(
+            at.session_state["results_snapshot"],
+            dict(at.session_state["notes_by_section"]), dict(at.session_state["results_notes"]),
+        )
+        self.timings.append(("export_csv", (time.perf_counter() - t0) * 1000))
+
+    def __call__(self) -> None:
+        try:
+            self.flow()
+        except Exception as exc:  # report, don't kill the other sessions
+            self.error = repr(exc)
+
+
+def percentile(sorted_xs: List[float], q: float) -> float:
+    return sorted_xs[min(len(sorted_xs) - 1, int(round(q * (len(sorted_xs) - 1))))]
+
+
+def run(app: Path, sessions: int, tasks: int, seed: int) -> Dict:
+    corpus = ensure_corpus(max(CORPUS_HOUSEHOLDS, sessions), seed)
+    rss_before = rss_mb()
+    pool = [Session(app, corpus, i, tasks, seed + i) for i in range(sessions)]
+    threads = [threading.Thread(target=s, name=f"session-{i}") for i, s in enumerate(pool)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - t0
+
+    by_stage: Dict[str, List[float]] = defaultdict(list)
+    for s in pool:
+        for stage, ms in s.timings:
+            by_stage[stage].append(ms)
+    service = sorted(ms for s in pool for ms in s.service)
+    completed = sum(s.error is None for s in pool)
+    reruns = sum(len(s.timings) for s in pool)
+    return {
+        "sessions": sessions,
+        "completed": completed,
+        "errors": [s.error for s in pool if s.error],
+        "wall_s": wall,
+        "sessions_per_min": completed / wall * 60,
+        "reruns_per_s": reruns / wall,
+        "service_ms": {"p50": percentile(service, 0.50), "p95": percentile(service, 0.95)} if service else {},
+        "rss_mb": {"before": rss_before, "after": rss_mb()},
+        "stages": {
+            stage: {
+                "n": len(xs),
+                "p50_ms": percentile(xs, 0.50),
+                "p95_ms": percentile(xs, 0.95),
+                "p99_ms": percentile(xs, 0.99),
+            }
+            for stage in STAGES
+            if (xs := sorted(by_stage.get(stage, [])))
+        },
+    }
+
+
+def report(out: Dict) -> None:
+    print(f"{out['completed']}/{out['sessions']} sessions in {out['wall_s']:.1f} s   "
+          f"{out['sessions_per_min']:.1f} sessions/min   {out['reruns_per_s']:.1f} reruns/s")
+    if out["service_ms"]:
+        print(f"script time per rerun (no queueing): p50 {out['service_ms']['p50']:.1f} ms   p95 {out['service_ms']['p95']:.1f} ms")
+    rss = out["rss_mb"]
+    print(f"RSS {rss['before']:.0f} MB → {rss['after']:.0f} MB (+{rss['after'] - rss['before']:.0f} MB)")
+    for stage, s in out["stages"].items():
+        print(f"{stage:<14} n {s['n']:5d}   p50 {s['p50_ms']:8.1f} ms   p95 {s['p95_ms']:8.1f} ms   p99 {s['p99_ms']:8.1f} ms")
+    for err in out["errors"]:
+        print("error:", err)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    ap.add_argument("--sessions", type=int, default=8, help="concurrent simulated couples")
+    ap.add_argument("--tasks", type=int, default=6, help="tasks answered per session (3 slider drags each)")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--app", type=Path, default=ROOT / "app.py")
+    ap.add_argument("--json", type=Path, help="also write the report as JSON")
+    args = ap.parse_args()
+
+    out = run(args.app.resolve(), args.sessions, args.tasks, args.seed)
+    report(out)
+    if args.json:
+        args.json.write_text(json.dumps(out, indent=2), encoding="utf-8")
+    sys.exit(1 if out["errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
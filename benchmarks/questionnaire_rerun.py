@@ -0,0 +1,96 @@
+"""
+benchmarks/questionnaire_rerun.py
+
+Cost of one questionnaire interaction (a slider drag), measured headlessly
+with Streamlit's AppTest on the largest household profile (all tasks shown).
+
+Two numbers are reported:
+  - full page:  what a whole-script rerun costs (elements, widgets, ms)
+  - one task:   what re-running a single task block costs, which is all a
+                slider drag executes when tasks are fragments
+
+Usage:
+    python benchmarks/questionnaire_rerun.py [--reruns 40]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+TASK_SCRIPT = """
+import streamlit as st
+from tasks import TASK_LOOKUP
+import screens.questionnaire as q
+block = getattr(q, "_task_block", q.render_task)
+block(TASK_LOOKUP["cooking"])
+"""
+
+WIDGET_TYPES = {"slider", "checkbox", "text_area", "button", "number_input", "radio", "selectbox"}
+
+
+def _count(node, counts):
+    for child in getattr(node, "children", {}).values():
+        kind = getattr(child, "type", "")
+        counts["elements"] += 1
+        if kind in WIDGET_TYPES:
+            counts["widgets"] += 1
+        _count(child, counts)
+    return counts
+
+
+def _profile_state(at: AppTest):
+    from response_matrix import ResponseMatrix
+    from tasks import TASKS, catalog_version
+    at.session_state["stage"] = "questionnaire"
+    at.session_state["children"] = 2
+    at.session_state["has_pets"] = True
+    at.session_state["has_vehicle"] = True
+    rows = [{"task_id": t.id, "responsibility": 50, "burden": 3, "fairness": 3} for t in TASKS]
+    at.session_state["responses"] = ResponseMatrix.from_dicts(rows, TASKS, catalog_version())
+    # Counts the full page would have recorded, so a lone task block doesn't escalate
+    at.session_state["_q_header_state"] = (len(TASKS), len(TASKS))
+
+
+def _measure(at: AppTest, reruns: int):
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    counts = _count(at.main, {"elements": 0, "widgets": 0})
+    times = []
+    for i in range(reruns):
+        at.slider(key="cooking_resp").set_value(i % 101)
+        t0 = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - t0) * 1000)
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+    return counts, times
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--reruns", type=int, default=40)
+    args = ap.parse_args()
+
+    full = AppTest.from_file(str(ROOT / "app.py"), default_timeout=60)
+    _profile_state(full)
+    one = AppTest.from_string(TASK_SCRIPT, default_timeout=60)
+    _profile_state(one)
+
+    for name, at in (("full page", full), ("one task", one)):
+        counts, times = _measure(at, args.reruns)
+        print(
+            f"{name:<10} elements {counts['elements']:4d}   widgets {counts['widgets']:3d}   "
+            f"p50 {statistics.median(times):7.2f} ms   mean {statistics.mean(times):7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
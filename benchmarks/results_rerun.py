@@ -0,0 +1,97 @@
+"""
+benchmarks/results_rerun.py
+
+Per-rerun latency of the results screen, measured headlessly with Streamlit's
+AppTest. A fixed household is loaded straight into results_main and we time
+page flips and notes keystrokes, which are the reruns couples actually
+trigger while reading their results.
+
+Usage:
+    python benchmarks/results_rerun.py [--reruns 60] [--app path/to/app.py]
+
+Point --app at an older checkout to get a before/after comparison.
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _household(app_root: Path, seed: int = 7):
+    sys.path.insert(0, str(app_root))
+    from tasks import TASKS
+    rng = random.Random(seed)
+    return [
+        {
+            "task_id": t.id,
+            "responsibility": rng.randint(0, 100),
+            "burden": rng.randint(1, 5),
+            "fairness": rng.randint(1, 5),
+            "not_applicable": False,
+        }
+        for t in TASKS
+    ]
+
+
+def _seed_answers(at: AppTest, rows):
+    try:
+        from response_matrix import ResponseMatrix
+        from tasks import TASKS, catalog_version
+    except ImportError:  # checkouts from before ResponseMatrix
+        at.session_state["responses_dict"] = {r["task_id"]: r for r in rows}
+        at.session_state["responses"] = rows
+        return
+    at.session_state["responses"] = ResponseMatrix.from_dicts(rows, TASKS, catalog_version())
+
+
+def _timed_run(at: AppTest) -> float:
+    t0 = time.perf_counter()
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return (time.perf_counter() - t0) * 1000
+
+
+def run(app: Path, reruns: int):
+    responses = _household(app.parent)
+    at = AppTest.from_file(str(app), default_timeout=60)
+    at.session_state["stage"] = "results_main"
+    at.session_state["results_prep_seen"] = True
+    _seed_answers(at, responses)
+    at.session_state["results_page"] = 1
+    _timed_run(at)  # warm-up: imports, first computation
+
+    flips, notes = [], []
+    for i in range(reruns):
+        at.session_state["results_page"] = 1 + i % 5
+        flips.append(_timed_run(at))
+        at.text_area[0].input(f"note {i}")
+        notes.append(_timed_run(at))
+    return flips, notes
+
+
+def _summary(name, xs):
+    xs = sorted(xs)
+    p95 = xs[int(0.95 * (len(xs) - 1))]
+    print(f"{name:<16} mean {statistics.mean(xs):7.2f} ms   p50 {statistics.median(xs):7.2f} ms   p95 {p95:7.2f} ms")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--reruns", type=int, default=60)
+    ap.add_argument("--app", type=Path, default=ROOT / "app.py")
+    args = ap.parse_args()
+    flips, notes = run(args.app.resolve(), args.reruns)
+    _summary("page flip", flips)
+    _summary("notes keystroke", notes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+benchmarks/scoring_models.py
+
+Compare the registered scoring models on the synthetic corpus: how long each
+takes to score the whole cohort, and how its results differ from the standard
+model. Page 2 picks its message from the burden gap (≤15 similar, ≤30 one
+partner more burdened, above that notably higher), so the report shows the
+share of households in each band and how many land in a different band than
+under the standard model.
+
+Usage:
+    python benchmarks/scoring_models.py [--households 100000] [--seed 1] [--json models.json]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from scoring_models import MODELS, STANDARD  # noqa: E402
+from utils.synthetic import ensure_corpus  # noqa: E402
+
+BANDS = ("similar", "more burdened", "notably higher")
+
+
+def band(gap: np.ndarray) -> np.ndarray:
+    """Page 2's message band for each burden gap."""
+    return np.digitize(np.abs(gap), [15.5, 30.5])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    ap.add_argument("--households", type=int, default=100_000)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--json", type=Path, help="also write the report as JSON")
+    args = ap.parse_args()
+
+    arrays = ensure_corpus(args.households, args.seed).arrays()
+    standard = MODELS[STANDARD].score(arrays)
+    reference = band(standard.my_burden - standard.partner_burden)
+    report = {"households": args.households, "models": {}}
+    print(f"{args.households:,} corpus households\n")
+    print(f"{'model':<20} {'ms (min)':>9} {'µs/household':>13} {'mean A':>7} {'mean B':>7} "
+          + " ".join(f"{b:>15}" for b in BANDS) + f" {'band changed':>13}")
+    for name, model in MODELS.items():
+        times = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            s = model.score(arrays)
+            times.append(time.perf_counter() - t0)
+        bands = band(s.my_burden - s.partner_burden)
+        changed = float(np.mean(bands != reference))
+        row = {
+            "ms": min(times) * 1000,
+            "mean_burden": [float(s.my_burden.mean()), float(s.partner_burden.mean())],
+            "bands": (np.bincount(bands, minlength=len(BANDS)) / len(bands)).tolist(),
+            "band_changed": changed,
+        }
+        report["models"][name] = row
+        print(f"{name:<20} {row['ms']:>9.1f} {row['ms'] * 1000 / args.households:>13.2f} "
+              f"{row['mean_burden'][0]:>7.1f} {row['mean_burden'][1]:>7.1f} "
+              + " ".join(f"{x:>15.1%}" for x in row["bands"])
+              + f" {changed:>13.1%}")
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+benchmarks/startup.py
+
+Time to first paint of the home stage in a fresh interpreter, with screens
+imported lazily (what app.py does) versus all screen modules imported up front
+(what it used to do). Each sample is a new process, so nothing is warm.
+
+Reported per mode: median ms to import Streamlit, median ms from there to the
+first finished home rerun, and which heavy modules were loaded by then.
+
+Usage:
+    python benchmarks/startup.py [--runs 7]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+HEAVY = ("screens.results", "plotly.graph_objects", "plotly.express", "pandas")
+
+CHILD = """
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+sys.path.insert(0, {root!r})
+if {eager!r}:
+    import importlib
+    from screens import SCREENS
+    for module, _ in set(SCREENS.values()):
+        importlib.import_module(module)
+at = AppTest.from_file({app!r}, default_timeout=60)
+at.run()
+t2 = time.perf_counter()
+assert not at.exception, at.exception
+print(json.dumps({{
+    "streamlit_ms": (t1 - t0) * 1000,
+    "first_paint_ms": (t2 - t1) * 1000,
+    "heavy": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def sample(eager: bool) -> dict:
+    code = CHILD.format(root=str(ROOT), app=str(ROOT / "app.py"), eager=eager, heavy=HEAVY)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    ap.add_argument("--runs", type=int, default=7)
+    args = ap.parse_args()
+
+    for name, eager in (("lazy", False), ("eager", True)):
+        runs = [sample(eager) for _ in range(args.runs)]
+        print(
+            f"{name:<6} import streamlit {statistics.median(r['streamlit_ms'] for r in runs):7.1f} ms   "
+            f"first paint {statistics.median(r['first_paint_ms'] for r in runs):7.1f} ms   "
+            f"loaded: {', '.join(runs[-1]['heavy']) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
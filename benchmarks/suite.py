@@ -0,0 +1,256 @@
+"""
+benchmarks/suite.py
+
+Micro-benchmarks for the scoring, catalogue and results code paths.
+
+Every case runs on deterministic synthetic data at a realistic size (the real
+27-task catalogue, one household) and at stress sizes (a 1,000-task catalogue,
+100,000 households for the batch scorer). Results are printed as a table and
+can be written as JSON so two commits can be compared.
+
+Usage:
+    python benchmarks/suite.py [--json out.json] [--filter compute] [--quick]
+    python benchmarks/suite.py --compare before.json after.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import tasks  # noqa: E402
+from hotspot_rules import current_rules  # noqa: E402
+from logic import Calculator, hotspot_to_question  # noqa: E402
+from response_matrix import ResponseMatrix  # noqa: E402
+from results_snapshot import build_snapshot  # noqa: E402
+from scoring import BOOTSTRAP_RESAMPLES, PILLARS, ResponseArrays, bootstrap  # noqa: E402
+from scoring_models import MODELS  # noqa: E402
+from screens import results  # noqa: E402
+from utils import synthetic  # noqa: E402
+
+SEED = 20251104
+STRESS_TASKS = 1_000
+STRESS_HOUSEHOLDS = 100_000
+
+
+# ---------- synthetic data ----------
+def synthetic_catalog(n: int, seed: int = SEED) -> dict:
+    """A catalogue document in data/tasks.json format with n tasks."""
+    rng = random.Random(seed)
+    return {
+        "schema_version": tasks.SCHEMA_VERSION,
+        "tasks": [
+            {
+                "id": f"task_{i:05d}",
+                "name": f"Synthetic task {i}",
+                "pillar": PILLARS[i % len(PILLARS)],
+                "requires_children": rng.random() < 0.15,
+                "requires_employment": rng.random() < 0.05,
+                "requires_pets": rng.random() < 0.05,
+                "requires_vehicle": rng.random() < 0.05,
+                "definition": "Synthetic definition text for benchmarking.",
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def synthetic_rows(task_ids, seed: int = SEED) -> List[Dict]:
+    """One household's answers in the legacy row-dict format."""
+    rng = random.Random(seed)
+    return [
+        {
+            "task_id": tid,
+            "responsibility": rng.randint(0, 100),
+            "burden": rng.randint(1, 5),
+            "fairness": rng.randint(1, 5),
+            "not_applicable": rng.random() < 0.05,
+        }
+        for tid in task_ids
+    ]
+
+
+def synthetic_batch(households: int, catalog, version: str, seed: int = SEED) -> ResponseArrays:
+    """(households x tasks) answers for the batch scorer, from the cached synthetic corpus."""
+    return synthetic.ensure_corpus(households, seed, tasks=catalog, version=version).arrays(tasks=catalog)
+
+
+def cohort_hotspots(batch: ResponseArrays):
+    """Flag and rank every household's hotspots in one pass, keeping each one's top 5."""
+    rules = current_rules()
+    codes, priority = rules.evaluate(batch.responsibility, batch.burden, batch.fairness)
+    codes[~batch.applicable] = 0
+    return rules.top_k(codes, priority, 5)
+
+
+# ---------- timing ----------
+def measure(fn: Callable[[], object], repeat: int, min_time: float) -> Dict[str, float]:
+    """Time fn in batches of `number` calls sized to take at least min_time; per-call stats in microseconds."""
+    fn()  # warm-up
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - t0) / number)
+    us = [s * 1e6 for s in samples]
+    return {
+        "calls_per_sample": number,
+        "min_us": min(us),
+        "median_us": statistics.median(us),
+        "mean_us": statistics.mean(us),
+        "stdev_us": statistics.stdev(us) if len(us) > 1 else 0.0,
+    }
+
+
+# ---------- cases ----------
+def cases(quick: bool):
+    """Yield (name, size label, zero-arg callable). Heavy setup happens lazily per size."""
+    households = 10_000 if quick else STRESS_HOUSEHOLDS
+    stress_doc = synthetic_catalog(STRESS_TASKS)
+
+    for size in ("realistic", "stress"):
+        if size == "stress":
+            # Load the 1k-task catalogue through the normal reload path; the swap
+            # itself would log every removed task id, which is just noise here
+            logging.getLogger("tasks").setLevel(logging.ERROR)
+            tmp = Path(tempfile.mkdtemp()) / "tasks.json"
+            tmp.write_text(json.dumps(stress_doc), encoding="utf-8")
+            tasks.reload_catalog(tmp)
+        catalog = list(tasks.TASKS)
+        version = tasks.catalog_version()
+        rows = synthetic_rows([t.id for t in catalog])
+        matrix = ResponseMatrix.from_dicts(rows, catalog, version)
+        arrays = matrix.arrays()
+        response_rows = matrix.rows()
+        computed = Calculator.from_arrays(arrays).compute()
+        hotspots = Calculator.detect_hotspots(response_rows)
+        codes = [h["reason_code"] for h in hotspots] or [0]
+
+        yield "Calculator.compute", size, lambda: Calculator.from_arrays(arrays).compute()
+        yield "Calculator.detect_hotspots", size, lambda: Calculator.detect_hotspots(response_rows)
+        yield "hotspot_to_question", size, lambda: [hotspot_to_question(c) for c in codes]
+        yield "get_profile", size, lambda: tasks.get_profile(2, True, True, True)
+        yield "ResponseMatrix.from_dicts", size, lambda: ResponseMatrix.from_dicts(rows, catalog, version)
+        yield "ResponseMatrix.rows+arrays", size, lambda: (matrix.rows(), matrix.arrays())
+        first_id = catalog[0].id
+        matrix.totals       # built once per session, then kept current by set()
+        yield "ResponseMatrix.set (running totals)", size, lambda: matrix.set(first_id, responsibility=70)
+        yield "ResponseMatrix.summary", size, matrix.summary
+        snap = build_snapshot(matrix, "bench")
+        yield "build_snapshot", size, lambda: build_snapshot(matrix, "bench")
+        yield f"bootstrap intervals ({BOOTSTRAP_RESAMPLES} resamples)", size, lambda: bootstrap(arrays, seed=SEED)
+        yield "results._export_csv", size, lambda: results._export_csv(
+            snap, {"anticipation": "note"}, {"Page 1": "note"}
+        )
+
+        if size == "realistic":
+            a, b = computed["my_share_pct"], computed["partner_share_pct"]
+            pillars = results._ensure_all_pillars(computed["pillar_scores"])
+            values = tuple(tuple(pillars[k]) for k in results.PILLAR_ORDER)
+            yield "figure.comparison_bars (build)", size, lambda: results._build_comparison_bars(a, b, 100, "Partner A", "Partner B")
+            yield "figure.pillar_grouped_bar (build)", size, lambda: results._build_pillar_grouped_bar(values)
+            yield "figure.pillar_grouped_bar (cached)", size, lambda: results.pillar_grouped_bar(pillars)
+            batch = synthetic_batch(households, catalog, version)
+            shown = synthetic.shown_tasks(catalog)
+            people = synthetic.ensure_corpus(households, SEED, tasks=catalog, version=version).households
+            chunk = people[: synthetic.CHUNK]
+            yield f"synthetic.generate ({len(chunk)} households)", size, lambda: synthetic.generate(
+                np.random.default_rng(SEED), shown, chunk["profile"], chunk["scenario"]
+            )
+            yield f"Calculator.score_batch ({households} households)", size, lambda: Calculator.score_batch(batch)
+            for name, model in MODELS.items():
+                yield f"scoring model {name} ({households} households)", size, lambda model=model: model.score(batch)
+            yield f"hotspot rules evaluate+top5 ({households} households)", size, lambda: cohort_hotspots(batch)
+        else:
+            # 100k x 1k answers would be ~600 MB of int16; a tenth keeps it on a laptop
+            n = max(households // 10, 1)
+            batch = synthetic_batch(n, catalog, version)
+            yield f"Calculator.score_batch ({n} households)", size, lambda: Calculator.score_batch(batch)
+            yield f"hotspot rules evaluate+top5 ({n} households)", size, lambda: cohort_hotspots(batch)
+            tasks.reload_catalog()
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(args) -> Dict:
+    out = {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": SEED,
+        },
+        "results": [],
+    }
+    for name, size, fn in cases(args.quick):
+        if args.filter and args.filter.lower() not in name.lower():
+            continue
+        stats = measure(fn, args.repeat, args.min_time)
+        out["results"].append({"name": name, "size": size, **stats})
+        print(f"{name:<48} {size:<9} median {stats['median_us']:12.1f} us   min {stats['min_us']:12.1f} us")
+    return out
+
+
+def compare(before_path: Path, after_path: Path) -> None:
+    before = {(r["name"], r["size"]): r for r in json.loads(before_path.read_text())["results"]}
+    after = json.loads(after_path.read_text())["results"]
+    print(f"{'case':<48} {'size':<9} {'before us':>12} {'after us':>12} {'ratio':>7}")
+    for r in after:
+        b = before.get((r["name"], r["size"]))
+        if b is None:
+            continue
+        ratio = r["median_us"] / b["median_us"] if b["median_us"] else float("nan")
+        print(f"{r['name']:<48} {r['size']:<9} {b['median_us']:12.1f} {r['median_us']:12.1f} {ratio:7.2f}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--json", type=Path, help="write machine-readable results here")
+    ap.add_argument("--filter", help="only run cases whose name contains this text")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--min-time", type=float, default=0.1, help="seconds per timing sample")
+    ap.add_argument("--quick", action="store_true", help=f"10k instead of {STRESS_HOUSEHOLDS} households")
+    ap.add_argument("--compare", nargs=2, type=Path, metavar=("BEFORE", "AFTER"))
+    args = ap.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    out = run(args)
+    if args.json:
+        args.json.write_text(json.dumps(out, indent=2), encoding="utf-8")
+        print(f"wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+benchmarks/worker_scaling.py
+
+Does throughput grow with workers? Starts launcher.py with 1, 2, ... N
+workers and, for each, keeps a fixed number of websocket clients rerunning
+the results page as fast as the server answers them. Each client is one
+browser session speaking Streamlit's own protocol on /_stcore/stream: it sends
+a rerun request and waits for the script-finished message.
+
+Clients open the results page through a stateless ?s= link
+(MENTAL_LOAD_URL_STATE=1), so every rerun renders a full results page with
+scores and charts. The launcher balances by connection count, since every
+client shares one IP, and XSRF checks are turned off on the workers for the
+benchmark client.
+
+Throughput can only grow with workers up to the number of free cores; the
+report prints the core count next to the numbers.
+
+Usage:
+    python benchmarks/worker_scaling.py [--max-workers 4] [--clients 16] [--seconds 20] [--json scaling.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from suite import SEED  # noqa: E402
+from utils.session_token import encode  # noqa: E402
+from utils.synthetic import ensure_corpus  # noqa: E402
+
+
+def results_links(clients: int) -> List[str]:
+    """One ?s= query string per client: corpus households, spread over results pages 1-5."""
+    corpus = ensure_corpus(max(clients, 4096), SEED)
+    links = []
+    for i in range(clients):
+        token = encode(corpus.matrix(i), {"stage": "results_main", "results_page": i % 5 + 1, **corpus.setup(i)})
+        links.append(f"s={token}")
+    return links
+
+
+def wait_ready(port: int, timeout: float = 90) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=2) as r:
+                if r.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError("launcher did not come up")
+
+
+async def client(port: int, query: str, stop_at: float, latencies: List[float]) -> None:
+    async with websockets.connect(
+        f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"], max_size=None
+    ) as ws:
+        warm = True
+        while time.monotonic() < stop_at:
+            msg = BackMsg()
+            msg.rerun_script.query_string = query
+            t0 = time.perf_counter()
+            await ws.send(msg.SerializeToString())
+            while True:
+                fwd = ForwardMsg()
+                fwd.ParseFromString(await ws.recv())
+                if fwd.WhichOneof("type") == "script_finished":
+                    break
+            if not warm:     # the first run of a session pays for its setup
+                latencies.append(time.perf_counter() - t0)
+            warm = False
+
+
+async def drive(port: int, links: List[str], seconds: float) -> List[float]:
+    latencies: List[float] = []
+    stop_at = time.monotonic() + seconds
+    await asyncio.gather(*(client(port, q, stop_at, latencies) for q in links))
+    return latencies
+
+
+def measure(workers: int, port: int, links: List[str], seconds: float) -> Dict:
+    env = dict(os.environ, MENTAL_LOAD_URL_STATE="1")
+    proc = subprocess.Popen(
+        [sys.executable, str(ROOT / "launcher.py"), "--workers", str(workers), "--port", str(port),
+         "--balance", "leastconn", "--quiet", "--", "--server.enableXsrfProtection", "false"],
+        env=env, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_ready(port)
+        lat = sorted(asyncio.run(drive(port, links, seconds)))
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(30)
+    n = len(lat)
+    return {
+        "workers": workers,
+        "reruns": n,
+        "reruns_per_s": n / seconds,
+        "p50_ms": lat[n // 2] * 1000 if n else None,
+        "p95_ms": lat[min(n - 1, int(n * 0.95))] * 1000 if n else None,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--clients", type=int, default=16)
+    ap.add_argument("--seconds", type=float, default=20)
+    ap.add_argument("--port", type=int, default=8599)
+    ap.add_argument("--json", type=Path, help="also write the report as JSON")
+    args = ap.parse_args()
+
+    links = results_links(args.clients)
+    rows = []
+    print(f"{os.cpu_count()} cores, {args.clients} clients, {args.seconds:g} s per run")
+    print(f"{'workers':>7} {'reruns/s':>9} {'speedup':>8} {'p50 ms':>8} {'p95 ms':>8}")
+    for workers in range(1, args.max_workers + 1):
+        row = measure(workers, args.port, links, args.seconds)
+        row["speedup"] = row["reruns_per_s"] / rows[0]["reruns_per_s"] if rows else 1.0
+        rows.append(row)
+        print(f"{workers:>7} {row['reruns_per_s']:>9.1f} {row['speedup']:>7.2f}x {row['p50_ms']:>8.0f} {row['p95_ms']:>8.0f}")
+    if args.json:
+        out = {"cores": os.cpu_count(), "clients": args.clients, "seconds": args.seconds, "runs": rows}
+        args.json.write_text(json.dumps(out, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
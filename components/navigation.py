@@ -3,6 +3,45 @@
 
 import streamlit as st
 from state import reset_state
+from utils import session_store
+
+
+# ----- navigation callbacks -----
+# Pass these as a button's on_click. The state change then lands before the
+# script reruns, so a click costs one rerun instead of the click rerun plus
+# a forced st.rerun().
+
+def set_stage(stage, **updates):
+    """Go to a stage, setting any other session keys first (e.g. results_page=1)"""
+    for key, value in updates.items():
+        st.session_state[key] = value
+    st.session_state.stage = stage
+
+def restart():
+    """Erase everything (including a saved copy) and go home"""
+    session_store.forget()
+    reset_state()
+    st.session_state.stage = "home"
+
+def finish():
+    """Done with the results: drop any saved copy and go home"""
+    session_store.forget()
+    st.session_state.stage = "home"
+
+def request_home():
+    """Go home, asking for a second click first if there are answers to lose"""
+    if st.session_state.get("responses") and not st.session_state.get("confirm_home", False):
+        st.session_state.confirm_home = True
+    else:
+        st.session_state.stage = "home"
+
+def request_restart():
+    """Start over on the second click"""
+    if st.session_state.get("confirm_restart", False):
+        restart()
+    else:
+        st.session_state.confirm_restart = True
+
 
 def render_navigation(
     show_back=False, 
@@ -50,22 +89,13 @@ def render_navigation(
     # Back button
     if show_back and back_stage:
         with cols[col_index]:
-            if st.button(back_label, key="nav_back", use_container_width=True):
-                st.session_state.stage = back_stage
-                st.rerun()
+            st.button(back_label, key="nav_back", use_container_width=True, on_click=set_stage, args=(back_stage,))
         col_index += 1
     
     # Restart button (mainly for results page)
     if show_restart:
         with cols[col_index]:
-            if st.button("🔁 Start Over", key="nav_restart", use_container_width=True):
-                if st.session_state.get("confirm_restart", False):
-                    reset_state()
-                    st.session_state.stage = "home"
-                    st.rerun()
-                else:
-                    st.session_state.confirm_restart = True
-                    st.rerun()
+            st.button("🔁 Start Over", key="nav_restart", use_container_width=True, on_click=request_restart)
         col_index += 1
         
         # Show confirmation if restart was clicked
@@ -85,18 +115,8 @@ def render_navigation(
     # Home button
     if show_home:
         with cols[-1]:
-            if st.button("🏠 Home", key="nav_home", use_container_width=True, type="secondary"):
-                # Confirm if they have progress
-                if st.session_state.get("responses_dict") and len(st.session_state.responses_dict) > 0:
-                    if st.session_state.get("confirm_home", False):
-                        st.session_state.stage = "home"
-                        st.rerun()
-                    else:
-                        st.session_state.confirm_home = True
-                        st.rerun()
-                else:
-                    st.session_state.stage = "home"
-                    st.rerun()
+            # Confirms first if they have progress
+            st.button("🏠 Home", key="nav_home", use_container_width=True, type="secondary", on_click=request_home)
         
         # Show confirmation if home was clicked with progress
         if st.session_state.get("confirm_home", False):
@@ -122,9 +142,7 @@ def render_simple_navigation(current_page, total_pages=None):
     cols = st.columns([1, 2, 1])
     
     with cols[0]:
-        if st.button("🏠 Home", key="simple_nav_home", use_container_width=True):
-            st.session_state.stage = "home"
-            st.rerun()
+        st.button("🏠 Home", key="simple_nav_home", use_container_width=True, on_click=set_stage, args=("home",))
     
     with cols[1]:
         if total_pages:
@@ -135,9 +153,6 @@ def render_simple_navigation(current_page, total_pages=None):
             """, unsafe_allow_html=True)
     
     with cols[2]:
-        if st.button("🔁 Restart", key="simple_nav_restart", use_container_width=True):
-            reset_state()
-            st.session_state.stage = "home"
-            st.rerun()
+        st.button("🔁 Restart", key="simple_nav_restart", use_container_width=True, on_click=restart)
     
     st.markdown("---")
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+hotspot_rules.py
+
+Hotspot rules, loaded from data/hotspot_rules.json and compiled into NumPy
+predicates, so one household's answer matrix or a whole cohort
+(households x tasks) is flagged and prioritised in a single pass.
+
+Each threshold rule sets one reason flag (scoring.IMBALANCED, ...) where
+`measure op value` holds, and adds priority_weight x priority_measure (default:
+the same measure) to the task's priority. An `all_of` rule sets its flag where
+all the listed flags are set. Measures:
+
+    responsibility  0..100 (0 = Partner A, 100 = Partner B)
+    imbalance       distance from 50/50, 0..50
+    burden          1..5
+    fairness        1..5
+    unfairness      6 - fairness
+
+Hotspots rank by priority, highest first, ties in catalogue order. A watcher
+thread reloads the file when it changes; a broken edit is logged and ignored.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from scoring import HIGH_BURDEN, IMBALANCED, LOW_FAIRNESS, PRIORITY
+from utils.watch import watch_file
+
+log = logging.getLogger(__name__)
+
+RULES_PATH = Path(__file__).resolve().parent / "data" / "hotspot_rules.json"
+SCHEMA_VERSION = 1
+
+FLAGS = {"imbalanced": IMBALANCED, "high_burden": HIGH_BURDEN, "low_fairness": LOW_FAIRNESS, "priority": PRIORITY}
+OPS: Dict[str, Callable] = {
+    ">=": np.greater_equal, ">": np.greater, "<=": np.less_equal, "<": np.less, "==": np.equal,
+}
+MEASURES: Dict[str, Callable] = {
+    "responsibility": lambda r, b, f: r,
+    "imbalance": lambda r, b, f: np.abs(r - 50),
+    "burden": lambda r, b, f: b,
+    "fairness": lambda r, b, f: f,
+    "unfairness": lambda r, b, f: 6 - f,
+}
+
+
+class RulesError(ValueError):
+    """The hotspot rules file is missing, malformed or has the wrong schema version."""
+
+
+class RuleSet:
+    """Compiled hotspot rules. Inputs may be one household (tasks,) or a batch (households, tasks)."""
+
+    def __init__(self, rules: List[Dict], version: str):
+        self.version = version
+        self._tests = []        # (bit, measure, op, value, weight, priority measure)
+        self._combos = []       # (bit, required bits)
+        weights = []
+        for rule in rules:
+            bit = FLAGS[rule["flag"]]
+            if "all_of" in rule:
+                self._combos.append((bit, sum(FLAGS[f] for f in rule["all_of"])))
+                continue
+            weight = rule.get("priority_weight", 0)
+            weights.append(weight)
+            self._tests.append((
+                bit, rule["measure"], OPS[rule["op"]], rule["value"],
+                weight, rule.get("priority_measure", rule["measure"]),
+            ))
+        self._measures = sorted({t[1] for t in self._tests} | {t[5] for t in self._tests if t[4]})
+        self._priority_dtype = np.result_type(np.int64, *weights)
+
+    def evaluate(self, responsibility, burden, fairness) -> Tuple[np.ndarray, np.ndarray]:
+        """(reason codes as uint8, 0 = not a hotspot; priorities) for every task."""
+        r, b, f = (np.asarray(x, dtype=np.int16) for x in (responsibility, burden, fairness))
+        m = {name: MEASURES[name](r, b, f) for name in self._measures}
+        codes = np.zeros(r.shape, dtype=np.uint8)
+        priority = np.zeros(r.shape, dtype=self._priority_dtype)
+        for bit, measure, op, value, weight, priority_measure in self._tests:
+            hit = op(m[measure], value)
+            codes |= hit.astype(np.uint8) * np.uint8(bit)
+            if weight:
+                priority += np.where(hit, weight * m[priority_measure], 0).astype(self._priority_dtype)
+        for bit, required in self._combos:
+            codes |= ((codes & required) == required).astype(np.uint8) * np.uint8(bit)
+        return codes, priority
+
+    @staticmethod
+    def top_k(codes: np.ndarray, priority: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Task indices of the k best-ranked hotspots along the last axis, and which of them are real.
+
+        Partitions on priority alone, so only the k winners get sorted; among
+        tasks tied at the cut-off the earliest ones are kept. Rows with fewer
+        than k hotspots are padded; the returned mask is False for padding.
+        """
+        n = codes.shape[-1]
+        k = min(k, n)
+        if k == 0:
+            empty = np.zeros(codes.shape[:-1] + (0,), dtype=np.intp)
+            return empty, empty.astype(bool)
+        pri = np.where(codes > 0, priority, -np.inf)
+        if k < n:
+            cut = -np.partition(-pri, k - 1, axis=-1)[..., k - 1:k]     # k-th best priority per row
+            tied = pri == cut
+            # Everything above the cut, plus as many of the tied tasks (earliest first) as still fit
+            room = k - np.count_nonzero(pri > cut, axis=-1, keepdims=True)
+            keep = (pri > cut) | (tied & (np.cumsum(tied, axis=-1) <= room))
+            part = np.nonzero(keep.reshape(-1, n))[1].reshape(codes.shape[:-1] + (k,))
+        else:
+            part = np.broadcast_to(np.arange(n), pri.shape)
+        part_pri = np.take_along_axis(pri, part, axis=-1)
+        order = np.lexsort((part, -part_pri), axis=-1)      # priority, then catalogue order
+        idx = np.take_along_axis(part, order, axis=-1)
+        return idx, np.take_along_axis(part_pri, order, axis=-1) > -np.inf
+
+    def rank(self, codes: np.ndarray, priority: np.ndarray, k: Optional[int] = None) -> np.ndarray:
+        """Indices of one household's hotspots, best first (all of them unless k is given)."""
+        flagged = np.flatnonzero(codes)
+        if k is not None and k < flagged.size:
+            idx, real = self.top_k(codes, priority, k)
+            return idx[real]
+        # Everything is wanted: a plain stable sort of the flagged tasks is cheaper
+        return flagged[np.argsort(-priority[flagged], kind="stable")]
+
+
+def _parse_rules(raw: bytes) -> List[Dict]:
+    try:
+        doc = json.loads(raw)
+    except json.JSONDecodeError as e:
+        raise RulesError(f"hotspot rules are not valid JSON: {e}") from e
+    if doc.get("schema_version") != SCHEMA_VERSION:
+        raise RulesError(f"unsupported hotspot rules schema_version {doc.get('schema_version')!r} (expected {SCHEMA_VERSION})")
+    rules = doc.get("rules", [])
+    for i, rule in enumerate(rules):
+        if rule.get("flag") not in FLAGS:
+            raise RulesError(f"rule #{i}: unknown flag {rule.get('flag')!r} (expected one of {sorted(FLAGS)})")
+        if "all_of" in rule:
+            unknown = set(rule["all_of"]) - set(FLAGS)
+            if unknown or not rule["all_of"]:
+                raise RulesError(f"rule #{i}: all_of needs known flags, got {rule['all_of']!r}")
+            continue
+        if rule.get("measure") not in MEASURES or rule.get("priority_measure", rule.get("measure")) not in MEASURES:
+            raise RulesError(f"rule #{i}: unknown measure (expected one of {sorted(MEASURES)})")
+        if rule.get("op") not in OPS:
+            raise RulesError(f"rule #{i}: unknown op {rule.get('op')!r}")
+        if not isinstance(rule.get("value"), (int, float)):
+            raise RulesError(f"rule #{i}: 'value' must be a number")
+        weight = rule.get("priority_weight", 0)
+        if not isinstance(weight, (int, float)) or weight < 0:
+            raise RulesError(f"rule #{i}: 'priority_weight' must be a number ≥ 0")
+    return rules
+
+
+def load_rules(path: Path = RULES_PATH) -> RuleSet:
+    raw = path.read_bytes()
+    return RuleSet(_parse_rules(raw), hashlib.blake2b(raw, digest_size=8).hexdigest())
+
+
+_RULES = load_rules()
+
+def current_rules() -> RuleSet:
+    return _RULES
+
+
+# ---------- Hot reload ----------
+_rules_mtime = RULES_PATH.stat().st_mtime_ns
+
+def reload_rules(path: Path = RULES_PATH) -> bool:
+    """Swap in the rules file if its content changed. Returns True when new rules were applied."""
+    global _RULES
+    try:
+        rules = load_rules(path)
+    except (OSError, RulesError) as e:
+        log.error("hotspot rules reload failed, keeping version %s: %s", _RULES.version, e)
+        return False
+    if rules.version == _RULES.version:
+        return False
+    _RULES = rules
+    log.info("hotspot rules reloaded: version %s", rules.version)
+    return True
+
+def start_rules_watcher(interval: float = 2.0) -> None:
+    """Start (once per process) a daemon thread that polls the rules file for changes."""
+    watch_file(RULES_PATH, reload_rules, interval, mtime=_rules_mtime, name="hotspot-rules-watcher")
@@ -0,0 +1,301 @@
+"""
+launcher.py
+
+Run several copies of app.py behind one local TCP proxy, so the app can use
+more than one core.
+
+    python launcher.py --workers 4 --port 8501
+    python launcher.py --workers 4 -- --server.maxUploadSize 10     # extra args go to streamlit run
+
+A Streamlit session lives on one worker for as long as its websocket stays
+open. The on-disk session store stays opt-in: with --session-db PATH (or
+MENTAL_LOAD_SESSION_DB already set) every worker shares that SQLite file, so a
+session that reconnects to another worker, for example after a recycle,
+resumes from its ?resume= link. Without it, a session lost with its worker
+starts over.
+
+The proxy works on raw TCP, so HTTP and websockets pass through untouched.
+New connections go to a healthy, non-draining worker chosen by client IP
+(--balance ip, the default, which keeps a browser's media and download
+requests on the worker that made them) or by fewest open connections
+(--balance leastconn, for load tests where every client is 127.0.0.1).
+
+Each worker's /_stcore/health is polled. A worker that dies or fails
+--max-failures checks in a row is replaced. SIGHUP, or --max-age, recycles
+workers one at a time: the replacement is started and must pass a health
+check, then the old worker stops taking connections, and it is terminated
+once its connections close or --drain-timeout passes.
+
+With MENTAL_LOAD_METRICS_PORT=BASE, worker slot i serves /metrics on BASE+i.
+While a recycled worker drains, its replacement takes BASE+workers+i instead;
+the launcher logs the port of every worker it starts.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import List, Optional
+
+ROOT = Path(__file__).resolve().parent
+log = logging.getLogger("launcher")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def port_free(port: int) -> bool:
+    with socket.socket() as s:
+        try:
+            s.bind(("127.0.0.1", port))
+        except OSError:
+            return False
+        return True
+
+
+class Worker:
+    def __init__(self, slot: int, port: int, proc: subprocess.Popen, metrics_port: Optional[int] = None):
+        self.slot = slot
+        self.port = port
+        self.metrics_port = metrics_port
+        self.proc = proc
+        self.started = time.monotonic()
+        self.healthy = False
+        self.starting = True     # until its first health check passes or times out
+        self.failures = 0
+        self.draining = False
+        self.replacing = False
+        self.active = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def __repr__(self):
+        return f"<worker {self.slot} :{self.port} pid {self.proc.pid}>"
+
+
+class Launcher:
+    def __init__(self, args):
+        self.args = args
+        self.workers: List[Worker] = []
+        self._recycling = asyncio.Lock()
+        self._stopping = asyncio.Event()
+
+    # ----- workers -----
+    def _metrics_port(self, slot: int) -> Optional[int]:
+        """A /metrics port for a new worker in this slot: base + slot, or the second bank while the old one drains."""
+        base = os.environ.get("MENTAL_LOAD_METRICS_PORT")
+        if not base:
+            return None
+        for port in (int(base) + slot, int(base) + self.args.workers + slot):
+            if port_free(port) and all(w.metrics_port != port for w in self.workers):
+                return port
+        return free_port()
+
+    def _env(self, metrics_port: Optional[int]) -> dict:
+        env = dict(os.environ)
+        if self.args.session_db:
+            env["MENTAL_LOAD_SESSION_DB"] = str(self.args.session_db)
+        if metrics_port:
+            env["MENTAL_LOAD_METRICS_PORT"] = str(metrics_port)
+        return env
+
+    def spawn(self, slot: int) -> Worker:
+        port = free_port()
+        metrics_port = self._metrics_port(slot)
+        cmd = [
+            sys.executable, "-m", "streamlit", "run", str(ROOT / "app.py"),
+            "--server.port", str(port),
+            "--server.address", "127.0.0.1",
+            "--server.headless", "true",
+            "--browser.gatherUsageStats", "false",
+            *self.args.streamlit_args,
+        ]
+        if self.args.session_db:
+            self.args.session_db.parent.mkdir(parents=True, exist_ok=True)
+        # Own session: a terminal's Ctrl-C/hangup reaches the launcher only, which then stops workers in order
+        proc = subprocess.Popen(
+            cmd, cwd=ROOT, env=self._env(metrics_port), start_new_session=True,
+            stdout=subprocess.DEVNULL if self.args.quiet else None,
+        )
+        worker = Worker(slot, port, proc, metrics_port)
+        log.info("started %r%s", worker, f" (metrics on :{metrics_port})" if metrics_port else "")
+        return worker
+
+    async def check(self, worker: Worker) -> bool:
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection("127.0.0.1", worker.port), 2)
+            writer.write(b"GET /_stcore/health HTTP/1.0\r\nHost: 127.0.0.1\r\n\r\n")
+            await writer.drain()
+            status = await asyncio.wait_for(reader.readline(), 2)
+            writer.close()
+            return b" 200 " in status
+        except (OSError, asyncio.TimeoutError):
+            return False
+
+    async def wait_healthy(self, worker: Worker, timeout: float = 60) -> bool:
+        deadline = time.monotonic() + timeout
+        try:
+            while time.monotonic() < deadline and worker.alive:
+                if await self.check(worker):
+                    worker.healthy = True
+                    return True
+                await asyncio.sleep(0.25)
+            return False
+        finally:
+            worker.starting = False
+
+    async def stop(self, worker: Worker, drain: float) -> None:
+        """Take a worker out of rotation, wait for its connections to finish, then terminate it."""
+        worker.draining = True
+        deadline = time.monotonic() + drain
+        while worker.active and time.monotonic() < deadline:
+            await asyncio.sleep(0.5)
+        worker.proc.terminate()
+        try:
+            await asyncio.wait_for(asyncio.to_thread(worker.proc.wait), 10)
+        except asyncio.TimeoutError:
+            worker.proc.kill()
+        if worker in self.workers:
+            self.workers.remove(worker)
+        log.info("stopped %r (%d connections left)", worker, worker.active)
+
+    async def replace(self, old: Worker, drain: float) -> None:
+        # One replacement starts at a time; the old worker drains outside the
+        # lock, so a crashed worker isn't kept waiting behind a long drain
+        async with self._recycling:
+            if old not in self.workers or old.draining:
+                return
+            new = self.spawn(old.slot)
+            self.workers.append(new)
+            if await self.wait_healthy(new):
+                retiring, drain = old, drain
+            else:
+                log.error("replacement %r never became healthy; keeping %r", new, old)
+                retiring, drain = new, 0
+            retiring.draining = True
+        await self.stop(retiring, drain)
+
+    async def recycle_all(self) -> None:
+        for worker in list(self.workers):
+            await self.replace(worker, self.args.drain_timeout)
+
+    async def supervise(self) -> None:
+        while not self._stopping.is_set():
+            await asyncio.sleep(self.args.health_interval)
+            for worker in list(self.workers):
+                if worker.starting or worker.draining or worker.replacing:
+                    continue
+                if not worker.alive:
+                    log.warning("%r exited with %s", worker, worker.proc.returncode)
+                    worker.healthy = False
+                    self._schedule_replace(worker, 0)
+                    continue
+                ok = await self.check(worker)
+                worker.failures = 0 if ok else worker.failures + 1
+                worker.healthy = ok or worker.failures < self.args.max_failures
+                if not worker.healthy:
+                    log.warning("%r failed %d health checks", worker, worker.failures)
+                    self._schedule_replace(worker, 0)
+                elif self.args.max_age and time.monotonic() - worker.started > self.args.max_age:
+                    self._schedule_replace(worker, self.args.drain_timeout)
+
+    def _schedule_replace(self, worker: Worker, drain: float) -> None:
+        worker.replacing = True
+        task = asyncio.create_task(self.replace(worker, drain))
+        task.add_done_callback(lambda _: setattr(worker, "replacing", False))
+
+    # ----- proxy -----
+    def pick(self, client_host: str) -> Optional[Worker]:
+        pool = sorted((w for w in self.workers if w.healthy and not w.draining), key=lambda w: w.slot)
+        if not pool:
+            return None
+        if self.args.balance == "leastconn":
+            return min(pool, key=lambda w: w.active)
+        return pool[zlib.crc32(client_host.encode()) % len(pool)]
+
+    async def handle(self, client_reader, client_writer) -> None:
+        worker = self.pick(client_writer.get_extra_info("peername")[0])
+        if worker is None:
+            client_writer.close()
+            return
+        worker.active += 1     # before the await, so a burst of connects spreads under leastconn
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", worker.port)
+        except OSError:
+            worker.active -= 1
+            worker.healthy = False
+            client_writer.close()
+            return
+        try:
+            await asyncio.gather(_pipe(client_reader, upstream_writer), _pipe(upstream_reader, client_writer))
+        finally:
+            worker.active -= 1
+
+    async def run(self) -> None:
+        for slot in range(self.args.workers):
+            self.workers.append(self.spawn(slot))
+        await asyncio.gather(*(self.wait_healthy(w) for w in self.workers))
+        server = await asyncio.start_server(self.handle, self.args.host, self.args.port, backlog=1024)
+        log.info("%d workers healthy; proxy on http://%s:%d", sum(w.healthy for w in self.workers), self.args.host, self.args.port)
+
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGHUP, lambda: asyncio.create_task(self.recycle_all()))
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._stopping.set)
+
+        supervisor = asyncio.create_task(self.supervise())
+        await self._stopping.wait()
+        supervisor.cancel()
+        server.close()
+        await asyncio.gather(*(self.stop(w, 0) for w in list(self.workers)))
+
+
+async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while data := await reader.read(65536):
+            writer.write(data)
+            await writer.drain()
+    except (ConnectionError, asyncio.CancelledError):
+        pass
+    finally:
+        try:
+            writer.close()
+        except RuntimeError:  # loop already closing
+            pass
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Run N app.py workers behind a local TCP proxy.")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8501)
+    ap.add_argument("--balance", choices=("ip", "leastconn"), default="ip")
+    ap.add_argument("--health-interval", type=float, default=2.0, help="seconds between health checks")
+    ap.add_argument("--max-failures", type=int, default=3, help="failed checks in a row before a worker is replaced")
+    ap.add_argument("--max-age", type=float, default=0, help="recycle workers older than this many seconds (0 = never)")
+    ap.add_argument("--session-db", type=Path, help="SQLite file the workers share for resumable sessions (off by default)")
+    ap.add_argument("--drain-timeout", type=float, default=300, help="seconds a recycled worker may keep serving open sessions")
+    ap.add_argument("--quiet", action="store_true", help="hide worker stdout")
+    ap.add_argument("streamlit_args", nargs=argparse.REMAINDER, help="after --: extra arguments for streamlit run")
+    args = ap.parse_args()
+    if args.streamlit_args[:1] == ["--"]:
+        args.streamlit_args = args.streamlit_args[1:]
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    asyncio.run(Launcher(args).run())
+
+
+if __name__ == "__main__":
+    main()
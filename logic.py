@@ -1,41 +1,39 @@
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Sequence, Tuple
+import numpy as np
 from models import Response
+from hotspot_rules import RuleSet, current_rules
+from scoring_models import ScoringModel
+from scoring import (
+    HIGH_BURDEN, IMBALANCED, LOW_FAIRNESS, PRIORITY, REASON_FLAGS,
+    ResponseArrays, Scores, pack_responses, pillar_dict, score,
+)
 
 class Calculator:
     def __init__(self, responses: List[Response]):
         self.responses = [r for r in responses if not r.not_applicable]
+        self._arrays: Optional[ResponseArrays] = None
+        self._scores: Optional[Scores] = None
+
+    def _engine(self) -> Tuple[ResponseArrays, Scores]:
+        # Pack once, score once; every accessor below reads from the same pass
+        if self._scores is None:
+            self._arrays = pack_responses(self.responses)
+            self._scores = score(self._arrays)
+        return self._arrays, self._scores
 
     def _shares(self) -> Tuple[int,int]:
         # Invisible share: average responsibility across tasks
-        if not self.responses:
-            return 50, 50
-        b_share = sum(r.responsibility for r in self.responses)/ (100*len(self.responses))
-        a_pct = round((1 - b_share) * 100)
-        b_pct = 100 - a_pct
-        return a_pct, b_pct
+        _, s = self._engine()
+        return int(s.my_share_pct), int(s.partner_share_pct)
 
     def _burden(self) -> Tuple[int,int]:
         # Map burden (1..5) to 20..100 and weight by share
-        if not self.responses: return 0,0
-        def scale(b): return 20*b
-        a_sum = 0.0; b_sum = 0.0; n = 0
-        for r in self.responses:
-            n += 1
-            a_share = (100 - r.responsibility)/100
-            b_share = r.responsibility/100
-            a_sum += scale(r.burden) * a_share
-            b_sum += scale(r.burden) * b_share
-        return round(a_sum/n), round(b_sum/n)
+        _, s = self._engine()
+        return int(s.my_burden), int(s.partner_burden)
 
     def pillar_scores(self) -> Dict[str, Tuple[float,float]]:
-        d: Dict[str, Tuple[float,float]] = {}
-        for r in self.responses:
-            a_share = (100 - r.responsibility)/100
-            b_share = r.responsibility/100
-            a = d.get(r.task.pillar, (0.0,0.0))[0] + a_share*r.burden
-            b = d.get(r.task.pillar, (0.0,0.0))[1] + b_share*r.burden
-            d[r.task.pillar] = (a,b)
-        return d
+        arrays, s = self._engine()
+        return pillar_dict(s, arrays)
 
     def compute(self) -> Dict:
         a_pct, b_pct = self._shares()
@@ -46,96 +44,87 @@ class Calculator:
             pillar_scores=self.pillar_scores()
         )
 
+    @classmethod
+    def from_arrays(cls, arrays: ResponseArrays) -> "Calculator":
+        """Calculator over already-packed arrays (e.g. ResponseMatrix.arrays()), no Response objects needed."""
+        calc = cls([])
+        calc._arrays = arrays
+        calc._scores = score(arrays)
+        return calc
+
+    @staticmethod
+    def score_batch(arrays: ResponseArrays, model: Optional[ScoringModel] = None) -> Scores:
+        """Score many households at once; arrays are shaped (households, tasks). Standard model unless given."""
+        return model.score(arrays) if model is not None else score(arrays)
+
     @staticmethod
-    def detect_hotspots(responses: List[Response]) -> List[Dict]:
+    def detect_hotspots(responses: Sequence[Response], rules: Optional[RuleSet] = None) -> List[Dict]:
         """
         Detect areas worth exploring in conversation.
+        Accepts Response objects or ResponseMatrix.rows().
         
-        UPDATED LOGIC:
-        - Responsibility imbalance (≥30 points from 50/50)
-        - High burden (≥4 on 1-5 scale)
-        - Low fairness (≤3 on 1-5 scale)
-        - NEW: Combined flag for imbalance + unfairness
+        The thresholds and priority weights come from data/hotspot_rules.json
+        (see hotspot_rules.py). Each hotspot carries a reason_code of scoring
+        flags (IMBALANCED, HIGH_BURDEN, LOW_FAIRNESS, PRIORITY); text for a
+        code comes from REASON_TEXT / REASON_QUESTION.
         """
+        rows = list(responses)
+        if not rows:
+            return []
+        rules = rules or current_rules()
+        cols = np.array([(r.responsibility, r.burden, r.fairness) for r in rows], dtype=np.int16).T
+        codes, priority = rules.evaluate(*cols)
+        order = rules.rank(codes, priority).tolist()
+        codes, priority = codes.tolist(), priority.tolist()
         out = []
-        for r in responses:
-            reasons = []
-            
-            # Check responsibility imbalance
-            responsibility_diff = abs(r.responsibility - 50)
-            is_imbalanced = responsibility_diff >= 30
-            
-            # Check burden level
-            is_high_burden = r.burden >= 4
-            
-            # Check fairness perception
-            is_low_fairness = r.fairness <= 3
-            
-            # Flag different combinations
-            if is_imbalanced:
-                reasons.append("One partner handles most of this")
-            
-            if is_high_burden:
-                reasons.append("This feels particularly draining")
-            
-            if is_low_fairness:
-                reasons.append("This doesn't feel fair to one or both partners")
-            
-            # NEW: Special flag for imbalance + unfairness combo
-            if is_imbalanced and is_low_fairness:
-                reasons.append("PRIORITY: Imbalanced AND feels unfair")
-            
-            # If any reasons flagged, add to hotspots
-            if reasons:
-                out.append({
-                    "task": r.task.name,
-                    "task_id": r.task.id,
-                    "pillar": r.task.pillar,
-                    "reasons": " | ".join(reasons),
-                    "responsibility": r.responsibility,
-                    "burden": r.burden,
-                    "fairness": r.fairness,
-                    # Add priority score for sorting
-                    "priority": (
-                        (responsibility_diff if is_imbalanced else 0) +
-                        (r.burden * 10 if is_high_burden else 0) +
-                        ((6 - r.fairness) * 15 if is_low_fairness else 0)
-                    )
-                })
-        
-        # Sort by priority (highest first)
-        out.sort(key=lambda x: x.get("priority", 0), reverse=True)
-        
+        for i in order:
+            r = rows[i]
+            out.append({
+                "task": r.task.name,
+                "task_id": r.task.id,
+                "pillar": r.task.pillar,
+                "reason_code": codes[i],
+                "responsibility": r.responsibility,
+                "burden": r.burden,
+                "fairness": r.fairness,
+                "priority": priority[i],
+            })
         return out
 
 
 # ==================================================
-# HELPER FUNCTION - Convert reasons to questions
+# REASON TEXT - lookup tables indexed by reason code
 # ==================================================
-def hotspot_to_question(reason: str) -> str:
-    """
-    Convert a hotspot reason into a conversation-starting question.
-    """
-    if not reason:
-        return "What's one small thing that might make this easier?"
-    
-    r_lower = reason.lower()
-    
-    # Priority combo
-    if "priority" in r_lower and "imbalanced" in r_lower and "unfair" in r_lower:
+_REASON_PHRASES = {
+    IMBALANCED: "One partner handles most of this",
+    HIGH_BURDEN: "This feels particularly draining",
+    LOW_FAIRNESS: "This doesn't feel fair to one or both partners",
+    PRIORITY: "PRIORITY: Imbalanced AND feels unfair",
+}
+
+def _question_for(code: int) -> str:
+    if code & PRIORITY:
         return "This feels both imbalanced and unfair. What would need to change for it to feel better?"
-    
-    # Imbalance
-    if "imbalance" in r_lower or "handling most" in r_lower:
+    if code & IMBALANCED:
         return "How did this pattern develop? Would a different split work better?"
-    
-    # High burden
-    if "draining" in r_lower or "burden" in r_lower:
+    if code & HIGH_BURDEN:
         return "What makes this feel so heavy? Is it the task itself or the mental energy around it?"
-    
-    # Fairness
-    if "fair" in r_lower:
+    if code & LOW_FAIRNESS:
         return "What would make this feel fairer to both of you?"
-    
-    # Default
-    return "What's one small thing that might make this easier?"
\ No newline at end of file
+    return "What's one small thing that might make this easier?"
+
+_ALL_CODES = range(sum(REASON_FLAGS) + 1)
+
+# "Why it came up" text, e.g. "One partner handles most of this | This feels particularly draining"
+REASON_TEXT: Tuple[str, ...] = tuple(
+    " | ".join(_REASON_PHRASES[f] for f in REASON_FLAGS if code & f) for code in _ALL_CODES
+)
+# Conversation question for each code
+REASON_QUESTION: Tuple[str, ...] = tuple(_question_for(code) for code in _ALL_CODES)
+
+
+def hotspot_to_question(reason_code: int) -> str:
+    """
+    Convert a hotspot reason code into a conversation-starting question.
+    """
+    return REASON_QUESTION[reason_code]
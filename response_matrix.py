@@ -0,0 +1,215 @@
+"""
+response_matrix.py
+
+One household's answers as a single catalogue-indexed int16 array.
+
+Row i belongs to the i-th task of the catalogue version the matrix was built
+for; the columns are responsibility, burden, fairness and a flags column
+(answered / not applicable). Untouched rows hold the slider defaults. The
+matrix is the only copy of a session's answers: the questionnaire writes to it,
+the Calculator reads packed arrays from it and the export reads row dicts.
+"""
+
+import itertools
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models import Task
+from scoring import PILLAR_INDEX, ResponseArrays, RunningTotals, score
+
+RESPONSIBILITY, BURDEN, FAIRNESS, FLAGS = range(4)
+FIELDS = {"responsibility": RESPONSIBILITY, "burden": BURDEN, "fairness": FAIRNESS}
+
+ANSWERED = 1
+NOT_APPLICABLE = 2
+
+DEFAULT_ANSWER = (50, 3, 3)
+
+
+class ResponseRow(NamedTuple):
+    """Lightweight stand-in for models.Response, without Pydantic validation."""
+    task: Task
+    responsibility: int
+    burden: int
+    fairness: int
+    not_applicable: bool
+
+
+class CatalogLayout:
+    """Row order and pillar codes for one catalogue version, shared by every matrix built on it."""
+
+    def __init__(self, tasks: Sequence[Task], version: str):
+        self.version = version
+        self.tasks: Tuple[Task, ...] = tuple(tasks)
+        self.task_ids: Tuple[str, ...] = tuple(t.id for t in self.tasks)
+        self.index: Dict[str, int] = {tid: i for i, tid in enumerate(self.task_ids)}
+        self.pillar = np.array([PILLAR_INDEX[t.pillar] for t in self.tasks], dtype=np.int8)
+
+
+_LAYOUTS: Dict[str, CatalogLayout] = {}
+
+def layout_for(tasks: Sequence[Task], version: str) -> CatalogLayout:
+    layout = _LAYOUTS.get(version)
+    if layout is None:
+        layout = _LAYOUTS[version] = CatalogLayout(tasks, version)
+    return layout
+
+
+# Never reused within a process, unlike id() of a collected matrix
+_UIDS = itertools.count(1)
+
+
+class ResponseMatrix:
+    """A session's answers. Reads like a {task_id: row dict} mapping of answered tasks.
+
+    (uid, revision) identifies a state of the answers: uid is kept by copy()
+    and rebase(), and revision goes up with every change.
+    """
+
+    def __init__(self, layout: CatalogLayout, data: Optional[np.ndarray] = None):
+        self.layout = layout
+        if data is None:
+            data = np.zeros((len(layout.task_ids), 4), dtype=np.int16)
+            data[:, :3] = DEFAULT_ANSWER
+        self.data = data
+        self.uid = next(_UIDS)
+        self.revision = 0
+        self._totals: Optional[RunningTotals] = None
+
+    @classmethod
+    def empty(cls, tasks: Sequence[Task], version: str) -> "ResponseMatrix":
+        return cls(layout_for(tasks, version))
+
+    @classmethod
+    def from_dicts(cls, rows, tasks: Sequence[Task], version: str) -> "ResponseMatrix":
+        """Build from the legacy list-of-dicts format; rows for unknown task ids are dropped."""
+        m = cls.empty(tasks, version)
+        for r in rows:
+            if r["task_id"] in m.layout.index:
+                m.set(
+                    r["task_id"],
+                    responsibility=int(r.get("responsibility", DEFAULT_ANSWER[0])),
+                    burden=int(r.get("burden", DEFAULT_ANSWER[1])),
+                    fairness=int(r.get("fairness", DEFAULT_ANSWER[2])),
+                    not_applicable=bool(r.get("not_applicable", False)),
+                )
+        return m
+
+    @property
+    def version(self) -> str:
+        return self.layout.version
+
+    def copy(self) -> "ResponseMatrix":
+        m = ResponseMatrix(self.layout, self.data.copy())
+        m.uid, m.revision = self.uid, self.revision
+        return m
+
+    def rebase(self, tasks: Sequence[Task], version: str) -> "ResponseMatrix":
+        """Carry answers over to a reloaded catalogue, matching rows by task id."""
+        if version == self.version:
+            return self
+        m = ResponseMatrix.empty(tasks, version)
+        for tid, i in self.layout.index.items():
+            j = m.layout.index.get(tid)
+            if j is not None:
+                m.data[j] = self.data[i]
+        m.uid, m.revision = self.uid, self.revision + 1
+        return m
+
+    # ----- writes -----
+    def set(self, task_id: str, **values) -> None:
+        """Record an answer; marks the task answered. Keys: responsibility, burden, fairness, not_applicable."""
+        i = self.layout.index[task_id]
+        row = self.data[i]
+        totals = self._totals
+        if totals is not None and row[FLAGS] == ANSWERED:
+            totals.add(int(row[RESPONSIBILITY]), int(row[BURDEN]), int(self.layout.pillar[i]), -1)
+        flags = int(row[FLAGS]) | ANSWERED
+        for name, value in values.items():
+            if name == "not_applicable":
+                flags = (flags | NOT_APPLICABLE) if value else (flags & ~NOT_APPLICABLE)
+            else:
+                row[FIELDS[name]] = value
+        row[FLAGS] = flags
+        if totals is not None and flags == ANSWERED:
+            totals.add(int(row[RESPONSIBILITY]), int(row[BURDEN]), int(self.layout.pillar[i]))
+        self.revision += 1
+
+    # ----- mapping-style reads (answered tasks only, catalogue order) -----
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.data[:, FLAGS] & ANSWERED))
+
+    def __contains__(self, task_id: str) -> bool:
+        i = self.layout.index.get(task_id)
+        return i is not None and bool(self.data[i, FLAGS] & ANSWERED)
+
+    def get(self, task_id: str, default=None):
+        if task_id not in self:
+            return default
+        return self._row_dict(self.layout.index[task_id])
+
+    def values(self) -> Iterator[Dict]:
+        for i in np.flatnonzero(self.data[:, FLAGS] & ANSWERED):
+            yield self._row_dict(int(i))
+
+    def counts(self) -> Tuple[int, int]:
+        """(tasks answered, tasks answered and not N/A)."""
+        flags = self.data[:, FLAGS]
+        return int(np.count_nonzero(flags & ANSWERED)), int(np.count_nonzero(flags == ANSWERED))
+
+    def _row_dict(self, i: int) -> Dict:
+        r, b, f, flags = (int(v) for v in self.data[i])
+        return {
+            "task_id": self.layout.task_ids[i],
+            "responsibility": r,
+            "burden": b,
+            "fairness": f,
+            "not_applicable": bool(flags & NOT_APPLICABLE),
+        }
+
+    # ----- views for the Calculator and export -----
+    def to_dicts(self) -> List[Dict]:
+        return list(self.values())
+
+    def rows(self) -> List[ResponseRow]:
+        """Answered tasks as ResponseRow tuples (for hotspot detection)."""
+        return [
+            ResponseRow(self.layout.tasks[i], *(int(v) for v in self.data[i, :3]), bool(self.data[i, FLAGS] & NOT_APPLICABLE))
+            for i in np.flatnonzero(self.data[:, FLAGS] & ANSWERED)
+        ]
+
+    def arrays(self) -> ResponseArrays:
+        """Packed arrays for scoring; only answered, applicable tasks count."""
+        d = self.data
+        return ResponseArrays(
+            responsibility=d[:, RESPONSIBILITY],
+            burden=d[:, BURDEN],
+            fairness=d[:, FAIRNESS],
+            applicable=d[:, FLAGS] == ANSWERED,
+            pillar=self.layout.pillar,
+        )
+
+    @property
+    def totals(self) -> RunningTotals:
+        if self._totals is None:
+            self._totals = RunningTotals.from_arrays(self.arrays())
+        return self._totals
+
+    def summary(self) -> Dict:
+        """Calculator.compute()-shaped scores, read from the running totals."""
+        t = self.totals
+        a_pct, b_pct = t.shares()
+        burden = t.burden()
+        if burden is None:      # .5 tie: round exactly as the full pass does
+            s = score(self.arrays())
+            burden = int(s.my_burden), int(s.partner_burden)
+        return dict(
+            my_share_pct=a_pct, partner_share_pct=b_pct,
+            my_burden=burden[0], partner_burden=burden[1],
+            pillar_scores=t.pillar_scores(),
+        )
+
+    def key(self) -> bytes:
+        """Content key: catalogue version + raw answers."""
+        return self.version.encode("ascii") + self.data.tobytes()
@@ -0,0 +1,126 @@
+"""
+results_snapshot.py
+
+Everything the five results pages show, computed once per set of answers.
+
+The first results page after "See results →" builds the snapshot: shares,
+burden, pillar sums, their bootstrap intervals, ranked hotspots, strengths and
+the answer rows for the CSV export. The pages only render from it. A snapshot is frozen and holds no reference back to the
+session, so couples with identical answers (and scoring model) share one;
+state.get_results() rebuilds it when the session's answer matrix, the hotspot
+rules or its scoring model changed since.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from hotspot_rules import current_rules
+from response_matrix import ANSWERED, BURDEN, FAIRNESS, FLAGS, RESPONSIBILITY, ResponseMatrix
+from scoring import PILLARS, Intervals, bootstrap, pillar_dict
+from scoring_models import ScoringModel, default_model
+from utils.cache import LRUCache, fingerprint
+
+EXPORT_HEADER = ("task_id", "responsibility", "burden", "fairness", "not_applicable")
+HOTSPOTS_SHOWN = 5      # conversation starters on results page 4
+
+
+class Hotspot(NamedTuple):
+    """One Calculator.detect_hotspots entry; text for reason_code is in logic.REASON_TEXT / REASON_QUESTION."""
+    task: str
+    task_id: str
+    pillar: str
+    reason_code: int                                    # scoring.IMBALANCED | HIGH_BURDEN | ...
+    responsibility: int
+    burden: int
+    fairness: int
+    priority: float                                     # int unless the rules use fractional weights
+
+
+@dataclass(frozen=True)
+class ResultsSnapshot:
+    key: str                                            # content hash of the answers it was built from
+    model: str                                          # scoring_models name the scores come from
+    my_share_pct: int
+    partner_share_pct: int
+    my_burden: int
+    partner_burden: int
+    pillar_sums: Tuple[Tuple[float, float], ...]        # (A, B) for every pillar, in PILLARS order
+    intervals: Intervals                                # how far resampling the tasks moves each score
+    hotspots: Tuple[Hotspot, ...]                       # top HOTSPOTS_SHOWN, highest priority first
+    flagged: Tuple[Hotspot, ...]                        # every hotspot, catalogue order
+    strengths: Tuple[str, ...]                          # names of tasks with a fairly even split
+    export_rows: Tuple[Tuple, ...]                      # answered tasks, EXPORT_HEADER columns
+
+    @property
+    def hotspot_count(self) -> int:
+        return len(self.flagged)
+
+    def ranked_hotspots(self) -> List[Hotspot]:
+        """Every hotspot, highest priority first (ties in catalogue order), for the export."""
+        return sorted(self.flagged, key=lambda h: -h.priority)
+
+    def pillar_scores(self) -> Dict[str, List[float]]:
+        """{pillar: [A, B]} for all five pillars, zeros where nothing was answered."""
+        return {p: list(v) for p, v in zip(PILLARS, self.pillar_sums)}
+
+
+def _summary(responses: ResponseMatrix, model: ScoringModel) -> Dict:
+    if model.incremental:
+        return responses.summary()      # straight from the running totals
+    arrays = responses.arrays()
+    s = model.score(arrays)
+    return dict(
+        my_share_pct=int(s.my_share_pct), partner_share_pct=int(s.partner_share_pct),
+        my_burden=int(s.my_burden), partner_burden=int(s.partner_burden),
+        pillar_scores=pillar_dict(s, arrays),
+    )
+
+
+def build_snapshot(responses: ResponseMatrix, key: str, model: Optional[ScoringModel] = None) -> ResultsSnapshot:
+    model = model or default_model()
+    summary = _summary(responses, model)
+    pillars = summary["pillar_scores"]
+    d = responses.data
+
+    answered = (d[:, FLAGS] & ANSWERED) > 0
+    tasks = responses.layout.tasks
+
+    # Hotspots: every answered task (N/A included) through the compiled rules, top few without a full sort
+    rules = current_rules()
+    codes, priority = rules.evaluate(d[:, RESPONSIBILITY], d[:, BURDEN], d[:, FAIRNESS])
+    codes[~answered] = 0
+
+    def hotspot(i) -> Hotspot:
+        t = tasks[i]
+        r, b, f = (int(v) for v in d[i, :3])
+        return Hotspot(t.name, t.id, t.pillar, int(codes[i]), r, b, f, priority[i].item())
+
+    # Strengths: answered tasks within 20 points of an even split
+    even = answered & (np.abs(d[:, RESPONSIBILITY] - 50) <= 20) & (d[:, BURDEN] < 60)
+
+    return ResultsSnapshot(
+        key=key,
+        model=model.name,
+        my_share_pct=summary["my_share_pct"],
+        partner_share_pct=summary["partner_share_pct"],
+        my_burden=summary["my_burden"],
+        partner_burden=summary["partner_burden"],
+        pillar_sums=tuple(tuple(pillars.get(p, (0.0, 0.0))) for p in PILLARS),
+        # Seeded from the answers, so the same answers always show the same intervals
+        intervals=bootstrap(model.prepare(responses.arrays()), seed=int(fingerprint(key)[:16], 16)),
+        hotspots=tuple(hotspot(i) for i in rules.rank(codes, priority, HOTSPOTS_SHOWN)),
+        flagged=tuple(hotspot(i) for i in np.flatnonzero(codes)),
+        strengths=tuple(tasks[i].name for i in np.flatnonzero(even)),
+        export_rows=tuple(tuple(r[k] for k in EXPORT_HEADER) for r in responses.values()),
+    )
+
+
+# Shared across sessions: couples with identical answers reuse one snapshot
+_SNAPSHOTS = LRUCache(maxsize=512)
+
+def snapshot_for(responses: ResponseMatrix, model: Optional[ScoringModel] = None) -> ResultsSnapshot:
+    model = model or default_model()
+    key = fingerprint(responses.key(), current_rules().version, model.name)
+    return _SNAPSHOTS.get_or_compute(key, lambda: build_snapshot(responses, key, model))
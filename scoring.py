@@ -0,0 +1,239 @@
+"""
+scoring.py
+
+Column-oriented scoring engine used by logic.Calculator.
+
+Responses are packed once into NumPy arrays (responsibility, burden, fairness,
+pillar code and an "applicable" mask) and every score is computed in a single
+vectorised pass. The same functions accept a 2-D batch shaped
+(households x tasks), which is how the research cohort gets re-scored after a
+scoring change.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+PILLARS: Tuple[str, ...] = ("anticipation", "identification", "decision", "monitoring", "emotional")
+PILLAR_INDEX: Dict[str, int] = {p: i for i, p in enumerate(PILLARS)}
+
+
+@dataclass(frozen=True)
+class ResponseArrays:
+    """Packed responses. Trailing axis is tasks; a leading axis means a batch of households."""
+    responsibility: np.ndarray   # int, 0..100 (0=A, 100=B)
+    burden: np.ndarray           # int, 1..5
+    fairness: np.ndarray         # int, 1..5
+    applicable: np.ndarray       # bool, False for N/A (or unanswered) cells
+    pillar: np.ndarray           # int8 pillar code per task, shape (tasks,)
+
+
+@dataclass(frozen=True)
+class Scores:
+    """Vectorised scores. Scalars for one household, arrays of shape (households,) for a batch."""
+    my_share_pct: np.ndarray
+    partner_share_pct: np.ndarray
+    my_burden: np.ndarray
+    partner_burden: np.ndarray
+    pillar_a: np.ndarray         # (..., 5) in PILLARS order
+    pillar_b: np.ndarray         # (..., 5) in PILLARS order
+    pillar_count: np.ndarray     # (..., 5) applicable tasks per pillar
+
+
+@dataclass(frozen=True)
+class Intervals:
+    """Bootstrap percentile intervals (low, high) for one household's scores."""
+    level: float                 # e.g. 0.95
+    resamples: int
+    tasks: int                   # applicable tasks the resamples were drawn from
+    my_share_pct: Tuple[float, float]
+    my_burden: Tuple[float, float]
+    partner_burden: Tuple[float, float]
+    share_gap: Tuple[float, float]     # A share - B share, percentage points
+    burden_gap: Tuple[float, float]    # A burden - B burden
+    pillar_a: Tuple[Tuple[float, float], ...]   # PILLARS order
+    pillar_b: Tuple[Tuple[float, float], ...]
+
+    @property
+    def partner_share_pct(self) -> Tuple[float, float]:
+        return 100 - self.my_share_pct[1], 100 - self.my_share_pct[0]
+
+
+# Hotspot reason flags (bit set per task); thresholds live in data/hotspot_rules.json
+IMBALANCED = 1      # responsibility far from 50/50
+HIGH_BURDEN = 2     # draining
+LOW_FAIRNESS = 4    # doesn't feel fair
+PRIORITY = 8        # imbalanced and low fairness together
+REASON_FLAGS = (IMBALANCED, HIGH_BURDEN, LOW_FAIRNESS, PRIORITY)
+
+
+def pack_responses(responses: Iterable) -> ResponseArrays:
+    """Pack Response-like objects (task, responsibility, burden, fairness, not_applicable) into arrays."""
+    rows = [
+        (r.responsibility, r.burden, r.fairness, not r.not_applicable, PILLAR_INDEX[r.task.pillar])
+        for r in responses
+    ]
+    if not rows:
+        empty = np.zeros(0, dtype=np.int16)
+        return ResponseArrays(empty, empty, empty, np.zeros(0, dtype=bool), np.zeros(0, dtype=np.int8))
+    cols = np.array(rows, dtype=np.int16).T
+    return ResponseArrays(
+        responsibility=cols[0],
+        burden=cols[1],
+        fairness=cols[2],
+        applicable=cols[3].astype(bool),
+        pillar=cols[4].astype(np.int8),
+    )
+
+
+def _running_total(x: np.ndarray) -> np.ndarray:
+    if x.shape[-1] == 0:
+        return x.sum(axis=-1)
+    return np.add.accumulate(x, axis=-1)[..., -1]
+
+
+def score(arrays: ResponseArrays) -> Scores:
+    """Compute shares, burden and the five pillar sums for one household or a batch."""
+    mask = arrays.applicable
+    resp = np.where(mask, arrays.responsibility, 0).astype(np.float64)
+    burden = np.where(mask, arrays.burden, 0).astype(np.float64)
+    n = mask.sum(axis=-1)
+    safe_n = np.maximum(n, 1)
+
+    # Invisible share: average responsibility across tasks
+    b_share = resp.sum(axis=-1) / (100 * safe_n)
+    a_pct = np.where(n > 0, np.rint((1 - b_share) * 100), 50).astype(np.int64)
+    b_pct = 100 - a_pct
+
+    # Burden (1..5) mapped to 20..100 and weighted by share. Summed left to right
+    # (accumulate, not pairwise) so .5 ties round exactly as the per-task loop did.
+    b_weight = resp / 100
+    a_weight = np.where(mask, (100 - resp) / 100, 0.0)
+    a_burden = np.rint(_running_total(20 * burden * a_weight) / safe_n).astype(np.int64)
+    b_burden = np.rint(_running_total(20 * burden * b_weight) / safe_n).astype(np.int64)
+
+    # Pillar sums: one-hot (tasks x 5) so a batch is a single matmul
+    onehot = np.zeros((arrays.pillar.shape[0], len(PILLARS)))
+    onehot[np.arange(arrays.pillar.shape[0]), arrays.pillar] = 1.0
+    pillar_a = (a_weight * burden) @ onehot
+    pillar_b = (b_weight * burden) @ onehot
+    pillar_count = mask.astype(np.int64) @ onehot.astype(np.int64)
+
+    return Scores(a_pct, b_pct, a_burden, b_burden, pillar_a, pillar_b, pillar_count)
+
+
+def pillar_dict(scores: Scores, arrays: ResponseArrays) -> Dict[str, Tuple[float, float]]:
+    """Single-household pillar scores as {pillar: (a, b)}, pillars in order of first appearance."""
+    seen = arrays.pillar[arrays.applicable]
+    _, first = np.unique(seen, return_index=True)
+    order = seen[np.sort(first)]
+    return {PILLARS[c]: (float(scores.pillar_a[c]), float(scores.pillar_b[c])) for c in order}
+
+
+class RunningTotals:
+    """Integer sums behind score() for one household, kept up to date one answer at a time.
+
+    Every sum is exact, so adding and later removing a task's contribution leaves
+    no drift. Shares and pillar sums read straight from the totals; a burden
+    whose exact value is a .5 tie returns None, because score() rounds it after
+    left-to-right float summation and only a full pass reproduces that.
+    """
+
+    __slots__ = ("n", "resp", "burden_a", "burden_b", "pillar_a", "pillar_b", "pillar_n")
+
+    def __init__(self):
+        self.n = 0            # applicable tasks
+        self.resp = 0         # sum of responsibility
+        self.burden_a = 0     # sum of burden * (100 - responsibility)
+        self.burden_b = 0     # sum of burden * responsibility
+        self.pillar_a = [0] * len(PILLARS)
+        self.pillar_b = [0] * len(PILLARS)
+        self.pillar_n = [0] * len(PILLARS)
+
+    @classmethod
+    def from_arrays(cls, arrays: ResponseArrays) -> "RunningTotals":
+        t = cls()
+        mask = arrays.applicable
+        resp = np.where(mask, arrays.responsibility, 0).astype(np.int64)
+        burden = np.where(mask, arrays.burden, 0).astype(np.int64)
+        a, b = burden * (100 - resp), burden * resp
+        pillar = arrays.pillar.astype(np.intp)
+        t.n, t.resp = int(mask.sum()), int(resp.sum())
+        t.burden_a, t.burden_b = int(a.sum()), int(b.sum())
+        t.pillar_a = np.bincount(pillar, a, len(PILLARS)).astype(np.int64).tolist()
+        t.pillar_b = np.bincount(pillar, b, len(PILLARS)).astype(np.int64).tolist()
+        t.pillar_n = np.bincount(pillar, mask, len(PILLARS)).astype(np.int64).tolist()
+        return t
+
+    def add(self, responsibility: int, burden: int, pillar: int, sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) one applicable task's contribution."""
+        a, b = burden * (100 - responsibility), burden * responsibility
+        self.n += sign
+        self.resp += sign * responsibility
+        self.burden_a += sign * a
+        self.burden_b += sign * b
+        self.pillar_a[pillar] += sign * a
+        self.pillar_b[pillar] += sign * b
+        self.pillar_n[pillar] += sign
+
+    def shares(self) -> Tuple[int, int]:
+        if self.n == 0:
+            return 50, 50
+        a_pct = int(np.rint((1 - self.resp / (100 * self.n)) * 100))   # same float steps as score()
+        return a_pct, 100 - a_pct
+
+    def burden(self) -> Optional[Tuple[int, int]]:
+        """Burden pair on the 0..100 scale, or None if either side is an exact .5 tie."""
+        n5 = 5 * max(self.n, 1)
+        if (2 * self.burden_a) % (2 * n5) == n5 or (2 * self.burden_b) % (2 * n5) == n5:
+            return None
+        return round(self.burden_a / n5), round(self.burden_b / n5)
+
+    def pillar_scores(self) -> Dict[str, Tuple[float, float]]:
+        return {
+            p: (self.pillar_a[i] / 100, self.pillar_b[i] / 100)
+            for i, p in enumerate(PILLARS) if self.pillar_n[i]
+        }
+
+
+BOOTSTRAP_RESAMPLES = 2000
+
+
+def bootstrap(arrays: ResponseArrays, resamples: int = BOOTSTRAP_RESAMPLES, level: float = 0.95, seed=None) -> Intervals:
+    """Percentile intervals for one household's scores, resampling its applicable tasks with replacement.
+
+    All resamples are drawn at once and turned into a (resamples x tasks)
+    matrix of how often each task was picked, so every statistic for every
+    resample comes out of a single matrix product.
+    """
+    mask = arrays.applicable
+    r = arrays.responsibility[mask].astype(np.float64)
+    b = arrays.burden[mask].astype(np.float64)
+    n = r.size
+    if n == 0:
+        even, zero = (50.0, 50.0), (0.0, 0.0)
+        return Intervals(level, 0, 0, even, zero, zero, zero, zero, (zero,) * len(PILLARS), (zero,) * len(PILLARS))
+
+    onehot = np.zeros((n, len(PILLARS)))
+    onehot[np.arange(n), arrays.pillar[mask]] = 1.0
+    a_part, b_part = b * (100 - r) / 100, b * r / 100
+    # Columns: responsibility, A burden, B burden, then A and B per pillar
+    columns = np.column_stack([r, a_part, b_part, a_part[:, None] * onehot, b_part[:, None] * onehot])
+    picks = np.random.default_rng(seed).integers(0, n, (resamples, n)) + (np.arange(resamples) * n)[:, None]
+    weights = np.bincount(picks.ravel(), minlength=resamples * n).reshape(resamples, n)
+    sums = weights.astype(np.float64) @ columns
+
+    a_pct = np.rint((1 - sums[:, 0] / (100 * n)) * 100)
+    a_burden, b_burden = 20 * sums[:, 1] / n, 20 * sums[:, 2] / n
+    stats = np.column_stack([a_pct, a_burden, b_burden, 2 * a_pct - 100, a_burden - b_burden, sums[:, 3:]])
+    tail = (1 - level) / 2 * 100
+    lo, hi = np.percentile(stats, [tail, 100 - tail], axis=0)
+    pairs = tuple(zip(lo.tolist(), hi.tolist()))
+    k = len(PILLARS)
+    return Intervals(
+        level, resamples, n,
+        my_share_pct=pairs[0], my_burden=pairs[1], partner_burden=pairs[2],
+        share_gap=pairs[3], burden_gap=pairs[4],
+        pillar_a=pairs[5:5 + k], pillar_b=pairs[5 + k:],
+    )
@@ -0,0 +1,135 @@
+"""
+scoring_models.py
+
+Registry of scoring models. A model turns packed responses into Scores for
+one household or a (households x tasks) batch, like scoring.score, which is
+the "standard" model.
+
+Most models only change what a task's answers count for. A model therefore
+has a `prepare` step that maps the packed arrays, usually through a small
+lookup table, and a kernel (scoring.score unless the model brings its own).
+Registering a model compiles its tables once at import, so picking a model
+per rerun is a dict lookup.
+
+    @register("my_model", "My model", explainer="For each task we ...")
+    def _my_model():
+        table = ...                                   # built once, here
+        return lambda arrays: replace(arrays, burden=table[arrays.burden])
+
+Which model a session gets:
+    MENTAL_LOAD_SCORING_MODEL   the deployment's model (default "standard")
+    MENTAL_LOAD_STUDY_ARMS      "arm:model,arm:model"; a session opened with
+                                ?arm=<arm> is scored with that arm's model
+An unknown model name is logged and the standard model is used instead.
+"""
+
+import logging
+import os
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from scoring import ResponseArrays, Scores, score
+
+log = logging.getLogger(__name__)
+
+MODEL_ENV = "MENTAL_LOAD_SCORING_MODEL"
+ARMS_ENV = "MENTAL_LOAD_STUDY_ARMS"
+ARM_PARAM = "arm"
+STANDARD = "standard"
+
+
+@dataclass(frozen=True)
+class ScoringModel:
+    name: str
+    label: str
+    explainer: str                                      # page 2's "In plain terms" text
+    prepare: Callable[[ResponseArrays], ResponseArrays]
+    kernel: Callable[[ResponseArrays], Scores] = score
+    incremental: bool = False                           # scores match ResponseMatrix's running totals
+
+    def score(self, arrays: ResponseArrays) -> Scores:
+        return self.kernel(self.prepare(arrays))
+
+
+MODELS: Dict[str, ScoringModel] = {}
+
+
+def register(name: str, label: str, explainer: str, kernel: Callable = score, incremental: bool = False):
+    """Decorator: compile a model's prepare step (the decorated function is called once, now) and register it."""
+    def wrap(compile_prepare: Callable[[], Callable[[ResponseArrays], ResponseArrays]]):
+        MODELS[name] = ScoringModel(name, label, explainer, compile_prepare(), kernel, incremental)
+        return compile_prepare
+    return wrap
+
+
+# ---------- built-in models ----------
+@register(
+    STANDARD, "Standard",
+    explainer=(
+        "**In plain terms:** For each task we combine two things — (1) who mostly carries it and "
+        "(2) how draining it feels. If you carry more of a task *and* it feels heavy, your Burden score "
+        "goes up. We add that across tasks to show each person’s overall mental load. How fair a task "
+        "feels is shown separately, in the conversation starters."
+    ),
+    incremental=True,
+)
+def _standard():
+    return lambda arrays: arrays
+
+
+# A task that feels unfair weighs more: fairness 1 (very unfair) counts its
+# burden 1.5x as much as 3 (neutral), 5 (very fair) 0.5x. Divided by the largest
+# weight rather than capped, so the result stays on the 1..5 burden scale and
+# fairness still counts at burden 5.
+FAIRNESS_WEIGHTS = (None, 1.5, 1.25, 1.0, 0.75, 0.5)
+
+@register(
+    "fairness_weighted", "Fairness-weighted",
+    explainer=(
+        "**In plain terms:** For each task we combine three things — (1) who mostly carries it, "
+        "(2) how draining it feels, and (3) how fair it feels. "
+        "If you carry more of a task *and* it feels heavy or unfair, your Burden score goes up. "
+        "We add that across tasks to show each person’s overall mental load. This makes sense because "
+        "both responsibility and how it feels day-to-day shape the real ‘weight’ you experience."
+    ),
+)
+def _fairness_weighted():
+    # (burden, fairness) -> effective burden, indexed directly by the 1..5 answers
+    table = np.zeros((6, 6))
+    for f in range(1, 6):
+        table[1:, f] = np.arange(1, 6) * FAIRNESS_WEIGHTS[f] / max(FAIRNESS_WEIGHTS[1:])
+    table.setflags(write=False)
+    return lambda arrays: replace(arrays, burden=table[arrays.burden, arrays.fairness])
+
+
+# ---------- selection ----------
+def get_model(name: Optional[str]) -> ScoringModel:
+    model = MODELS.get(name or STANDARD)
+    if model is None:
+        log.error("unknown scoring model %r, using %r (known: %s)", name, STANDARD, ", ".join(sorted(MODELS)))
+        return MODELS[STANDARD]
+    return model
+
+
+def _parse_arms(spec: str) -> Dict[str, ScoringModel]:
+    arms = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        arm, sep, name = part.partition(":")
+        if not sep:
+            log.error("ignoring study arm %r in %s: expected arm:model", part, ARMS_ENV)
+            continue
+        arms[arm.strip()] = get_model(name.strip())
+    return arms
+
+
+_DEFAULT = get_model(os.environ.get(MODEL_ENV))
+_ARMS = _parse_arms(os.environ.get(ARMS_ENV, ""))
+
+def default_model() -> ScoringModel:
+    return _DEFAULT
+
+def model_for(arm: Optional[str]) -> ScoringModel:
+    """The model for a study arm; sessions without an arm (or with an unknown one) get the deployment default."""
+    return _ARMS.get(arm, _DEFAULT) if arm else _DEFAULT
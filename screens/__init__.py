@@ -0,0 +1,26 @@
+# screens/__init__.py
+# Stage → screen registry. Screen modules are imported on first use, so a
+# cold start only loads the home screen, not the results charts and export.
+
+import importlib
+from typing import Callable, Dict, Optional, Tuple
+
+SCREENS: Dict[str, Tuple[str, str]] = {
+    "home": ("screens.home", "screen_home"),
+    "consent": ("screens.consent", "screen_consent"),
+    "setup": ("screens.setup", "screen_setup"),
+    "questionnaire": ("screens.questionnaire", "screen_questionnaire"),
+    "results": ("screens.results", "screen_results"),
+    "results_main": ("screens.results", "screen_results"),
+    "learn_more": ("screens.learnmore", "screen_learn_more"),
+}
+
+
+def load_screen(stage: str) -> Optional[Callable[[], None]]:
+    """The screen function for a stage, or None for an unknown stage."""
+    entry = SCREENS.get(stage)
+    if entry is None:
+        return None
+    module, name = entry
+    # importlib caches in sys.modules, so after the first call this is a dict lookup
+    return getattr(importlib.import_module(module), name)
@@ -1,6 +1,6 @@
 # screens/consent.py
 import streamlit as st
-from components.navigation import render_navigation
+from components.navigation import render_navigation, set_stage
 
 
 def screen_consent():
@@ -73,9 +73,10 @@ def screen_consent():
 
     colA, colB, colC = st.columns([1, 2, 1])
     with colB:
-        if st.button("I agree — start the tool →", disabled=not all_checked, use_container_width=True, type="primary"):
-            st.session_state.stage = "setup"
-            st.rerun()
+        st.button(
+            "I agree — start the tool →", disabled=not all_checked, use_container_width=True, type="primary",
+            on_click=set_stage, args=("setup",),
+        )
         if not all_checked:
             st.caption("✓ Please review and tick all consent items to continue.")
 
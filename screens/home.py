@@ -1,5 +1,7 @@
 # screens/home.py
 import streamlit as st
+from components.navigation import set_stage
+from utils import session_store, session_token
 
 def screen_home():
     # Hero section - BIG and clear
@@ -138,14 +140,35 @@ def screen_home():
         """, unsafe_allow_html=True)
     
     with col2:
-        st.markdown("""
+        if session_store.enabled():
+            promises = [
+                "No account or email required",
+                "Answers saved on the study server, under a random code in your link",
+                "Reopen the link to carry on where you left off",
+                "Finishing the results erases the saved copy",
+            ]
+        elif session_token.URL_STATE:
+            promises = [
+                "No account or email required",
+                "Answers are kept in this page's link, so only share it with each other",
+                "Nothing saved on the server",
+                "Finishing the results clears them from the link",
+            ]
+        else:
+            promises = [
+                "No account or email required",
+                "Data stays in your browser only",
+                "Nothing sent to any server",
+                "Gone when you close the tab",
+            ]
+        items = "".join(
+            f"<li style='margin-bottom: {0 if i == len(promises) - 1 else 8}px;'>{p}</li>" for i, p in enumerate(promises)
+        )
+        st.markdown(f"""
         <div style='background: #fffbeb; border: 2px solid #fde047; border-radius: 12px; padding: 25px;'>
             <h3 style='font-size: 1.1rem; margin-bottom: 15px; color: #854d0e;'>🔒 Privacy promise</h3>
             <ul style='margin: 0; padding-left: 20px; color: #334155;'>
-                <li style='margin-bottom: 8px;'>No account or email required</li>
-                <li style='margin-bottom: 8px;'>Data stays in your browser only</li>
-                <li style='margin-bottom: 8px;'>Nothing sent to any server</li>
-                <li style='margin-bottom: 0;'>Gone when you close the tab</li>
+                {items}
             </ul>
         </div>
         """, unsafe_allow_html=True)
@@ -171,10 +194,8 @@ def screen_home():
     # CTA - BIG button
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        if st.button("Begin Study →", use_container_width=True, type="primary"):
-            st.session_state.stage = "consent"
-            st.rerun()
-        st.caption("20 minutes together • No data stored • Research-based")
+        st.button("Begin Study →", use_container_width=True, type="primary", on_click=set_stage, args=("consent",))
+        st.caption("20 minutes together • " + ("Resumable" if session_store.enabled() else "No data stored") + " • Research-based")
     
     st.markdown("<div style='margin: 60px 0 20px;'></div>", unsafe_allow_html=True)
     
@@ -2,8 +2,11 @@
 import streamlit as st
 from typing import Dict, List
 
-from tasks import get_filtered_tasks, group_by_pillar
+from tasks import get_profile
 from components.navigation import render_navigation
+from state import get_responses
+from utils import session_store
+from utils.metrics import questionnaire_finished
 
 # --------- Simple pillar headers ---------
 PILLAR_INFO: Dict[str, Dict[str, str]] = {
@@ -41,7 +44,6 @@ PILLAR_INFO: Dict[str, Dict[str, str]] = {
 
 PILLAR_ORDER = ["anticipation", "identification", "decision", "monitoring", "emotional"]
 
-
 def screen_questionnaire():
     """Simple questionnaire with navigation"""
     
@@ -87,16 +89,12 @@ def screen_questionnaire():
     both_employed = st.session_state.get("is_employed_me", True) and st.session_state.get("is_employed_partner", True)
     has_pets = st.session_state.get("has_pets", False)
     has_vehicle = st.session_state.get("has_vehicle", False)
-    tasks = get_filtered_tasks(children, both_employed, has_pets, has_vehicle)
-    pillars = group_by_pillar(tasks)
-    
-    # Initialize responses dict
-    if "responses_dict" not in st.session_state:
-        st.session_state.responses_dict = {}
+    tasks, pillars = get_profile(children, both_employed, has_pets, has_vehicle)
     
     # Progress at top
     total_tasks = len(tasks)
-    completed_tasks = len(st.session_state.responses_dict)
+    st.session_state._q_header_state = _progress_counts()
+    completed_tasks = st.session_state._q_header_state[0]
     
     if total_tasks > 0:
         progress_pct = (completed_tasks / total_tasks) * 100
@@ -105,63 +103,27 @@ def screen_questionnaire():
             st.progress(progress_pct / 100)
         with col2:
             st.caption(f"**{completed_tasks} / {total_tasks}**")
+        _balance_indicator()
     
     st.markdown("<div style='margin: 30px 0;'></div>", unsafe_allow_html=True)
     
-    # Loop through pillars - all visible
-    for pillar_key in PILLAR_ORDER:
-        if pillar_key not in pillars:
-            continue
-        
-        info = PILLAR_INFO[pillar_key]
-        pillar_tasks = pillars[pillar_key]
-        
-        # Section header
-        st.markdown(f"""
-        <div style='background: linear-gradient(135deg, #eef2ff 0%, #e0e7ff 100%); 
-                    border-left: 5px solid #6366f1; padding: 20px; border-radius: 12px; margin: 40px 0 25px 0;'>
-            <h2 style='margin: 0 0 8px 0; font-size: 1.6rem;'>
-                {info['emoji']} {info['title']}
-            </h2>
-            <p style='margin: 0 0 10px 0; color: #475569; font-size: 1.05rem;'>
-                {info['description']}
-            </p>
-            <p style='margin: 0; color: #64748b; font-size: 0.95rem;'>
-                <strong>Examples:</strong> {info['example']}
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Render each task
-        for task in pillar_tasks:
-            render_task(task)
-            st.markdown("---")
-        
-        # Optional section notes
-        st.markdown("##### 📝 Notes on this section (optional)")
-        notes_key = f"notes_{pillar_key}"
-        if "notes_by_section" not in st.session_state:
-            st.session_state.notes_by_section = {}
-        
-        st.session_state.notes_by_section[pillar_key] = st.text_area(
-            "Section notes",
-            value=st.session_state.notes_by_section.get(pillar_key, ""),
-            height=70,
-            placeholder="Any thoughts or observations about this section...",
-            key=notes_key,
-            label_visibility="collapsed"
-        )
-    
-    # Convert dict to list for compatibility
-    st.session_state.responses = list(st.session_state.responses_dict.values())
+    mode = st.session_state.get("questionnaire_mode", "all")
+    if mode == "task":
+        _render_one_task(pillars)
+    elif mode == "pillar":
+        _render_one_pillar(pillars)
+    else:
+        # Loop through pillars - all visible
+        for pillar_key in PILLAR_ORDER:
+            if pillar_key in pillars:
+                _render_pillar(pillar_key, pillars[pillar_key])
     
     # Bottom navigation - ONLY FORWARD BUTTON
     st.markdown("<div style='margin: 50px 0 30px 0;'></div>", unsafe_allow_html=True)
     st.markdown("---")
     
     # Check how many completed
-    actual_completed = sum(1 for r in st.session_state.responses_dict.values() 
-                          if not r.get("not_applicable", False))
+    _, actual_completed = _progress_counts()
     
     col1, col2, col3 = st.columns([1, 2, 1])
     
@@ -175,74 +137,190 @@ def screen_questionnaire():
             )
             st.caption(f"⚠️ Please answer at least 5 tasks ({actual_completed}/5)")
         else:
-            if st.button("See results →", type="primary", use_container_width=True):
-                st.session_state.stage = "results"
-                st.rerun()
+            st.button("See results →", type="primary", use_container_width=True, on_click=_see_results)
             st.caption(f"✅ {actual_completed} tasks answered")
 
 
+def _pillar_header(pillar_key):
+    info = PILLAR_INFO[pillar_key]
+    st.markdown(f"""
+    <div style='background: linear-gradient(135deg, #eef2ff 0%, #e0e7ff 100%); 
+                border-left: 5px solid #6366f1; padding: 20px; border-radius: 12px; margin: 40px 0 25px 0;'>
+        <h2 style='margin: 0 0 8px 0; font-size: 1.6rem;'>
+            {info['emoji']} {info['title']}
+        </h2>
+        <p style='margin: 0 0 10px 0; color: #475569; font-size: 1.05rem;'>
+            {info['description']}
+        </p>
+        <p style='margin: 0; color: #64748b; font-size: 0.95rem;'>
+            <strong>Examples:</strong> {info['example']}
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def _render_pillar(pillar_key, pillar_tasks):
+    """Section header, every task in the pillar, then the section notes."""
+    _pillar_header(pillar_key)
+    
+    # Render each task
+    for task in pillar_tasks:
+        _task_block(task)
+        st.markdown("---")
+    
+    # Optional section notes
+    _section_notes(pillar_key)
+
+
+def _see_results():
+    """Leave for the results. The snapshot is built by the results screen, inside its profiled rerun."""
+    questionnaire_finished()
+    st.session_state.stage = "results"
+
+
+def _set_index(key, index):
+    st.session_state[key] = index
+
+
+def _wizard_buttons(index, last, key):
+    """Back / Next pair for the step-by-step layouts; clicks move st.session_state[f"{key}_index"]."""
+    col_back, _, col_next = st.columns([1, 2, 1])
+    with col_back:
+        st.button("← Back", key=f"{key}_back", disabled=index <= 0, use_container_width=True,
+                  on_click=_set_index, args=(f"{key}_index", index - 1))
+    with col_next:
+        st.button("Next →", key=f"{key}_next", disabled=index >= last, use_container_width=True,
+                  on_click=_set_index, args=(f"{key}_index", index + 1))
+
+
+def _render_one_pillar(pillars):
+    """Step-by-step layout: one pillar per page, driven by q_section_index."""
+    keys = [k for k in PILLAR_ORDER if k in pillars]
+    if not keys:
+        return
+    index = min(max(st.session_state.get("q_section_index", 0), 0), len(keys) - 1)
+    st.caption(f"Section {index + 1} of {len(keys)}")
+    _render_pillar(keys[index], pillars[keys[index]])
+    
+    _wizard_buttons(index, len(keys) - 1, "q_section")
+
+
+def _render_one_task(pillars):
+    """Step-by-step layout: one task per page, driven by q_task_index.
+    
+    q_section_index is kept in step so switching layout lands on the same section.
+    """
+    steps = [(k, t) for k in PILLAR_ORDER for t in pillars.get(k, [])]
+    if not steps:
+        return
+    index = min(max(st.session_state.get("q_task_index", 0), 0), len(steps) - 1)
+    pillar_key, task = steps[index]
+    st.session_state.q_section_index = [k for k in PILLAR_ORDER if k in pillars].index(pillar_key)
+    
+    info = PILLAR_INFO[pillar_key]
+    st.caption(f"{info['emoji']} **{info['title']}** · Task {index + 1} of {len(steps)}")
+    _task_block(task)
+    
+    # Last task of a pillar: offer that section's notes before moving on
+    if index == len(steps) - 1 or steps[index + 1][0] != pillar_key:
+        st.markdown("---")
+        _section_notes(pillar_key)
+    
+    # Up next: the next definition is already resolved, so show it now
+    if index + 1 < len(steps):
+        upcoming = steps[index + 1][1]
+        st.caption(f"Up next: **{upcoming.name}**" + (f" — {upcoming.definition}" if upcoming.definition else ""))
+    
+    _wizard_buttons(index, len(steps) - 1, "q_task")
+
+
+def _progress_counts():
+    """(tasks touched, tasks answered and not N/A) — what the progress bar and results gate show."""
+    return get_responses().counts()
+
+
+def _balance_indicator():
+    """Invisible-work split so far, read from the running totals.
+
+    Redrawn on full reruns only (a first answer, an N/A toggle, navigation), so
+    slider drags in between don't cost a rerun of the whole page.
+    """
+    totals = get_responses().totals
+    if totals.n == 0:
+        st.caption("⚖️ The current balance appears once you answer a task.")
+        return
+    a_pct, b_pct = totals.shares()
+    st.markdown(f"""
+    <div style='display: flex; height: 22px; border-radius: 6px; overflow: hidden;
+                font-size: 0.8rem; font-weight: 600; color: white;'>
+        <div style='background-color: #0072B2; width: {a_pct}%; padding-left: 8px;'>A {a_pct}%</div>
+        <div style='background-color: #E69F00; width: {b_pct}%; padding-right: 8px; text-align: right;'>{b_pct}% B</div>
+    </div>
+    """, unsafe_allow_html=True)
+    st.caption(f"⚖️ Current balance across {totals.n} task{'s' if totals.n != 1 else ''} — it will settle as you go.")
+
+
+@st.fragment
+def _task_block(task):
+    """One task as its own fragment, so a slider drag reruns only this block."""
+    render_task(task)
+    session_store.checkpoint()
+    # The progress bar and "See results" gate sit outside this fragment and
+    # Streamlit can't rerun a sibling fragment, so escalate to one full rerun
+    # only when the counts they display have changed.
+    if _progress_counts() != st.session_state.get("_q_header_state"):
+        st.rerun()
+
+
+@st.fragment
+def _section_notes(pillar_key):
+    """Section notes as a fragment, so typing doesn't rerun the whole questionnaire."""
+    st.markdown("##### 📝 Notes on this section (optional)")
+    notes_key = f"notes_{pillar_key}"
+    if "notes_by_section" not in st.session_state:
+        st.session_state.notes_by_section = {}
+    
+    st.session_state.notes_by_section[pillar_key] = st.text_area(
+        "Section notes",
+        value=st.session_state.notes_by_section.get(pillar_key, ""),
+        height=70,
+        placeholder="Any thoughts or observations about this section...",
+        key=notes_key,
+        label_visibility="collapsed"
+    )
+    session_store.checkpoint()
+
+
 # Callback functions to update state
 def update_responsibility(task_id):
     """Update responsibility when slider changes"""
     value = st.session_state[f"{task_id}_resp"]
-    if task_id not in st.session_state.responses_dict:
-        st.session_state.responses_dict[task_id] = {
-            "task_id": task_id,
-            "responsibility": 50,
-            "burden": 3,
-            "fairness": 3,
-            "not_applicable": False,
-        }
-    st.session_state.responses_dict[task_id]["responsibility"] = value
+    get_responses().set(task_id, responsibility=value)
 
 
 def update_burden(task_id):
     """Update burden when slider changes"""
     value = st.session_state[f"{task_id}_burden"]
-    if task_id not in st.session_state.responses_dict:
-        st.session_state.responses_dict[task_id] = {
-            "task_id": task_id,
-            "responsibility": 50,
-            "burden": 3,
-            "fairness": 3,
-            "not_applicable": False,
-        }
-    st.session_state.responses_dict[task_id]["burden"] = value
+    get_responses().set(task_id, burden=value)
 
 
 def update_fairness(task_id):
     """Update fairness when slider changes"""
     value = st.session_state[f"{task_id}_fair"]
-    if task_id not in st.session_state.responses_dict:
-        st.session_state.responses_dict[task_id] = {
-            "task_id": task_id,
-            "responsibility": 50,
-            "burden": 3,
-            "fairness": 3,
-            "not_applicable": False,
-        }
-    st.session_state.responses_dict[task_id]["fairness"] = value
+    get_responses().set(task_id, fairness=value)
 
 
 def update_not_applicable(task_id):
     """Update N/A when checkbox changes"""
     value = st.session_state[f"{task_id}_na"]
-    if task_id not in st.session_state.responses_dict:
-        st.session_state.responses_dict[task_id] = {
-            "task_id": task_id,
-            "responsibility": 50,
-            "burden": 3,
-            "fairness": 3,
-            "not_applicable": False,
-        }
-    st.session_state.responses_dict[task_id]["not_applicable"] = value
+    get_responses().set(task_id, not_applicable=value)
 
 
 def render_task(task):
     """Render task with on_change callbacks for smooth updates"""
     
     # Get existing response or use defaults
-    existing = st.session_state.responses_dict.get(task.id, {
+    existing = get_responses().get(task.id, {
         "task_id": task.id,
         "responsibility": 50,
         "burden": 3,
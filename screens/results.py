@@ -1,15 +1,20 @@
 # screens/results.py
+import csv
+import io
 import streamlit as st
 import streamlit.components.v1 as components
-import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
 from typing import Dict, List
 
-from state import reset_state
-from tasks import TASK_LOOKUP
-from models import Response
-from logic import Calculator
+from state import get_responses, get_results, reset_state
+from logic import REASON_QUESTION, REASON_TEXT
+from results_snapshot import EXPORT_HEADER, ResultsSnapshot
+from scoring_models import get_model
+from components.navigation import finish, set_stage
+from utils import session_store
+from utils.cache import LRUCache, fingerprint
+from utils.metrics import count_export
+from utils.profiling import span
 
 A_COL = "#0072B2"  # Okabe–Ito blue (Partner A)
 B_COL = "#E69F00"  # Okabe–Ito orange (Partner B)
@@ -25,23 +30,6 @@ PILLAR_LABELS = {
 }
 
 # ---------- utils ----------
-def _to_response_objects(response_dicts):
-    objs = []
-    for r in response_dicts:
-        task = TASK_LOOKUP.get(r["task_id"])
-        if not task:
-            continue
-        objs.append(
-            Response(
-                task=task,
-                responsibility=int(r["responsibility"]),
-                burden=int(r["burden"]),
-                fairness=int(r["fairness"]),
-                not_applicable=bool(r.get("not_applicable", False)),
-            )
-        )
-    return objs
-
 def _ensure_all_pillars(scores: Dict[str, List[float]]) -> Dict[str, List[float]]:
     """Guarantee all five pillars exist; fill missing with zeros."""
     out = {}
@@ -51,49 +39,24 @@ def _ensure_all_pillars(scores: Dict[str, List[float]]) -> Dict[str, List[float]
             out[k] = [0.0, 0.0]
     return out
 
-def _plain_reason(raw: str) -> str:
-    s = raw or ""
-    s = s.replace("Responsibility imbalance (≥30 pts)", "One partner is handling most of this")
-    s = s.replace("High burden", "This feels particularly draining")
-    s = s.replace("Low perceived fairness", "This doesn't feel fair to one or both partners")
-    return s
-
-def _reason_to_question(reasons: str) -> str:
-    """Convert a hotspot reason string into a conversation question."""
-    if not reasons:
-        return "What's one small thing that might make this easier?"
-    
-    r_lower = reasons.lower()
-    
-    # Priority combo
-    if "priority" in r_lower and "imbalanced" in r_lower and "unfair" in r_lower:
-        return "This feels both imbalanced and unfair. What would need to change for it to feel better?"
-    
-    # Imbalance
-    if "imbalance" in r_lower or "handling most" in r_lower:
-        return "How did this pattern develop? Would a different split work better?"
-    
-    # High burden
-    if "draining" in r_lower or "burden" in r_lower:
-        return "What makes this feel so heavy? Is it the task itself or the mental energy around it?"
-    
-    # Fairness
-    if "fair" in r_lower:
-        return "What would make this feel fairer to both of you?"
-    
-    # Default
-    return "What's one small thing that might make this easier?"
-
 def _add_notes_section(page_name: str):
     """Add optional notes section with clear privacy messaging"""
     with st.expander("📝 Add notes from your conversation (optional)"):
-        st.info("""
-        **Privacy promise:** 
-        - These notes are ONLY stored in your browser's temporary session
-        - They're included in your CSV export if you download it
-        - Nothing is sent to any server or saved anywhere else
-        - When you close this browser tab, they're gone forever
-        """)
+        if session_store.enabled():
+            st.info("""
+            **Privacy promise:** 
+            - These notes are saved with your answers on the study server, under the code in your link
+            - They're included in your CSV export if you download it
+            - Pressing "Finish" on the last page erases the saved copy
+            """)
+        else:
+            st.info("""
+            **Privacy promise:** 
+            - These notes are ONLY stored in your browser's temporary session
+            - They're included in your CSV export if you download it
+            - Nothing is sent to any server or saved anywhere else
+            - When you close this browser tab, they're gone forever
+            """)
         
         # Initialise notes dict if it doesn't exist
         if "results_notes" not in st.session_state:
@@ -108,15 +71,35 @@ def _add_notes_section(page_name: str):
             height=120,
             placeholder="Jot down insights, agreements, or things to try...",
             key=f"note_{page_name}",
-            help="These notes are only stored temporarily in your browser and included in your export."
+            help="These notes are included in your export." + ("" if session_store.enabled() else " They're only stored temporarily in your browser.")
         )
         
         # Save note to session state
         st.session_state.results_notes[page_name] = note
 
 # ---------- visuals ----------
+# Figures are cached keyed on their inputs and the theme colours, so repeat
+# renders skip figure construction entirely. The cached figure is shared by
+# every session and handed to st.plotly_chart as is: never mutate it.
+_FIGURE_CACHE = LRUCache(maxsize=256)
+
+def figure_cache_stats() -> Dict[str, int]:
+    """Hit/miss counters for the results figure cache."""
+    return _FIGURE_CACHE.stats()
+
+def _cached_figure(key, build) -> go.Figure:
+    # A Figure rather than its dict: st.plotly_chart re-validates plain dicts
+    # property by property, which costs more than building the figure
+    return _FIGURE_CACHE.get_or_compute((A_COL, B_COL) + key, build)
+
 def comparison_bars(a_val: int, b_val: int, max_val: int = 100, label_a="Partner A", label_b="Partner B"):
     """Simple horizontal comparison bars"""
+    return _cached_figure(
+        ("comparison_bars", a_val, b_val, max_val, label_a, label_b),
+        lambda: _build_comparison_bars(a_val, b_val, max_val, label_a, label_b),
+    )
+
+def _build_comparison_bars(a_val, b_val, max_val, label_a, label_b) -> go.Figure:
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
@@ -143,83 +126,100 @@ def comparison_bars(a_val: int, b_val: int, max_val: int = 100, label_a="Partner
 
 def pillar_grouped_bar(pillar_scores: Dict[str, List[float]]) -> go.Figure:
     scores = _ensure_all_pillars(pillar_scores)
-    rows = []
-    for k in PILLAR_ORDER:
-        a, b = scores[k]
-        rows.append({"Pillar": PILLAR_LABELS[k], "Partner": "A", "Score": a})
-        rows.append({"Pillar": PILLAR_LABELS[k], "Partner": "B", "Score": b})
-    df = pd.DataFrame(rows)
-    df["Pillar"] = pd.Categorical(df["Pillar"], categories=[PILLAR_LABELS[k] for k in PILLAR_ORDER], ordered=True)
-
-    fig = px.bar(
-        df.sort_values("Pillar"),
-        x="Pillar", y="Score", color="Partner",
-        barmode="group", template="simple_white",
-        color_discrete_map={"A": A_COL, "B": B_COL},
-    )
+    values = tuple(tuple(scores[k]) for k in PILLAR_ORDER)
+    return _cached_figure(("pillar_grouped_bar", values), lambda: _build_pillar_grouped_bar(values))
+
+def _build_pillar_grouped_bar(values) -> go.Figure:
+    # Two grouped traces in PILLAR_ORDER; same look as the old px.bar version
+    labels = [PILLAR_LABELS[k] for k in PILLAR_ORDER]
+    fig = go.Figure()
+    for i, (partner, colour) in enumerate((("A", A_COL), ("B", B_COL))):
+        fig.add_trace(go.Bar(
+            x=labels,
+            y=[v[i] for v in values],
+            name=partner,
+            legendgroup=partner,
+            offsetgroup=partner,
+            marker=dict(color=colour),
+            hovertemplate="Partner=" + partner + "<br>Pillar=%{x}<br>Score=%{y}<extra></extra>",
+        ))
     fig.update_layout(
+        barmode="group",
+        template="simple_white",
         height=300,
         margin=dict(l=10, r=10, t=10),
-        legend=dict(orientation="h", y=1.08, x=0.0),
+        legend=dict(orientation="h", y=1.08, x=0.0, title=dict(text="Partner")),
     )
-    fig.update_xaxes(showgrid=False, ticks="")
+    fig.update_xaxes(showgrid=False, ticks="", title="Pillar")
     fig.update_yaxes(gridcolor=GRID, zeroline=False, title="")
     return fig
 
 # ---------- CSV export ----------
-def _export_csv(responses, results, hotspots):
-    df = pd.DataFrame(responses)
-    csv = df.to_csv(index=False)
-
-    summary = pd.DataFrame(
-        {
-            "Metric": [
-                "Partner A burden (0–100)",
-                "Partner B burden (0–100)",
-                "Partner A invisible share (%)",
-                "Partner B invisible share (%)",
-            ],
-            "Value": [
-                results["my_burden"],
-                results["partner_burden"],
-                results["my_share_pct"],
-                results["partner_share_pct"],
-            ],
-        }
-    )
-    csv += "\n\nSUMMARY\n" + summary.to_csv(index=False)
-
-    p = _ensure_all_pillars(results.get("pillar_scores", {}))
-    p_rows = [{"Pillar": PILLAR_LABELS[k], "Partner A sum": round(v[0], 2), "Partner B sum": round(v[1], 2)} for k, v in p.items()]
-    csv += "\n\nPILLAR BREAKDOWN\n" + pd.DataFrame(p_rows).to_csv(index=False)
-
-    if hotspots:
-        hs_rows = [{"Task": h.get("task", ""), "Why it matters": _plain_reason(h.get("reasons", "")), "Question to discuss": _reason_to_question(h.get("reasons", ""))} for h in hotspots]
-        csv += "\n\nCONVERSATION STARTERS\n" + pd.DataFrame(hs_rows).to_csv(index=False)
+# Built only when someone actually clicks Export, then kept for repeat clicks
+_EXPORT_CACHE = LRUCache(maxsize=128)
+
+def _write_section(out, title, header, rows):
+    """Write one titled CSV block (the first block has no title)."""
+    if title:
+        out.write(f"\n\n{title}\n")
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(header)
+    writer.writerows(rows)
+
+def _export_csv(snap: ResultsSnapshot, questionnaire_notes, results_notes) -> bytes:
+    buf = io.BytesIO()
+    out = io.TextIOWrapper(buf, encoding="utf-8", newline="")
+
+    _write_section(out, None, EXPORT_HEADER, snap.export_rows)
+
+    _write_section(out, "SUMMARY", ["Metric", "Value"], [
+        ["Partner A burden (0–100)", snap.my_burden],
+        ["Partner B burden (0–100)", snap.partner_burden],
+        ["Partner A invisible share (%)", snap.my_share_pct],
+        ["Partner B invisible share (%)", snap.partner_share_pct],
+        ["Scoring model", snap.model],
+    ])
+
+    p = _ensure_all_pillars(snap.pillar_scores())
+    _write_section(out, "PILLAR BREAKDOWN", ["Pillar", "Partner A sum", "Partner B sum"],
+                   ([PILLAR_LABELS[k], round(v[0], 2), round(v[1], 2)] for k, v in p.items()))
+
+    if snap.flagged:
+        _write_section(out, "CONVERSATION STARTERS", ["Task", "Why it matters", "Question to discuss"],
+                       ([h.task, REASON_TEXT[h.reason_code], REASON_QUESTION[h.reason_code]] for h in snap.ranked_hotspots()))
 
     # Include QUESTIONNAIRE section notes (from when they filled it in)
-    questionnaire_notes = st.session_state.get("notes_by_section", {})
-    if any(v.strip() for v in questionnaire_notes.values()):
-        csv += "\n\nQUESTIONNAIRE SECTION NOTES\n"
-        notes_rows = []
-        for section, note in questionnaire_notes.items():
-            if note.strip():
-                notes_rows.append({"Section": section, "Notes": note.strip()})
-        if notes_rows:
-            csv += pd.DataFrame(notes_rows).to_csv(index=False)
+    notes_rows = [[section, note.strip()] for section, note in questionnaire_notes.items() if note.strip()]
+    if notes_rows:
+        _write_section(out, "QUESTIONNAIRE SECTION NOTES", ["Section", "Notes"], notes_rows)
 
     # Include RESULTS conversation notes (from results pages)
-    results_notes = st.session_state.get("results_notes", {})
-    if any(v.strip() for v in results_notes.values()):
-        csv += "\n\nRESULTS CONVERSATION NOTES\n"
-        notes_rows = []
-        for page, note in results_notes.items():
-            if note.strip():
-                notes_rows.append({"Page": page, "Notes": note.strip()})
-        if notes_rows:
-            csv += pd.DataFrame(notes_rows).to_csv(index=False)
+    notes_rows = [[page, note.strip()] for page, note in results_notes.items() if note.strip()]
+    if notes_rows:
+        _write_section(out, "RESULTS CONVERSATION NOTES", ["Page", "Notes"], notes_rows)
+
+    out.flush()
+    out.detach()
+    return buf.getvalue()
 
-    return csv
+def _lazy_export(snap: ResultsSnapshot):
+    """Return a no-argument callable for st.download_button that builds the CSV on click.
+
+    Streamlit runs the callable on its own thread without session state, so
+    the notes are captured here; the snapshot is immutable and needs no copy.
+    The CSV itself is cached on the answers' content hash plus the notes.
+    """
+    questionnaire_notes = dict(st.session_state.get("notes_by_section", {}))
+    results_notes = dict(st.session_state.get("results_notes", {}))
+
+    def export() -> bytes:
+        with span("export"):
+            return _export_csv(snap, questionnaire_notes, results_notes)
+
+    def build() -> bytes:
+        key = fingerprint(snap.key, questionnaire_notes, results_notes)
+        return _EXPORT_CACHE.get_or_compute(key, export)
+    return build
 
 # ---------- conversation prep screen ----------
 def screen_before_results():
@@ -227,9 +227,7 @@ def screen_before_results():
     # Top-right Home button
     _pre_l, _pre_r = st.columns([6, 1])
     with _pre_r:
-        if st.button("Home", use_container_width=True, key="pre_home"):
-            st.session_state.stage = "home"
-            st.rerun()
+        st.button("Home", use_container_width=True, key="pre_home", on_click=set_stage, args=("home",))
 
     st.title("💬 Before You See Your Results")
     st.caption("Quick prep for a productive conversation")
@@ -260,18 +258,16 @@ def screen_before_results():
     
     col1, col2 = st.columns(2)
     with col1:
-        if st.button("← Back", use_container_width=True):
-            st.session_state.stage = "questionnaire"
-            st.rerun()
+        st.button("← Back", use_container_width=True, on_click=set_stage, args=("questionnaire",))
     with col2:
-        if st.button("Show results →", use_container_width=True, type="primary"):
-            st.session_state.results_page = 1
-            st.session_state.stage = "results_main"
-            st.rerun()
+        st.button(
+            "Show results →", use_container_width=True, type="primary",
+            on_click=set_stage, args=("results_main",), kwargs={"results_page": 1},
+        )
 
 # ---------- PAGINATED RESULTS SECTIONS ----------
 
-def _results_page_1_share(results, hotspots):
+def _results_page_1_share(snap: ResultsSnapshot):
     """Page 1: The Big Picture - Who's Carrying What"""
     st.title("📊 Your Results: The Big Picture")
     st.caption("💙 Remember: This is about understanding, not blame.")
@@ -299,11 +295,21 @@ def _results_page_1_share(results, hotspots):
     st.markdown("### 🔍 Your Household's Snapshot")
     st.markdown("Here's what your responses show about mental load distribution right now.")
     
-    a_share, b_share = results["my_share_pct"], results["partner_share_pct"]
+    a_share, b_share = snap.my_share_pct, snap.partner_share_pct
     
     # Share percentages
     st.markdown("**Mental load share (who's carrying the invisible work):**")
     st.plotly_chart(comparison_bars(a_share, b_share, 100, "Partner A", "Partner B"), use_container_width=True)
+    iv = snap.intervals
+    if iv.tasks:
+        lo, hi = iv.my_share_pct
+        st.caption(
+            f"🎲 Resampling your {iv.tasks} answered tasks {iv.resamples:,} times puts Partner A's share between "
+            f"{lo:.0f}% and {hi:.0f}% ({iv.level:.0%} of resamples). "
+            + ("That range includes 50%, so on these answers the split isn't clearly different from an even one."
+               if lo <= 50 <= hi else
+               "That range leaves out 50%, so the imbalance isn't just down to which tasks you happened to rate.")
+        )
     
     # Research context for their numbers
     diff = abs(a_share - b_share)
@@ -329,7 +335,7 @@ def _results_page_1_share(results, hotspots):
     _add_notes_section("Page 1: The Big Picture")
 
 
-def _results_page_2_burden(results):
+def _results_page_2_burden(snap: ResultsSnapshot):
     """Page 2: How Heavy Does It Feel"""
     st.title("📊 How Heavy Does It Feel?")
     st.caption("💙 Understanding the emotional weight of invisible work")
@@ -356,13 +362,7 @@ def _results_page_2_burden(results):
                 )
     
     # --- Added: super dummy-friendly explainer of how the score is made and why it makes sense ---
-    st.success(
-        "**In plain terms:** For each task we combine three things — (1) who mostly carries it, "
-        "(2) how draining it feels, and (3) how fair it feels. "
-        "If you carry more of a task *and* it feels heavy or unfair, your Burden score goes up. "
-        "We add that across tasks to show each person’s overall mental load. This makes sense because "
-        "both responsibility and how it feels day-to-day shape the real ‘weight’ you experience."
-    )
+    st.success(get_model(snap.model).explainer)
     
     st.markdown("""
     **Personal burden (0-100):** This isn't about how much time tasks take - it's about how draining 
@@ -374,8 +374,18 @@ def _results_page_2_burden(results):
     - Carrying responsibility without recognition
     """)
     
-    a_burden, b_burden = results["my_burden"], results["partner_burden"]
+    a_burden, b_burden = snap.my_burden, snap.partner_burden
     st.plotly_chart(comparison_bars(a_burden, b_burden, 100, "Partner A", "Partner B"), use_container_width=True)
+    iv = snap.intervals
+    if iv.tasks:
+        lo, hi = iv.burden_gap
+        st.caption(
+            f"🎲 Across {iv.resamples:,} resamples of your answered tasks, the burden gap (A − B) runs from "
+            f"{lo:+.0f} to {hi:+.0f} points ({iv.level:.0%} of resamples). "
+            + ("It includes zero, so the two burden levels aren't clearly different on these answers."
+               if lo <= 0 <= hi else
+               "It doesn't cross zero, so the difference holds up whichever tasks you happened to rate.")
+        )
     
     # Research context
     burden_diff = abs(a_burden - b_burden)
@@ -403,7 +413,7 @@ def _results_page_2_burden(results):
     _add_notes_section("Page 2: How Heavy Does It Feel")
 
 
-def _results_page_3_pillars(results):
+def _results_page_3_pillars(snap: ResultsSnapshot):
     """Page 3: The Five Pillars"""
     st.title("📊 Where the Mental Load Lives")
     st.caption("💙 Breaking down the five types of invisible work")
@@ -435,8 +445,7 @@ def _results_page_3_pillars(results):
         **Key finding:** The monitoring and anticipation pillars are often most invisible to the partner not doing them.
         """)
     
-    pillar_scores = _ensure_all_pillars(results.get("pillar_scores", {}))
-    st.plotly_chart(pillar_grouped_bar(pillar_scores), use_container_width=True)
+    st.plotly_chart(pillar_grouped_bar(snap.pillar_scores()), use_container_width=True)
     
     # Discussion prompt
     st.markdown("---")
@@ -453,7 +462,7 @@ def _results_page_3_pillars(results):
     _add_notes_section("Page 3: The Five Pillars")
 
 
-def _results_page_4_hotspots(hotspots):
+def _results_page_4_hotspots(snap: ResultsSnapshot):
     """Page 4: Conversation Starters - REDUCED TO TOP 5 ONLY"""
     st.title("📊 Conversation Starters")
     st.caption("💙 Focus on just a few key topics")
@@ -471,31 +480,31 @@ def _results_page_4_hotspots(hotspots):
     **We've focused on just the top few areas** to keep your conversation manageable and productive.
     """)
     
-    if hotspots:
-        # LIMIT TO TOP 5 MAXIMUM
-        top_hotspots = hotspots[:5]
+    # Top 5 maximum, picked when the snapshot was built
+    top_hotspots = snap.hotspots
+    if top_hotspots:
         
         st.info(f"📌 We've identified {len(top_hotspots)} priority {'area' if len(top_hotspots) == 1 else 'areas'} to discuss. Pick one or two to start with.")
         
         # Show all selected hotspots fully expanded
         for i, h in enumerate(top_hotspots, 1):
             with st.container():
-                st.markdown(f"### {i}. {h.get('task', 'Task')}")
+                st.markdown(f"### {i}. {h.task}")
                 
                 col1, col2 = st.columns([1, 1])
                 with col1:
-                    plain = _plain_reason(h.get("reasons", ""))
+                    plain = REASON_TEXT[h.reason_code]
                     st.markdown(f"**Why it came up:** {plain}")
                 
                 with col2:
-                    question = _reason_to_question(h.get("reasons", ""))
+                    question = REASON_QUESTION[h.reason_code]
                     st.markdown(f"**💭 Discuss:** {question}")
                 
                 st.markdown("")
         
         # Note about focusing on just a few
-        if len(hotspots) > 5:
-            st.info(f"💡 **Note:** There were {len(hotspots)} total areas flagged, but we're showing only the top 5 to help you focus. You can always revisit this tool to explore others later.")
+        if snap.hotspot_count > len(top_hotspots):
+            st.info(f"💡 **Note:** There were {snap.hotspot_count} total areas flagged, but we're showing only the top 5 to help you focus. You can always revisit this tool to explore others later.")
     else:
         st.success("""
         🎉 **No major conversation starters detected!** 
@@ -511,7 +520,7 @@ def _results_page_4_hotspots(hotspots):
     _add_notes_section("Page 4: Conversation Starters")
 
 
-def _results_page_5_action():
+def _results_page_5_action(snap: ResultsSnapshot):
     """Page 5: What's Next"""
     st.title("📊 What's Next")
     st.caption("💙 Building from strengths and trying small experiments")
@@ -526,14 +535,8 @@ def _results_page_5_action():
     only focusing on problems.
     """)
     
-    # Find areas of relative balance
-    balanced_areas = []
-    for task_response in st.session_state.responses:
-        resp_diff = abs(task_response.get("responsibility", 50) - 50)
-        if resp_diff <= 20 and task_response.get("burden", 50) < 60:
-            task = TASK_LOOKUP.get(task_response["task_id"])
-            if task:
-                balanced_areas.append(task.name)
+    # Areas of relative balance, found when the snapshot was built
+    balanced_areas = snap.strengths
     
     if balanced_areas:
         st.success(f"**Areas showing good balance:** {', '.join(balanced_areas[:5])}")
@@ -583,18 +586,18 @@ def _results_page_5_action():
 
 
 # ---------- main results navigation ----------
+def _turn_page(delta):
+    st.session_state.results_page = min(max(st.session_state.results_page + delta, 1), 5)
+
 def screen_results_main():
     """Main results with pagination"""
 
-    if not st.session_state.get("responses"):
+    if not get_responses():
         st.warning("No results yet. Please complete the questionnaire first.")
         return
 
-    # Compute results once
-    response_objs = _to_response_objects(st.session_state.responses)
-    calc = Calculator(response_objs)
-    results = calc.compute()
-    hotspots = Calculator.detect_hotspots(response_objs)
+    # Built by "See results →"; rebuilt here only if the answers changed since
+    snap = get_results()
 
     # Initialise page if not set
     if "results_page" not in st.session_state:
@@ -608,38 +611,30 @@ def screen_results_main():
     with col1:
         # Previous button
         if current_page > 1:
-            if st.button("← Previous", key="top_prev", use_container_width=True):
-                st.session_state.results_page -= 1
-                st.rerun()
+            st.button("← Previous", key="top_prev", use_container_width=True, on_click=_turn_page, args=(-1,))
         else:
             st.button("← Previous", key="top_prev_disabled", disabled=True, use_container_width=True)
 
     with col2:
         # Next or Finish button
         if current_page < 5:
-            if st.button("Next →", key="top_next", use_container_width=True, type="primary"):
-                st.session_state.results_page += 1
-                st.rerun()
+            st.button("Next →", key="top_next", use_container_width=True, type="primary", on_click=_turn_page, args=(1,))
         else:
-            if st.button("🏠 Finish", key="top_finish", use_container_width=True, type="primary"):
-                st.session_state.stage = "home"
-                st.rerun()
+            st.button("🏠 Finish", key="top_finish", use_container_width=True, type="primary", on_click=finish)
 
     with col3:
         # NEW: Home button (Escape option)
-        if st.button("Home", key="top_home", use_container_width=True):
-            st.session_state.stage = "home"
-            st.rerun()
+        st.button("Home", key="top_home", use_container_width=True, on_click=set_stage, args=("home",))
 
     with col4:
         # Export button stays far right
-        csv_data = _export_csv(st.session_state.responses, results, hotspots)
         st.download_button(
             "📥 Export",
-            data=csv_data,
+            data=_lazy_export(snap),
             file_name="mental_load_results.csv",
             mime="text/csv",
             use_container_width=True,
+            on_click=count_export,
             key="top_export"
         )
 
@@ -649,15 +644,15 @@ def screen_results_main():
 
     # ----- RENDER CURRENT PAGE -----
     if current_page == 1:
-        _results_page_1_share(results, hotspots)
+        _results_page_1_share(snap)
     elif current_page == 2:
-        _results_page_2_burden(results)
+        _results_page_2_burden(snap)
     elif current_page == 3:
-        _results_page_3_pillars(results)
+        _results_page_3_pillars(snap)
     elif current_page == 4:
-        _results_page_4_hotspots(hotspots)
+        _results_page_4_hotspots(snap)
     elif current_page == 5:
-        _results_page_5_action()
+        _results_page_5_action(snap)
 
     # ----- NOTES COUNT -----
     questionnaire_notes = st.session_state.get("notes_by_section", {})
@@ -1,5 +1,7 @@
 # screens/setup.py
+import time
 import streamlit as st
+from state import new_responses
 from tasks import get_filtered_tasks
 from components.navigation import render_navigation
 
@@ -37,16 +39,10 @@ def screen_setup():
     col1, col2, col3, col4 = st.columns([1, 1, 2, 3])
     
     with col1:
-        if st.button("➖", key="children_minus", use_container_width=True):
-            if st.session_state.children > 0:
-                st.session_state.children -= 1
-                st.rerun()
+        st.button("➖", key="children_minus", use_container_width=True, on_click=change_children, args=(-1,))
     
     with col2:
-        if st.button("➕", key="children_plus", use_container_width=True):
-            if st.session_state.children < 10:
-                st.session_state.children += 1
-                st.rerun()
+        st.button("➕", key="children_plus", use_container_width=True, on_click=change_children, args=(1,))
     
     with col3:
         # Display the current number prominently
@@ -114,6 +110,27 @@ def screen_setup():
         )
         st.session_state.has_vehicle = has_vehicle
     
+    st.markdown("<div style='margin: 25px 0;'></div>", unsafe_allow_html=True)
+    
+    # SECTION 4: Questionnaire layout
+    st.markdown("### 🧭 Questionnaire layout")
+    layout_labels = {
+        "all": "All tasks on one page",
+        "pillar": "One section at a time",
+        "task": "One task at a time (best on phones)",
+    }
+    layouts = list(layout_labels)
+    current_layout = st.session_state.get("questionnaire_mode", "all")
+    questionnaire_mode = st.radio(
+        "Questionnaire layout",
+        options=layouts,
+        index=layouts.index(current_layout) if current_layout in layouts else 0,
+        format_func=layout_labels.get,
+        horizontal=True,
+        label_visibility="collapsed",
+    )
+    st.session_state.questionnaire_mode = questionnaire_mode
+    
     st.markdown("<div style='margin: 30px 0 20px;'></div>", unsafe_allow_html=True)
     
     # Show task count
@@ -128,10 +145,19 @@ def screen_setup():
     col1, col2, col3 = st.columns([1, 2, 1])
     
     with col2:
-        if st.button("Start questionnaire →", type="primary", use_container_width=True):
-            # Reset questionnaire state
-            st.session_state.responses_dict = {}
-            st.session_state.responses = []
-            st.session_state.notes_by_section = {}
-            st.session_state.stage = "questionnaire"
-            st.rerun()
\ No newline at end of file
+        st.button("Start questionnaire →", type="primary", use_container_width=True, on_click=start_questionnaire)
+
+
+def change_children(delta):
+    """➖/➕ callback, keeping the count between 0 and 10"""
+    st.session_state.children = min(max(st.session_state.children + delta, 0), 10)
+
+
+def start_questionnaire():
+    """Reset questionnaire state and move on"""
+    st.session_state.responses = new_responses()
+    st.session_state.notes_by_section = {}
+    st.session_state.q_section_index = 0
+    st.session_state.q_task_index = 0
+    st.session_state.questionnaire_start_time = time.time()
+    st.session_state.stage = "questionnaire"
@@ -1,5 +1,12 @@
 import streamlit as st
 
+from hotspot_rules import current_rules
+from response_matrix import ResponseMatrix
+from results_snapshot import ResultsSnapshot, snapshot_for
+from scoring_models import ARM_PARAM, ScoringModel, model_for
+from tasks import catalog
+from utils.profiling import span
+
 def init_state():
     defaults = dict(
         stage="home",
@@ -10,10 +17,13 @@ def init_state():
         is_employed_partner=True,
         has_pets=False, 
         has_vehicle=False, 
+        # research: ?arm=<arm> picks the study arm's scoring model (see scoring_models.py)
+        study_arm=st.query_params.get(ARM_PARAM),
         # questionnaire progress
+        questionnaire_mode="all",   # "all" | "pillar" | "task"
         q_section_index=0,
         q_task_index=0,
-        responses=[],
+        responses=None,             # ResponseMatrix, see get_responses()
         notes_by_section={},
         questionnaire_start_time=None,
     )
@@ -21,6 +31,35 @@ def init_state():
         if k not in st.session_state:
             st.session_state[k] = v
 
+def new_responses() -> ResponseMatrix:
+    """An empty answer matrix for the current task catalogue."""
+    cat = catalog()
+    return ResponseMatrix.empty(cat.tasks, cat.version)
+
+def get_responses() -> ResponseMatrix:
+    """This session's answers, created on first use and re-based if the catalogue was reloaded."""
+    responses = st.session_state.get("responses")
+    cat = catalog()
+    if responses is None:
+        responses = st.session_state.responses = new_responses()
+    elif responses.version != cat.version:
+        responses = st.session_state.responses = responses.rebase(cat.tasks, cat.version)
+    return responses
+
+def scoring_model() -> ScoringModel:
+    return model_for(st.session_state.get("study_arm"))
+
+def get_results() -> ResultsSnapshot:
+    """Results for this session's answers, rebuilt only if they (or the hotspot rules) changed since the last build."""
+    responses = get_responses()
+    model = scoring_model()
+    stamp = (responses.uid, responses.revision, current_rules().version, model.name)
+    if st.session_state.get("_results_stamp") != stamp:
+        with span("calculator"):
+            st.session_state.results_snapshot = snapshot_for(responses, model)
+        st.session_state._results_stamp = stamp
+    return st.session_state.results_snapshot
+
 def reset_state():
     keys = list(st.session_state.keys())
     for k in keys:
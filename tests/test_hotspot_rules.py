@@ -0,0 +1,49 @@
+# tests/test_hotspot_rules.py
+import numpy as np
+import pytest
+
+from hotspot_rules import RuleSet
+
+
+def _rules(rng):
+    weights = rng.choice([0.25, 0.5, 1.5, 2.75], size=3)
+    return RuleSet([
+        {"flag": "imbalanced", "measure": "imbalance", "op": ">=", "value": 20, "priority_weight": weights[0]},
+        {"flag": "high_burden", "measure": "burden", "op": ">=", "value": 3, "priority_weight": weights[1]},
+        {"flag": "low_fairness", "measure": "fairness", "op": "<=", "value": 3, "priority_weight": weights[2],
+         "priority_measure": "unfairness"},
+        {"flag": "priority", "all_of": ["imbalanced", "low_fairness"]},
+    ], "test")
+
+
+def _stable_ranking(codes, priority):
+    flagged = np.flatnonzero(codes)
+    return flagged[np.argsort(-priority[flagged], kind="stable")]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_top_k_matches_full_stable_sort(seed):
+    rng = np.random.default_rng(seed)
+    rules = _rules(rng)
+    households, tasks = 50, 40
+    codes, priority = rules.evaluate(
+        rng.integers(0, 101, (households, tasks)),
+        rng.integers(1, 6, (households, tasks)),
+        rng.integers(1, 6, (households, tasks)),
+    )
+    for k in (1, 3, 5, tasks, tasks + 3):
+        idx, real = rules.top_k(codes, priority, k)
+        for h in range(households):
+            expected = _stable_ranking(codes[h], priority[h])[:k]
+            np.testing.assert_array_equal(idx[h][real[h]], expected)
+            np.testing.assert_array_equal(rules.rank(codes[h], priority[h], k), expected)
+
+
+def test_fractional_priority_beats_earlier_task():
+    rules = _rules(np.random.default_rng(0))
+    codes = np.zeros(40, dtype=np.uint8)
+    priority = np.zeros(40)
+    codes[[0, 30]] = 1
+    priority[0], priority[30] = 15.0, 15.5
+    assert rules.rank(codes, priority).tolist() == [30, 0]
+    assert rules.rank(codes, priority, 1).tolist() == [30]
@@ -0,0 +1,108 @@
+# tests/test_scoring.py
+import numpy as np
+import pytest
+
+from logic import Calculator
+from models import Task
+from response_matrix import ResponseMatrix
+from scoring import PILLARS, ResponseArrays, RunningTotals, score
+
+
+def _reference(rows):
+    """The per-response loop Calculator.compute() used before the vectorised engine."""
+    rows = [r for r in rows if not r.not_applicable]
+    if not rows:
+        return dict(my_share_pct=50, partner_share_pct=50, my_burden=0, partner_burden=0, pillar_scores={})
+    b_share = sum(r.responsibility for r in rows) / (100 * len(rows))
+    a_pct = round((1 - b_share) * 100)
+    a_sum = b_sum = 0.0
+    pillars = {}
+    for r in rows:
+        a_w, b_w = (100 - r.responsibility) / 100, r.responsibility / 100
+        a_sum += 20 * r.burden * a_w
+        b_sum += 20 * r.burden * b_w
+        a, b = pillars.get(r.task.pillar, (0.0, 0.0))
+        pillars[r.task.pillar] = (a + a_w * r.burden, b + b_w * r.burden)
+    return dict(
+        my_share_pct=a_pct, partner_share_pct=100 - a_pct,
+        my_burden=round(a_sum / len(rows)), partner_burden=round(b_sum / len(rows)),
+        pillar_scores=pillars,
+    )
+
+
+def _assert_same(got, expected):
+    for k in ("my_share_pct", "partner_share_pct", "my_burden", "partner_burden"):
+        assert got[k] == expected[k], k
+    assert set(got["pillar_scores"]) == set(expected["pillar_scores"])
+    for p, (a, b) in expected["pillar_scores"].items():
+        assert got["pillar_scores"][p] == pytest.approx((a, b))
+
+
+def _tasks(rng, n=30):
+    return [Task(id=f"t{i}", name=f"Task {i}", pillar=PILLARS[rng.integers(len(PILLARS))]) for i in range(n)]
+
+
+def _matrix(rng, tasks=None):
+    """Random answers, with untouched (unanswered) and N/A tasks mixed in."""
+    tasks = tasks or _tasks(rng)
+    m = ResponseMatrix.empty(tasks, ",".join(f"{t.id}:{t.pillar}" for t in tasks))   # layouts are cached per version
+    for t in tasks:
+        kind = rng.random()
+        if kind < 0.2:
+            continue                                    # untouched: slider defaults, not answered
+        m.set(
+            t.id,
+            responsibility=int(rng.choice([0, 50, 100, rng.integers(0, 101)])),
+            burden=int(rng.integers(1, 6)),
+            fairness=int(rng.integers(1, 6)),
+            not_applicable=bool(kind < 0.3),
+        )
+    return m
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_engine_matches_reference_loop(seed):
+    m = _matrix(np.random.default_rng(seed))
+    expected = _reference(m.rows())
+    _assert_same(Calculator.from_arrays(m.arrays()).compute(), expected)
+    _assert_same(Calculator(m.rows()).compute(), expected)
+    _assert_same(m.summary(), expected)
+
+
+def test_batch_matches_single_households():
+    rng = np.random.default_rng(7)
+    tasks = _tasks(rng)
+    arrays = [_matrix(rng, tasks).arrays() for _ in range(20)]
+    stacked = ResponseArrays(
+        *(np.stack([getattr(a, f) for a in arrays]) for f in ("responsibility", "burden", "fairness", "applicable")),
+        pillar=arrays[0].pillar,
+    )
+    batch = Calculator.score_batch(stacked)
+    for i, a in enumerate(arrays):
+        single = score(a)
+        for f in ("my_share_pct", "partner_share_pct", "my_burden", "partner_burden"):
+            assert getattr(batch, f)[i] == getattr(single, f), f
+        np.testing.assert_allclose(batch.pillar_a[i], single.pillar_a)
+        np.testing.assert_allclose(batch.pillar_b[i], single.pillar_b)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_running_totals_follow_updates(seed):
+    rng = np.random.default_rng(seed)
+    m = _matrix(rng)
+    m.totals        # start tracking before the updates
+    ids = m.layout.task_ids
+    for _ in range(200):
+        tid = ids[rng.integers(len(ids))]
+        if rng.random() < 0.15:
+            m.set(tid, not_applicable=bool(rng.random() < 0.5))
+        else:
+            m.set(tid, responsibility=int(rng.integers(0, 101)), burden=int(rng.integers(1, 6)))
+        fresh = RunningTotals.from_arrays(m.arrays())
+        for f in RunningTotals.__slots__:
+            assert getattr(m.totals, f) == getattr(fresh, f), f
+        s = score(m.arrays())
+        assert m.totals.shares() == (int(s.my_share_pct), int(s.partner_share_pct))
+        burden = m.totals.burden()
+        assert burden is None or burden == (int(s.my_burden), int(s.partner_burden))
+        _assert_same(m.summary(), _reference(m.rows()))
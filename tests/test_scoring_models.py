@@ -0,0 +1,26 @@
+# tests/test_scoring_models.py
+import numpy as np
+import pytest
+
+from scoring import ResponseArrays
+from scoring_models import FAIRNESS_WEIGHTS, MODELS
+
+
+def _effective_burden(burden, fairness):
+    b = np.array([burden]), np.array([fairness])
+    arrays = ResponseArrays(np.array([0]), b[0], b[1], np.array([True]), np.array([0], dtype=np.int8))
+    return float(MODELS["fairness_weighted"].prepare(arrays).burden[0])
+
+
+def test_fairness_counts_at_every_burden():
+    for burden in range(1, 6):
+        by_fairness = [_effective_burden(burden, f) for f in range(1, 6)]
+        assert by_fairness == sorted(by_fairness, reverse=True)
+        assert len(set(by_fairness)) == 5, f"burden {burden} saturates: {by_fairness}"
+
+
+def test_weights_are_relative_and_stay_on_the_burden_scale():
+    assert _effective_burden(5, 1) == 5
+    assert _effective_burden(1, 5) > 0
+    for f in range(1, 6):
+        assert _effective_burden(4, f) / _effective_burden(4, 3) == pytest.approx(FAIRNESS_WEIGHTS[f] / FAIRNESS_WEIGHTS[3])
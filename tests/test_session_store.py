@@ -0,0 +1,37 @@
+# tests/test_session_store.py
+import sqlite3
+
+from utils.session_store import SessionStore
+
+SNAPSHOT = ("v1", '["cooking"]', b"\x32\x00\x03\x00\x03\x00\x01\x00", '{"stage": "questionnaire"}')
+
+
+def _rows(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT token, version, task_ids, answers, state FROM sessions").fetchall()
+    finally:
+        conn.close()
+
+
+def test_close_writes_pending_saves(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    store = SessionStore(path, debounce=60)     # the writer thread won't get to it first
+    store.save("abc", SNAPSHOT)
+    store.save("gone", SNAPSHOT)
+    store.delete("gone")
+    assert _rows(path) == []
+
+    store.close()
+
+    assert _rows(path) == [("abc", *SNAPSHOT)]
+
+
+def test_saves_after_close_are_dropped(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    store = SessionStore(path, debounce=60)
+    store.close()
+    store.save("abc", SNAPSHOT)
+    store.close()
+
+    assert _rows(path) == []
@@ -0,0 +1,107 @@
+# tests/test_session_token.py
+import base64
+
+import numpy as np
+import pytest
+
+from models import Task
+from response_matrix import ResponseMatrix
+from scoring import PILLARS
+from utils.session_token import HEADER, TokenError, decode, encode
+
+VERSION = "0123456789abcdef0123456789abcdef"
+TASKS = [Task(id=f"t{i}", name=f"Task {i}", pillar=PILLARS[i % len(PILLARS)]) for i in range(27)]
+SETUP = {
+    "children": 2, "is_employed_me": True, "is_employed_partner": False, "has_pets": True, "has_vehicle": False,
+    "stage": "results_main", "questionnaire_mode": "pillar", "results_page": 4,
+}
+
+
+def _matrix(seed=0):
+    """Answered, N/A (skipped) and untouched (None) tasks, including the range ends."""
+    rng = np.random.default_rng(seed)
+    m = ResponseMatrix.empty(TASKS, VERSION)
+    m.set("t0", responsibility=0, burden=1, fairness=1)
+    m.set("t1", responsibility=100, burden=5, fairness=5)
+    m.set("t2", responsibility=30, burden=4, fairness=2, not_applicable=True)
+    for t in TASKS[4:]:
+        if rng.random() < 0.3:
+            continue
+        m.set(t.id, responsibility=int(rng.integers(0, 101)), burden=int(rng.integers(1, 6)),
+              fairness=int(rng.integers(1, 6)), not_applicable=bool(rng.random() < 0.2))
+    return m
+
+
+def _raw(token):
+    return bytearray(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+
+
+def _token(raw):
+    return base64.urlsafe_b64encode(bytes(raw)).rstrip(b"=").decode("ascii")
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_round_trip(seed):
+    m = _matrix(seed)
+    responses, setup = decode(encode(m, SETUP), TASKS, VERSION)
+    np.testing.assert_array_equal(responses.data, m.data)
+    assert setup == SETUP
+    assert responses.get("t3") is None                         # untouched stays unanswered
+    assert responses.get("t2")["not_applicable"] is True       # skipped stays N/A
+    assert responses.counts() == m.counts()
+
+
+def test_round_trip_of_empty_matrix():
+    m = ResponseMatrix.empty(TASKS, VERSION)
+    responses, _ = decode(encode(m, {}), TASKS, VERSION)
+    np.testing.assert_array_equal(responses.data, m.data)
+    assert len(responses) == 0
+
+
+def test_truncated_tokens_are_rejected():
+    token = encode(_matrix(), SETUP)
+    for n in range(len(token)):
+        with pytest.raises(TokenError):
+            decode(token[:n], TASKS, VERSION)
+
+
+@pytest.mark.parametrize("token", ["", "!!!", "é", "a", "%%%%", "AAAA" * 40])
+def test_garbage_is_rejected(token):
+    with pytest.raises(TokenError):
+        decode(token, TASKS, VERSION)
+
+
+def test_other_catalogue_or_format_is_rejected():
+    token = encode(_matrix(), SETUP)
+    with pytest.raises(TokenError):
+        decode(token, TASKS, "f" * 32)
+    with pytest.raises(TokenError):
+        decode(token, TASKS[:-1], VERSION)
+    raw = _raw(token)
+    raw[0] ^= 0xFF
+    with pytest.raises(TokenError):
+        decode(_token(raw), TASKS, VERSION)
+
+
+def test_out_of_range_answers_are_rejected():
+    raw = _raw(encode(_matrix(), SETUP))
+    raw[HEADER] = 0xFF          # responsibility 127 for the first task
+    with pytest.raises(TokenError):
+        decode(_token(raw), TASKS, VERSION)
+
+
+def test_tampered_tokens_never_raise_anything_else():
+    token = encode(_matrix(), SETUP)
+    rng = np.random.default_rng(1)
+    for _ in range(500):
+        raw = _raw(token)
+        i = int(rng.integers(len(raw)))
+        raw[i] ^= 1 << int(rng.integers(8))
+        try:
+            responses, setup = decode(_token(raw), TASKS, VERSION)
+        except TokenError:
+            continue
+        d = responses.data
+        assert ((d[:, 0] >= 0) & (d[:, 0] <= 100)).all()
+        assert ((d[:, 1:3] >= 1) & (d[:, 1:3] <= 5)).all()
+        assert set(setup) == set(SETUP)
@@ -0,0 +1,81 @@
+# utils/cache.py
+# Small process-wide caches shared by every Streamlit session
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable content hash of plain data (dicts, lists, tuples, bytes, str, int, float, bool, None).
+
+    Dict keys are sorted so two sessions with the same answers get the same
+    key regardless of insertion order; list order is kept because it matters
+    for tie-breaking in the results.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        _feed(h, part)
+    return h.hexdigest()
+
+
+def _feed(h, obj: Any) -> None:
+    if isinstance(obj, dict):
+        h.update(b"{")
+        for k in sorted(obj, key=str):
+            _feed(h, k)
+            _feed(h, obj[k])
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"[")
+        for item in obj:
+            _feed(h, item)
+        h.update(b"]")
+    elif isinstance(obj, (bytes, bytearray)):
+        h.update(b"b%d:" % len(obj))
+        h.update(obj)
+    else:
+        # type name keeps 1, 1.0, True and "1" apart
+        h.update(f"{type(obj).__name__}:{obj!r};".encode("utf-8"))
+
+
+class LRUCache:
+    """Thread-safe, size-bounded LRU cache with hit/miss counters.
+
+    Values are shared across sessions, so callers must treat them as read-only.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+        # Compute outside the lock; two sessions racing on the same key just
+        # both compute and the second write wins, which is harmless.
+        value = compute()
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._data), "maxsize": self.maxsize}
@@ -1,11 +1,17 @@
 # utils/dev_mode.py
-import random
+import os
 import streamlit as st
-from tasks import get_filtered_tasks
+from response_matrix import ResponseMatrix, layout_for
+from state import new_responses
+from tasks import catalog
+from utils.synthetic import sample_household
+
+# ?dev=1 only counts on deployments started with MENTAL_LOAD_DEV=1, so study participants can't open the dev tools
+DEV_ALLOWED = os.environ.get("MENTAL_LOAD_DEV", "") not in ("", "0")
 
 def is_dev_mode():
-    """Check if dev mode is enabled"""
-    return st.session_state.get("dev_mode", False)
+    """Check if dev mode is enabled (session toggle, or ?dev=1 in the URL when MENTAL_LOAD_DEV is set)"""
+    return st.session_state.get("dev_mode", False) or (DEV_ALLOWED and st.query_params.get("dev") == "1")
 
 def toggle_dev_mode():
     """Toggle dev mode on/off"""
@@ -13,58 +19,19 @@ def toggle_dev_mode():
 
 def generate_sample_responses(scenario="balanced"):
     """
-    Generate sample responses for testing
+    Generate sample responses for testing, for the tasks this session's setup shows
     
-    Scenarios:
-    - "balanced": Fairly even split (45-55 range)
-    - "imbalanced": One partner carries most (70-90 range)
-    - "mixed": Mix of balanced and imbalanced tasks
+    Scenarios (see utils.synthetic):
+    - "balanced": Fairly even split (40-60 range)
+    - "imbalanced": Partner A carries most (10-35 range)
+    - "mixed": Mostly balanced, 30% of tasks tilted to one side
     - "random": Completely random
     """
-    children = st.session_state.get("children", 0)
-    both_employed = st.session_state.get("is_employed_me", True) and st.session_state.get("is_employed_partner", True)
-    
-    tasks = get_filtered_tasks(children, both_employed)
-    responses = []
-    
-    for task in tasks:
-        if scenario == "balanced":
-            # Fairly balanced household
-            responsibility = random.randint(40, 60)
-            burden = random.randint(2, 4)
-            fairness = random.randint(3, 5)
-            
-        elif scenario == "imbalanced":
-            # Partner A carries most of the load
-            responsibility = random.randint(10, 35)  # Partner A doing most
-            burden = random.randint(3, 5)  # Higher burden
-            fairness = random.randint(1, 3)  # Lower fairness
-            
-        elif scenario == "mixed":
-            # Some balanced, some not
-            if random.random() < 0.3:  # 30% imbalanced
-                responsibility = random.choice([random.randint(10, 30), random.randint(70, 90)])
-                burden = random.randint(3, 5)
-                fairness = random.randint(2, 4)
-            else:  # 70% balanced
-                responsibility = random.randint(40, 60)
-                burden = random.randint(2, 4)
-                fairness = random.randint(3, 5)
-                
-        else:  # random
-            responsibility = random.randint(0, 100)
-            burden = random.randint(1, 5)
-            fairness = random.randint(1, 5)
-        
-        responses.append({
-            "task_id": task.id,
-            "responsibility": responsibility,
-            "burden": burden,
-            "fairness": fairness,
-            "not_applicable": False,
-        })
-    
-    return responses
+    setup = {k: st.session_state.get(k, d) for k, d in (
+        ("children", 0), ("is_employed_me", True), ("is_employed_partner", True), ("has_pets", False), ("has_vehicle", False),
+    )}
+    cat = catalog()
+    return ResponseMatrix(layout_for(cat.tasks, cat.version), sample_household(scenario, setup, tasks=cat.tasks))
 
 def populate_dev_data(scenario="balanced"):
     """Populate session state with dev data"""
@@ -108,9 +75,9 @@ def dev_mode_widget():
             st.rerun()
     
     if st.sidebar.button("Clear All Data", use_container_width=True):
-        st.session_state.responses = []
+        st.session_state.responses = new_responses()
         st.session_state.notes_by_section = {}
         st.success("✅ Cleared all data")
         st.rerun()
     
-    st.sidebar.caption(f"📊 {len(st.session_state.get('responses', []))} tasks populated")
\ No newline at end of file
+    st.sidebar.caption(f"📊 {len(st.session_state.get('responses') or [])} tasks populated")
\ No newline at end of file
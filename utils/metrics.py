@@ -0,0 +1,262 @@
+# utils/metrics.py
+# In-process counters and histograms, exposed in Prometheus text format
+#
+# Every thread writes to its own shard (a plain dict), so recording a metric
+# never takes a lock shared with other sessions' script threads. Streamlit
+# starts a new script thread per rerun, so shards of finished threads are
+# folded into a base shard from time to time; the lock is only taken then
+# and when a scrape merges the shards.
+
+import bisect
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import streamlit as st
+
+log = logging.getLogger(__name__)
+
+METRICS_PORT = os.environ.get("MENTAL_LOAD_METRICS_PORT")   # serve /metrics here
+METRICS_FILE = os.environ.get("MENTAL_LOAD_METRICS_FILE")   # or rewrite this file
+METRICS_FILE_INTERVAL = 15.0                                # seconds between file dumps
+
+FUNNEL_STAGES = ("home", "consent", "setup", "questionnaire", "results", "results_main")
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Registry:
+    """Metric definitions plus per-thread shards holding their values."""
+
+    COMPACT_AT = 64     # fold dead threads' shards once this many are registered
+
+    def __init__(self):
+        self._meta: Dict[str, Tuple[str, str, Tuple[float, ...]]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[Tuple[threading.Thread, Dict]] = []
+        self._base: Dict = {}
+
+    def counter(self, name: str, help: str) -> "Counter":
+        self._meta[name] = ("counter", help, ())
+        return Counter(self, name)
+
+    def histogram(self, name: str, help: str, buckets: Sequence[float]) -> "Histogram":
+        self._meta[name] = ("histogram", help, tuple(sorted(buckets)))
+        return Histogram(self, name, self._meta[name][2])
+
+    # ----- writes (lock-free apart from a thread's first write) -----
+    def shard(self) -> Dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append((threading.current_thread(), shard))
+                if len(self._shards) >= self.COMPACT_AT:
+                    self._compact()
+        return shard
+
+    def _compact(self) -> None:
+        """Merge shards of finished threads into the base shard. Caller holds the lock."""
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                _merge_into(self._base, shard)
+        self._shards = alive
+
+    # ----- reads -----
+    def collect(self) -> Dict:
+        with self._lock:
+            self._compact()
+            merged = _merge_into({}, self._base)
+            for _, shard in self._shards:
+                _merge_into(merged, shard)
+        return merged
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        values = self.collect()
+        lines = []
+        for name, (kind, help, buckets) in self._meta.items():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            series = sorted((k, v) for k, v in values.items() if k[0] == name)
+            for (_, labels), v in series:
+                if kind == "counter":
+                    lines.append(f"{name}{_labels(labels)} {_num(v)}")
+                    continue
+                counts, total, n = v
+                running = 0
+                for bound, c in zip(buckets, counts):
+                    running += c
+                    lines.append(f"{name}_bucket{_labels(labels + (('le', f'{bound:g}'),))} {running}")
+                lines.append(f"{name}_bucket{_labels(labels + (('le', '+Inf'),))} {n}")
+                lines.append(f"{name}_sum{_labels(labels)} {_num(total)}")
+                lines.append(f"{name}_count{_labels(labels)} {n}")
+        return "\n".join(lines) + "\n"
+
+
+def _merge_into(dst: Dict, src: Dict) -> Dict:
+    # list() copies the items in one step, so a live thread's writes can't break the loop
+    for key, v in list(src.items()):
+        if isinstance(v, list):
+            counts, total, n = v
+            cur = dst.get(key)
+            if cur is None:
+                dst[key] = [list(counts), total, n]
+            else:
+                cur[0] = [a + b for a, b in zip(cur[0], counts)]
+                cur[1] += total
+                cur[2] += n
+        else:
+            dst[key] = dst.get(key, 0) + v
+    return dst
+
+
+def _num(v: float) -> str:
+    return str(int(v)) if float(v).is_integer() else repr(float(v))
+
+
+def _labels(labels: LabelKey) -> str:
+    if not labels:
+        return ""
+    body = ",".join(f'{k}="{str(v)}"' for k, v in labels)
+    return "{" + body + "}"
+
+
+class Counter:
+    def __init__(self, registry: Registry, name: str):
+        self._registry, self._name = registry, name
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        shard = self._registry.shard()
+        key = (self._name, tuple(sorted(labels.items())))
+        shard[key] = shard.get(key, 0) + amount
+
+
+class Histogram:
+    def __init__(self, registry: Registry, name: str, buckets: Tuple[float, ...]):
+        self._registry, self._name, self._buckets = registry, name, buckets
+
+    def observe(self, value: float, **labels: str) -> None:
+        shard = self._registry.shard()
+        key = (self._name, tuple(sorted(labels.items())))
+        entry = shard.get(key)
+        if entry is None:
+            entry = shard[key] = [[0] * len(self._buckets), 0.0, 0]
+        i = bisect.bisect_left(self._buckets, value)
+        if i < len(self._buckets):
+            entry[0][i] += 1
+        entry[1] += value
+        entry[2] += 1
+
+
+REGISTRY = Registry()
+
+STAGE_ENTRIES = REGISTRY.counter("mental_load_stage_entries_total", "Sessions entering each stage.")
+RERUNS = REGISTRY.counter("mental_load_reruns_total", "Full-script reruns per stage.")
+EXPORTS = REGISTRY.counter("mental_load_exports_total", "Results CSV exports downloaded.")
+RERUN_SECONDS = REGISTRY.histogram(
+    "mental_load_rerun_seconds", "Server time of one routed rerun.",
+    (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+QUESTIONNAIRE_SECONDS = REGISTRY.histogram(
+    "mental_load_questionnaire_seconds", "Time from starting the questionnaire to seeing results.",
+    (60, 120, 300, 600, 900, 1200, 1800, 2700, 3600),
+)
+
+
+# ----- hooks called from the app -----
+def track_stage(stage: str) -> None:
+    """Count a funnel entry the first rerun a session spends on a new stage."""
+    if st.session_state.get("_metrics_stage") != stage:
+        st.session_state._metrics_stage = stage
+        if stage in FUNNEL_STAGES:
+            STAGE_ENTRIES.inc(stage=stage)
+
+
+def observe_rerun(stage: str, ms: float) -> None:
+    RERUNS.inc(stage=stage)
+    RERUN_SECONDS.observe(ms / 1000, stage=stage)
+
+
+def count_export() -> None:
+    """on_click for the export button."""
+    EXPORTS.inc()
+
+
+def questionnaire_finished() -> None:
+    start = st.session_state.get("questionnaire_start_time")
+    if start is not None:
+        QUESTIONNAIRE_SECONDS.observe(time.time() - start)
+        st.session_state.questionnaire_start_time = None
+
+
+# ----- exporters -----
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = REGISTRY.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # keep scrapes out of the server log
+        pass
+
+
+def _dump_loop(path: Path, interval: float) -> None:
+    failing = None      # last error logged, so a lasting problem is logged once, not every interval
+    while True:
+        time.sleep(interval)
+        try:
+            write_metrics(path)
+        except OSError as e:    # missing directory, full disk, permissions: keep trying
+            if str(e) != failing:
+                log.warning("could not write metrics to %s: %s", path, e)
+                failing = str(e)
+            continue
+        if failing is not None:
+            log.info("writing metrics to %s again", path)
+            failing = None
+
+
+def write_metrics(path: Path) -> None:
+    """Write the current metrics to path atomically (for node_exporter's textfile collector)."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(REGISTRY.render(), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+_EXPORTER_LOCK = threading.Lock()
+_EXPORTER_STARTED = False
+
+def start_metrics_exporter(port: Optional[str] = METRICS_PORT, path: Optional[str] = METRICS_FILE) -> None:
+    """Start the /metrics server and/or file dumper once per process, if configured."""
+    global _EXPORTER_STARTED
+    with _EXPORTER_LOCK:
+        if _EXPORTER_STARTED:
+            return
+        _EXPORTER_STARTED = True
+    if port:
+        try:
+            server = ThreadingHTTPServer(("127.0.0.1", int(port)), _Handler)
+        except OSError as exc:
+            log.warning("metrics server not started on port %s: %s", port, exc)
+        else:
+            threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+            log.info("serving metrics on http://127.0.0.1:%s/metrics", port)
+    if path:
+        threading.Thread(
+            target=_dump_loop, args=(Path(path), METRICS_FILE_INTERVAL), name="metrics-file", daemon=True
+        ).start()
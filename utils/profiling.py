@@ -0,0 +1,146 @@
+# utils/profiling.py
+# Per-rerun timing for the router, plus a slow-rerun watchdog
+
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils.metrics import observe_rerun
+
+log = logging.getLogger(__name__)
+
+# Reruns slower than this (ms) are logged as a structured "slow_rerun" record
+SLOW_RERUN_MS = float(os.environ.get("MENTAL_LOAD_SLOW_RERUN_MS", "750"))
+HISTORY = 30            # reruns kept per session for the dev panel
+
+_local = threading.local()
+# Spans that ran outside any profiled rerun, e.g. the CSV export, which
+# Streamlit builds on its own thread when the download is requested
+_DETACHED: deque = deque(maxlen=HISTORY)
+
+
+@contextmanager
+def span(name: str):
+    """Time a block and attach it to the rerun currently being profiled on this thread."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - t0) * 1000
+        record = getattr(_local, "record", None)
+        if record is not None:
+            record["spans"][name] = record["spans"].get(name, 0.0) + ms
+        else:
+            _DETACHED.append({"span": name, "ms": round(ms, 2), "at": time.time()})
+
+
+def profile_rerun(stage: str, screen: Callable[[], None], measure_state: bool = False) -> None:
+    """Run one screen function with timing, element counting and the slow-rerun check.
+
+    measure_state also records the pickled size of session_state, which costs a
+    full pickle per rerun, so only the dev panel asks for it.
+    """
+    record = {"stage": stage, "spans": {}, "elements": None, "rerun_requested": True}
+    _local.record = record
+    restore = _count_elements(record)
+    t0 = time.perf_counter()
+    try:
+        screen()
+        record["rerun_requested"] = False
+    finally:
+        record["ms"] = round((time.perf_counter() - t0) * 1000, 2)
+        restore()
+        _local.record = None
+        _finish(record, measure_state)
+
+
+def _count_elements(record: Dict) -> Callable[[], None]:
+    """Count delta messages sent during the rerun by wrapping the run context's queue."""
+    ctx = get_script_run_ctx()
+    enqueue = getattr(ctx, "_enqueue", None)
+    if enqueue is None:
+        return lambda: None
+    record["elements"] = 0
+
+    def counting(msg):
+        if msg.WhichOneof("type") == "delta":
+            record["elements"] += 1
+        enqueue(msg)
+
+    ctx._enqueue = counting
+
+    def restore():
+        ctx._enqueue = enqueue
+    return restore
+
+
+def _state_size() -> Dict[str, int]:
+    """Number of session_state keys and their approximate pickled size in bytes."""
+    keys, size = 0, 0
+    for k, v in st.session_state.to_dict().items():
+        keys += 1
+        if k == "_rerun_profiles":
+            continue
+        try:
+            size += len(pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:  # widgets' values are plain data, but be safe with anything else
+            pass
+    return {"state_keys": keys, "state_bytes": size}
+
+
+def _finish(record: Dict, measure_state: bool) -> None:
+    record.update(_state_size() if measure_state else {"state_keys": None, "state_bytes": None})
+    record["spans"] = {k: round(v, 2) for k, v in record["spans"].items()}
+    record["at"] = time.time()
+    history = st.session_state.setdefault("_rerun_profiles", deque(maxlen=HISTORY))
+    history.append(record)
+    observe_rerun(record["stage"], record["ms"])
+    if record["ms"] > SLOW_RERUN_MS:
+        ctx = get_script_run_ctx()
+        log.warning(json.dumps({
+            "event": "slow_rerun",
+            "budget_ms": SLOW_RERUN_MS,
+            "session": getattr(ctx, "session_id", None),
+            **record,
+        }))
+
+
+def last_reruns(n: Optional[int] = None):
+    history = list(st.session_state.get("_rerun_profiles", ()))
+    return history[-n:] if n else history
+
+
+def profiling_panel(n: int = 10):
+    """Dev-mode breakdown of this session's last n reruns."""
+    rows = last_reruns(n)
+    with st.expander(f"⏱️ Last {len(rows)} reruns (budget {SLOW_RERUN_MS:.0f} ms)"):
+        if not rows:
+            st.caption("Nothing recorded yet.")
+            return
+        st.dataframe(
+            [
+                {
+                    "stage": r["stage"],
+                    "ms": r["ms"],
+                    **{f"{k} ms": v for k, v in r["spans"].items()},
+                    "elements": r["elements"],
+                    "state keys": r["state_keys"],
+                    "state KB": round(r["state_bytes"] / 1024, 1) if r["state_bytes"] is not None else None,
+                    "slow": "⚠️" if r["ms"] > SLOW_RERUN_MS else "",
+                }
+                for r in reversed(rows)
+            ],
+            hide_index=True,
+        )
+        detached = list(_DETACHED)[-n:]
+        if detached:
+            st.caption("Outside reruns (process-wide): " + ", ".join(f"{d['span']} {d['ms']} ms" for d in reversed(detached)))
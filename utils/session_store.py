@@ -0,0 +1,262 @@
+# utils/session_store.py
+# Opt-in persistence: checkpoint a session to SQLite under a resume token
+#
+# Set MENTAL_LOAD_SESSION_DB to a file path to turn it on. The token travels
+# in the URL (?resume=...), so reloading the page or reopening the link picks
+# up where the couple left off. Script threads only hand the latest snapshot
+# to a writer thread; it waits DEBOUNCE_S for more changes, then writes every
+# pending session in one transaction. Whatever is still pending when the
+# process exits (including on SIGTERM, which Streamlit turns into a normal
+# shutdown) is written by an atexit hook.
+#
+# The hooks below also drive the stateless URL token (utils/session_token.py)
+# when MENTAL_LOAD_URL_STATE is on; either, both or neither can be enabled.
+
+import atexit
+import json
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import streamlit as st
+
+from models import Task
+from response_matrix import ResponseMatrix, layout_for
+from tasks import Catalog, catalog
+from utils import session_token
+
+log = logging.getLogger(__name__)
+
+DB_PATH = os.environ.get("MENTAL_LOAD_SESSION_DB")
+RESUME_PARAM = "resume"
+DEBOUNCE_S = 0.5
+
+# Session keys saved alongside the answers
+STATE_KEYS = (
+    "stage", "household_type", "children", "is_employed_me", "is_employed_partner",
+    "has_pets", "has_vehicle", "questionnaire_mode", "q_section_index", "q_task_index",
+    "notes_by_section", "results_notes", "results_page", "results_prep_seen",
+    "questionnaire_start_time", "study_arm",
+)
+# Nothing worth saving before the questionnaire starts
+SAVED_STAGES = ("questionnaire", "results", "results_main")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    token       TEXT PRIMARY KEY,
+    version     TEXT NOT NULL,
+    task_ids    TEXT NOT NULL,
+    answers     BLOB NOT NULL,
+    state       TEXT NOT NULL,
+    updated     REAL NOT NULL
+)
+"""
+
+# token -> (version, task_ids json, answers bytes, state json)
+Snapshot = Tuple[str, str, bytes, str]
+
+
+class SessionStore:
+    def __init__(self, path: str, debounce: float = DEBOUNCE_S):
+        self.path = path
+        self.debounce = debounce
+        self._pending: Dict[str, Optional[Snapshot]] = {}   # None = delete
+        self._closed = False
+        self._cond = threading.Condition()
+        self._read_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._reader = self._connect()
+        self._reader.execute(SCHEMA)
+        self._conn = self._connect()
+        self._writer = threading.Thread(target=self._write_loop, name="session-store", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    # ----- called from script threads; never touch the database -----
+    def save(self, token: str, snapshot: Snapshot) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._pending[token] = snapshot
+            self._cond.notify()
+
+    def delete(self, token: str) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._pending[token] = None
+            self._cond.notify()
+
+    def load(self, token: str) -> Optional[Snapshot]:
+        with self._cond:
+            if token in self._pending:      # read our own unflushed write
+                return self._pending[token]
+        with self._read_lock:
+            row = self._reader.execute(
+                "SELECT version, task_ids, answers, state FROM sessions WHERE token = ?", (token,)
+            ).fetchone()
+        return tuple(row) if row else None
+
+    # ----- writer thread -----
+    def _write_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+            time.sleep(self.debounce)       # let a burst of slider drags coalesce
+            self.flush()
+
+    def flush(self) -> int:
+        """Write everything pending in one transaction; returns the number of sessions written."""
+        with self._write_lock:
+            with self._cond:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            upserts = [(t, *snap, time.time()) for t, snap in batch.items() if snap is not None]
+            deletes = [(t,) for t, snap in batch.items() if snap is None]
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT INTO sessions (token, version, task_ids, answers, state, updated) VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(token) DO UPDATE SET version=excluded.version, task_ids=excluded.task_ids, "
+                    "answers=excluded.answers, state=excluded.state, updated=excluded.updated",
+                    upserts,
+                )
+                self._conn.executemany("DELETE FROM sessions WHERE token = ?", deletes)
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                log.exception("session store write failed; %d sessions will be retried", len(batch))
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                with self._cond:
+                    for token, snap in batch.items():
+                        self._pending.setdefault(token, snap)
+                return 0
+            return len(batch)
+
+    def close(self) -> None:
+        """Write everything still pending, then close the database. Later saves are dropped."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        written = self.flush()
+        with self._write_lock:
+            self._conn.close()
+        with self._read_lock:
+            self._reader.close()
+        log.info("session store closed, %d pending sessions written", written)
+
+
+_STORE: Optional[SessionStore] = None
+_STORE_LOCK = threading.Lock()
+
+def get_store() -> Optional[SessionStore]:
+    """The process-wide store, or None when persistence is off."""
+    global _STORE
+    if not DB_PATH:
+        return None
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = SessionStore(DB_PATH)
+            atexit.register(_STORE.close)     # don't lose the last DEBOUNCE_S of answers on shutdown
+    return _STORE
+
+
+def enabled() -> bool:
+    return bool(DB_PATH)
+
+
+# ----- session hooks -----
+def _snapshot(responses: ResponseMatrix, state: str) -> Snapshot:
+    return (responses.version, json.dumps(responses.layout.task_ids), responses.data.tobytes(), state)
+
+
+def _state_json() -> str:
+    return json.dumps({k: st.session_state[k] for k in STATE_KEYS if k in st.session_state}, sort_keys=True)
+
+
+def checkpoint() -> None:
+    """Queue this session for saving if anything changed since the last checkpoint. Cheap when nothing did."""
+    responses = st.session_state.get("responses")
+    if responses is None or st.session_state.get("stage") not in SAVED_STAGES:
+        return
+    if session_token.URL_STATE:
+        session_token.sync_url(responses)
+    store = get_store()
+    if store is None:
+        return
+    token = st.query_params.get(RESUME_PARAM)
+    if not token:
+        token = st.query_params[RESUME_PARAM] = secrets.token_urlsafe(12)
+        st.session_state._store_token = token   # nothing to restore from our own token
+    state = _state_json()
+    mark = (token, responses.uid, responses.revision, state)
+    if st.session_state.get("_store_mark") == mark:
+        return
+    st.session_state._store_mark = mark
+    store.save(token, _snapshot(responses, state))
+
+
+def restore() -> bool:
+    """Load a saved session into session_state, once per browser session.
+
+    ?resume= (the store, which also has the notes) wins over ?s= (the URL token).
+    """
+    return _restore_from_store() or (session_token.URL_STATE and session_token.restore_from_url())
+
+
+def _restore_from_store() -> bool:
+    store = get_store()
+    token = st.query_params.get(RESUME_PARAM)
+    if store is None or not token or st.session_state.get("_store_token") == token:
+        return False
+    st.session_state._store_token = token
+    snap = store.load(token)
+    if snap is None:
+        return False
+    version, task_ids, answers, state = snap
+    data = np.frombuffer(answers, dtype=np.int16).reshape(-1, 4).copy()
+    cat = catalog()
+    saved = ResponseMatrix(layout_for_ids(json.loads(task_ids), version, cat), data)
+    st.session_state.responses = saved.rebase(cat.tasks, cat.version)
+    for key, value in json.loads(state).items():
+        st.session_state[key] = value
+    return True
+
+
+def layout_for_ids(task_ids, version: str, cat: Optional[Catalog] = None):
+    """Layout of the catalogue version a snapshot was saved under; rebuilt from ids if that version is gone."""
+    cat = cat or catalog()
+    if version == cat.version:
+        return layout_for(cat.tasks, version)
+    # Tasks removed since then only need an id to be matched (and dropped) by rebase
+    tasks = [cat.lookup.get(tid) or Task(id=tid, name=tid, pillar="anticipation") for tid in task_ids]
+    return layout_for(tasks, f"saved:{version}")
+
+
+def forget() -> None:
+    """Drop the resume token and its saved row, and the URL token (Finish / Start Over)."""
+    if session_token.TOKEN_PARAM in st.query_params:
+        del st.query_params[session_token.TOKEN_PARAM]
+    token = st.query_params.get(RESUME_PARAM)
+    if token:
+        del st.query_params[RESUME_PARAM]
+        store = get_store()
+        if store is not None:
+            store.delete(token)
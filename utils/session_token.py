@@ -0,0 +1,145 @@
+# utils/session_token.py
+# The whole questionnaire state packed into a short URL-safe token
+#
+# With MENTAL_LOAD_URL_STATE=1 the token rides in the URL (?s=...), so any
+# server process with the same task catalogue can rebuild the session from the
+# link alone: no sticky sessions, no shared store. Free-text notes are not
+# included; they stay in the browser session (or the SQLite store, if on).
+#
+# Layout (format 1), big-endian:
+#   byte  0      format version
+#   bytes 1-4    first 4 bytes of the catalogue content hash
+#   byte  5      children (4 bits) | employed me | employed partner | pets | vehicle
+#   byte  6      stage (2 bits) | questionnaire layout (2 bits) | results page - 1 (3 bits) | spare
+#   then 15 bits per catalogue task, in catalogue order:
+#                responsibility (7) | burden (3) | fairness (3) | not applicable | answered
+# 27 tasks → 58 bytes → 78 characters.
+
+import base64
+import logging
+import os
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import streamlit as st
+
+from response_matrix import ANSWERED, BURDEN, FAIRNESS, FLAGS, NOT_APPLICABLE, RESPONSIBILITY, ResponseMatrix
+from tasks import catalog
+
+log = logging.getLogger(__name__)
+
+URL_STATE = os.environ.get("MENTAL_LOAD_URL_STATE", "") not in ("", "0")
+TOKEN_PARAM = "s"
+FORMAT = 1
+HEADER = 7
+BITS_PER_TASK = 15
+
+STAGES = ("questionnaire", "results", "results_main")
+MODES = ("all", "pillar", "task")
+
+
+class TokenError(ValueError):
+    """A token that is malformed, from another catalogue, or holds out-of-range answers."""
+
+
+def _catalog_tag(version: str) -> bytes:
+    return bytes.fromhex(version[:8])
+
+
+def encode(responses: ResponseMatrix, setup: Dict) -> str:
+    """Pack answers plus setup/position into a URL-safe token."""
+    d = responses.data.astype(np.uint16)
+    fields = (
+        (d[:, RESPONSIBILITY] << 8)
+        | (d[:, BURDEN] << 5)
+        | (d[:, FAIRNESS] << 2)
+        | (((d[:, FLAGS] & NOT_APPLICABLE) > 0).astype(np.uint16) << 1)
+        | (d[:, FLAGS] & ANSWERED)
+    )
+    # 16-bit big-endian words, drop each word's top (always zero) bit, pack the rest
+    bits = np.unpackbits(fields.astype(">u2").view(np.uint8)).reshape(-1, 16)[:, 1:]
+    body = np.packbits(bits.ravel()).tobytes()
+
+    flags = (
+        min(int(setup.get("children", 0)), 15) << 4
+        | bool(setup.get("is_employed_me", True)) << 3
+        | bool(setup.get("is_employed_partner", True)) << 2
+        | bool(setup.get("has_pets", False)) << 1
+        | bool(setup.get("has_vehicle", False))
+    )
+    stage = STAGES.index(setup["stage"]) if setup.get("stage") in STAGES else 0
+    mode = MODES.index(setup["questionnaire_mode"]) if setup.get("questionnaire_mode") in MODES else 0
+    page = min(max(int(setup.get("results_page", 1)), 1), 8) - 1
+    position = stage << 6 | mode << 4 | page << 1
+
+    raw = bytes([FORMAT]) + _catalog_tag(responses.version) + bytes([flags, position]) + body
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode(token: str, tasks=None, version: Optional[str] = None) -> Tuple[ResponseMatrix, Dict]:
+    """Rebuild (answer matrix, setup/position dict) from a token for the given catalogue (default: the current one)."""
+    if tasks is None:
+        cat = catalog()
+        tasks, version = cat.tasks, version or cat.version
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (ValueError, TypeError) as exc:
+        raise TokenError("not a session token") from exc
+    n = len(tasks)
+    if len(raw) != HEADER + (n * BITS_PER_TASK + 7) // 8 or raw[0] != FORMAT:
+        raise TokenError("unknown token format or catalogue size")
+    if raw[1:5] != _catalog_tag(version):
+        raise TokenError("token was made for a different task catalogue")
+
+    bits = np.unpackbits(np.frombuffer(raw[HEADER:], dtype=np.uint8))[: n * BITS_PER_TASK].reshape(n, BITS_PER_TASK)
+    words = np.packbits(np.hstack([np.zeros((n, 1), dtype=np.uint8), bits]), axis=1).view(">u2").ravel().astype(np.int16)
+    resp, burden, fair = words >> 8, (words >> 5) & 7, (words >> 2) & 7
+    if (resp > 100).any() or not ((1 <= burden) & (burden <= 5) & (1 <= fair) & (fair <= 5)).all():
+        raise TokenError("answer out of range")
+
+    m = ResponseMatrix.empty(tasks, version)
+    m.data[:, RESPONSIBILITY] = resp
+    m.data[:, BURDEN] = burden
+    m.data[:, FAIRNESS] = fair
+    m.data[:, FLAGS] = np.where(words & 2, NOT_APPLICABLE, 0) | (words & 1)
+    m.revision = 1
+
+    flags, position = raw[5], raw[6]
+    setup = {
+        "children": flags >> 4,
+        "is_employed_me": bool(flags & 8),
+        "is_employed_partner": bool(flags & 4),
+        "has_pets": bool(flags & 2),
+        "has_vehicle": bool(flags & 1),
+        "stage": STAGES[min(position >> 6, len(STAGES) - 1)],
+        "questionnaire_mode": MODES[min((position >> 4) & 3, len(MODES) - 1)],
+        "results_page": ((position >> 1) & 7) + 1,
+    }
+    return m, setup
+
+
+# ----- session hooks -----
+def sync_url(responses: ResponseMatrix) -> None:
+    """Keep ?s= in step with the session; only touches the URL when the token changed."""
+    token = encode(responses, st.session_state)
+    if st.query_params.get(TOKEN_PARAM) != token:
+        st.query_params[TOKEN_PARAM] = token
+        st.session_state._url_token = token
+
+
+def restore_from_url() -> bool:
+    """Rebuild the session from ?s= once, when a fresh session arrives with a token."""
+    token = st.query_params.get(TOKEN_PARAM)
+    if not token or st.session_state.get("_url_token") == token:
+        return False
+    st.session_state._url_token = token
+    try:
+        responses, setup = decode(token)
+    except TokenError as exc:
+        log.info("ignoring session token: %s", exc)
+        return False
+    st.session_state.responses = responses
+    for key, value in setup.items():
+        st.session_state[key] = value
+    st.session_state.results_prep_seen = setup["stage"] == "results_main"
+    return True
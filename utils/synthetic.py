@@ -0,0 +1,212 @@
+# utils/synthetic.py
+# Seeded synthetic households, generated in bulk with NumPy
+#
+# Households are spread evenly over the 16 household profiles (children /
+# both employed / pets / vehicle), which decide the tasks they are shown. Each
+# is drawn from one scenario (balanced / imbalanced / mixed / random, mixed in
+# the given proportions). Of the tasks shown, some are left untouched at the
+# slider defaults (not answered, as when a couple scrolls past) and some are
+# marked N/A. Answers use the ResponseMatrix layout.
+#
+# write_corpus() streams millions of households to .npy files, one chunk at a
+# time, and Corpus memory-maps them back. ensure_corpus() keeps one corpus per
+# settings and catalogue version under .cache/synthetic, so benchmarks and the
+# load test reuse it instead of regenerating. Chunk c is drawn from
+# default_rng([seed, c]), so a corpus is the same on every machine.
+
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models import Task
+from response_matrix import ANSWERED, DEFAULT_ANSWER, NOT_APPLICABLE, ResponseMatrix, layout_for
+from scoring import PILLAR_INDEX, ResponseArrays
+from tasks import (
+    NEEDS_CHILDREN, NEEDS_EMPLOYMENT, NEEDS_PETS, NEEDS_VEHICLE, TASKS, catalog_version, get_filtered_tasks, profile_bits,
+)
+from utils.cache import fingerprint
+
+SCENARIOS = ("balanced", "imbalanced", "mixed", "random")
+DEFAULT_MIX = (0.3, 0.2, 0.3, 0.2)      # share of households per scenario
+UNTOUCHED = 0.15                         # chance a shown task is left at the defaults
+NOT_APPLICABLE_RATE = 0.05               # chance an answered task is marked N/A
+CHUNK = 1 << 16                          # households per generation step
+
+CORPUS_DIR = Path(__file__).resolve().parents[1] / ".cache" / "synthetic"
+FORMAT = 1
+
+# Inclusive (low, high) for responsibility, burden, fairness in each answer band
+_BANDS = np.array([
+    [(40, 60), (2, 4), (3, 5)],      # 0 balanced
+    [(10, 35), (3, 5), (1, 3)],      # 1 imbalanced: Partner A carries most
+    [(0, 100), (1, 5), (1, 5)],      # 2 random
+    [(10, 30), (3, 5), (2, 4)],      # 3 tilted towards A (mixed households)
+    [(70, 90), (3, 5), (2, 4)],      # 4 tilted towards B (mixed households)
+], dtype=np.int16)
+_MIXED_TILTED = 0.3                      # share of tilted tasks in a mixed household
+
+HOUSEHOLD_DTYPE = np.dtype([("profile", "u1"), ("scenario", "u1"), ("children", "u1")])
+
+
+def shown_tasks(tasks: Sequence[Task] = TASKS) -> np.ndarray:
+    """(16, tasks) bool: which catalogue tasks each household profile is shown."""
+    shown = np.zeros((16, len(tasks)), dtype=bool)
+    index = {t.id: i for i, t in enumerate(tasks)}
+    for p in range(16):
+        profile_tasks = get_filtered_tasks(
+            int(bool(p & NEEDS_CHILDREN)), bool(p & NEEDS_EMPLOYMENT), bool(p & NEEDS_PETS), bool(p & NEEDS_VEHICLE)
+        )
+        shown[p, [index[t.id] for t in profile_tasks if t.id in index]] = True
+    return shown
+
+
+def generate(
+    rng: np.random.Generator,
+    shown: np.ndarray,
+    profiles: np.ndarray,
+    scenarios: np.ndarray,
+    untouched: float = UNTOUCHED,
+    not_applicable: float = NOT_APPLICABLE_RATE,
+) -> np.ndarray:
+    """Answers for one household per (profile, scenario) pair: uint8 (households, tasks, 4)."""
+    n, t = len(profiles), shown.shape[1]
+    band = np.select(
+        [scenarios[:, None] == 0, scenarios[:, None] == 1, scenarios[:, None] == 3],
+        [0, 1, 2],
+        default=np.where(rng.random((n, t)) < _MIXED_TILTED, 3 + rng.integers(0, 2, (n, t)), 0),
+    )
+    bounds = _BANDS[band]                                    # (n, t, 3, 2)
+    values = rng.integers(bounds[..., 0], bounds[..., 1], endpoint=True, dtype=np.int16)
+
+    answered = shown[profiles] & (rng.random((n, t)) >= untouched)
+    flags = np.where(answered, ANSWERED, 0) | np.where(answered & (rng.random((n, t)) < not_applicable), NOT_APPLICABLE, 0)
+    values[~answered] = DEFAULT_ANSWER
+    return np.concatenate([values, flags[..., None].astype(np.int16)], axis=-1).astype(np.uint8)
+
+
+def _draw_households(rng: np.random.Generator, start: int, stop: int, mix: Sequence[float]) -> np.ndarray:
+    households = np.zeros(stop - start, dtype=HOUSEHOLD_DTYPE)
+    # Every profile equally often: cycle through them, then shuffle within the chunk
+    households["profile"] = rng.permutation(np.arange(start, stop) % 16)
+    households["scenario"] = rng.choice(len(SCENARIOS), size=stop - start, p=np.asarray(mix) / np.sum(mix))
+    has_children = (households["profile"] & NEEDS_CHILDREN) > 0
+    households["children"] = np.where(has_children, rng.integers(1, 5, stop - start), 0)
+    return households
+
+
+# ----- on-disk corpus -----
+class Corpus:
+    """A memory-mapped synthetic corpus. answers[i] is household i's ResponseMatrix data (as uint8)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.meta: Dict = json.loads((self.path / "meta.json").read_text(encoding="utf-8"))
+        self.answers = np.load(self.path / "answers.npy", mmap_mode="r")
+        self.households = np.load(self.path / "households.npy", mmap_mode="r")
+        self.task_ids: Tuple[str, ...] = tuple(self.meta["task_ids"])
+        self.version: str = self.meta["version"]
+
+    def __len__(self) -> int:
+        return len(self.households)
+
+    def setup(self, i: int) -> Dict:
+        """Setup-screen answers for household i."""
+        h = self.households[i]
+        p = int(h["profile"])
+        return {
+            "children": int(h["children"]),
+            "is_employed_me": bool(p & NEEDS_EMPLOYMENT),
+            "is_employed_partner": bool(p & NEEDS_EMPLOYMENT),
+            "has_pets": bool(p & NEEDS_PETS),
+            "has_vehicle": bool(p & NEEDS_VEHICLE),
+        }
+
+    def matrix(self, i: int, tasks: Sequence[Task] = TASKS, version: Optional[str] = None) -> ResponseMatrix:
+        """Household i as an answer matrix for the catalogue the corpus was generated for."""
+        version = version or catalog_version()
+        if version != self.version:
+            raise ValueError(f"corpus was generated for catalogue {self.version}, not {version}")
+        return ResponseMatrix(layout_for(tasks, version), self.answers[i].astype(np.int16))
+
+    def arrays(self, start: int = 0, stop: Optional[int] = None, tasks: Sequence[Task] = TASKS) -> ResponseArrays:
+        """Households start..stop as a (households, tasks) batch for the scorer and hotspot rules."""
+        block = self.answers[start:stop].astype(np.int16)
+        return ResponseArrays(
+            responsibility=block[..., 0],
+            burden=block[..., 1],
+            fairness=block[..., 2],
+            applicable=block[..., 3] == ANSWERED,
+            pillar=np.array([PILLAR_INDEX[t.pillar] for t in tasks], dtype=np.int8),
+        )
+
+
+def write_corpus(
+    path: Path,
+    households: int,
+    seed: int,
+    tasks: Sequence[Task] = TASKS,
+    version: Optional[str] = None,
+    mix: Sequence[float] = DEFAULT_MIX,
+    untouched: float = UNTOUCHED,
+    not_applicable: float = NOT_APPLICABLE_RATE,
+) -> Corpus:
+    """Generate a corpus chunk by chunk straight into .npy files under path (replacing what's there)."""
+    path = Path(path)
+    tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    shown = shown_tasks(tasks)
+    answers = np.lib.format.open_memmap(tmp / "answers.npy", mode="w+", dtype=np.uint8, shape=(households, len(tasks), 4))
+    people = np.lib.format.open_memmap(tmp / "households.npy", mode="w+", dtype=HOUSEHOLD_DTYPE, shape=(households,))
+    t0 = time.perf_counter()
+    for c, start in enumerate(range(0, households, CHUNK)):
+        stop = min(start + CHUNK, households)
+        rng = np.random.default_rng([seed, c])
+        people[start:stop] = h = _draw_households(rng, start, stop, mix)
+        answers[start:stop] = generate(rng, shown, h["profile"], h["scenario"], untouched, not_applicable)
+    answers.flush()
+    people.flush()
+    del answers, people
+    meta = {
+        "format": FORMAT, "households": households, "seed": seed,
+        "version": version or catalog_version(), "task_ids": [t.id for t in tasks],
+        "mix": list(mix), "untouched": untouched, "not_applicable": not_applicable,
+        "scenarios": list(SCENARIOS), "seconds": round(time.perf_counter() - t0, 3),
+    }
+    (tmp / "meta.json").write_text(json.dumps(meta, indent=1), encoding="utf-8")
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp, path)
+    return Corpus(path)
+
+
+def ensure_corpus(households: int, seed: int = 1, root: Path = CORPUS_DIR, force: bool = False, **params) -> Corpus:
+    """The cached corpus for these settings and the catalogue, generated on first use (or always, with force)."""
+    tasks = params.pop("tasks", TASKS)
+    version = params.pop("version", None) or catalog_version()
+    params = {"mix": tuple(DEFAULT_MIX), "untouched": UNTOUCHED, "not_applicable": NOT_APPLICABLE_RATE, **params}
+    key = fingerprint(FORMAT, households, seed, version, sorted(params.items()))[:16]
+    path = Path(root) / f"{version[:8]}-{households}-{seed}-{key}"
+    if not force:
+        try:
+            return Corpus(path)
+        except (OSError, ValueError, KeyError):
+            pass
+    return write_corpus(path, households, seed, tasks, version, **params)
+
+
+# ----- single households (dev mode) -----
+def sample_household(scenario: str, setup: Dict, seed: Optional[int] = None, tasks: Sequence[Task] = TASKS,
+                     untouched: float = 0.0, not_applicable: float = 0.0) -> np.ndarray:
+    """One household's answers (int16, ResponseMatrix layout) for the given setup-screen answers."""
+    both_employed = setup.get("is_employed_me", True) and setup.get("is_employed_partner", True)
+    profile = profile_bits(setup.get("children", 0), both_employed, setup.get("has_pets", False), setup.get("has_vehicle", False))
+    answers = generate(
+        np.random.default_rng(seed), shown_tasks(tasks),
+        np.array([profile]), np.array([SCENARIOS.index(scenario)]), untouched, not_applicable,
+    )
+    return answers[0].astype(np.int16)
@@ -0,0 +1,53 @@
+# utils/watch.py
+# Polling file watcher behind the hot-reloaded data files (task catalogue, hotspot rules)
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional, Set
+
+log = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_watched: Set[Path] = set()
+
+
+def _poll(path: Path, on_change: Callable[[], object], interval: float, mtime: Optional[int]) -> None:
+    while True:
+        time.sleep(interval)
+        try:
+            current = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        if current != mtime:
+            mtime = current
+            try:
+                on_change()
+            except Exception:  # keep watching after a failed reload
+                log.exception("reload of %s failed", path)
+
+
+def watch_file(path: Path, on_change: Callable[[], object], interval: float = 2.0,
+               mtime: Optional[int] = None, name: Optional[str] = None) -> bool:
+    """Call on_change() from a daemon thread whenever path's mtime changes.
+
+    Starts at most one thread per path and process; returns False if the path
+    is already watched. mtime is the modification time the caller last loaded
+    (default: the file's current one), so an edit made before the watcher
+    started is still picked up.
+    """
+    path = Path(path).resolve()
+    with _lock:
+        if path in _watched:
+            return False
+        if mtime is None:
+            try:
+                mtime = path.stat().st_mtime_ns
+            except OSError:
+                pass
+        threading.Thread(
+            target=_poll, args=(path, on_change, interval, mtime), name=name or f"watch-{path.name}", daemon=True
+        ).start()
+        _watched.add(path)
+        return True